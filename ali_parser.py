@@ -3,6 +3,7 @@
 #
 # parser for ALi language
 # ------------------------------------------------------------
+import os
 import ply.yacc as yacc
 
 from lexer import tokens
@@ -536,7 +537,10 @@ def p_error(p):
     err_string = f"Syntax error in input at line {p.lineno} at character {p.lexpos} unexpected \'{p.value}\' "
     raise Exception(err_string)
 
-ali_parser = yacc.yacc(debug=True)
+# The parser reads the tables prebuilt in ali_tables without checking them against the grammar, and writes no debug output. With ALI_PARSER_DEBUG=1
+# the tables are checked, regenerated when the grammar changed, and parser.out describes them. Run build_tables.py after changing the grammar
+debug_parser = os.environ.get('ALI_PARSER_DEBUG') == '1'
+ali_parser = yacc.yacc(debug=debug_parser, optimize=not debug_parser, tabmodule='ali_tables.parsetab')
 
 def test():
     print('Enter file name to be tested (with .al extension)')
@@ -0,0 +1,5 @@
+# ------------------------------------------------------------
+# ali_tables
+#
+# lexer and parser tables of the ALi language, generated ahead of time by build_tables.py
+# ------------------------------------------------------------
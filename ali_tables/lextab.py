@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'ARRAY', 'BOOL', 'CHAR', 'C_CONST', 'DIFFERENT', 'DRAW_GAME_OBJECT', 'ELIF', 'ELSE', 'ENDL', 'EQUAL', 'FALSE', 'FLOAT', 'FOR', 'FUNC', 'F_CONST', 'GEN_CANVAS', 'GET_GAME_EV', 'GET_WINDOW_H', 'GET_WINDOW_W', 'GREATER_EQ', 'ID', 'IF', 'INT', 'I_CONST', 'LESS_EQ', 'MAIN', 'OR', 'PRINT', 'QUIT_GAME', 'RETURN', 'SET_CANVAS_BG', 'SET_CANVAS_TITLE', 'START', 'STRING_CONST', 'TRUE', 'UPDATE', 'VAR', 'VOID', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ';,:.{}()[]=+-*/><!'
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_F_CONST>-?\\d+\\.\\d+)|(?P<t_I_CONST>-?\\d+)|(?P<t_C_CONST>\\\'[0-9A-Za-z_ ]{1}\\\')|(?P<t_ID>[A-Za-z]([A-Za-z] | [0-9] | \\_)*)|(?P<t_newline>\\n+)|(?P<t_STRING_CONST>\\"([^\\\\]|(\\\\.))*?\\")|(?P<t_ignore_COMMENT>\\/\\/.*)|(?P<t_DIFFERENT>\\!\\=)|(?P<t_EQUAL>\\=\\=)|(?P<t_AND>\\&\\&)|(?P<t_OR>\\|\\|)|(?P<t_GREATER_EQ>\\>\\=)|(?P<t_LESS_EQ>\\<\\=)', [None, ('t_F_CONST', 'F_CONST'), ('t_I_CONST', 'I_CONST'), ('t_C_CONST', 'C_CONST'), ('t_ID', 'ID'), None, ('t_newline', 'newline'), (None, 'STRING_CONST'), None, None, (None, None), (None, 'DIFFERENT'), (None, 'EQUAL'), (None, 'AND'), (None, 'OR'), (None, 'GREATER_EQ'), (None, 'LESS_EQ')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
@@ -0,0 +1,208 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "AND ARRAY BOOL CHAR C_CONST DIFFERENT DRAW_GAME_OBJECT ELIF ELSE ENDL EQUAL FALSE FLOAT FOR FUNC F_CONST GEN_CANVAS GET_GAME_EV GET_WINDOW_H GET_WINDOW_W GREATER_EQ ID IF INT I_CONST LESS_EQ MAIN OR PRINT QUIT_GAME RETURN SET_CANVAS_BG SET_CANVAS_TITLE START STRING_CONST TRUE UPDATE VAR VOID WHILEprogram : global_vars_funs main\n               | mainglobal_vars_funs : g_vfg_vf : vars functions\n            | vars\n            | functionsmain : FUNC MAIN found_main_function '(' ')' '{' main_block '}'  end_main_func found_main_function : end_main_func : main_block : main_block_p start_function update_functionmain_block_p : vars stm\n                    | vars start_function : VOID FUNC START '(' ')' '{' sft '}' update_function : VOID FUNC UPDATE update_start '(' ')' interior_block update_end \n    update_start : \n    \n    update_end :\n    sft : gen_canvas gen_canvas_quad stm\n           | default_gen_canvas gen_canvas_quad stm \n    default_gen_canvas :\n    \n    gen_canvas_quad :\n    special_function_statement : set_canvas_title\n                                  | set_canvas_bg \n                                  | draw_game_object \n                                  | quit_game gen_canvas : GEN_CANVAS '(' expression ',' expression ',' STRING_CONST add_const_to_operand_stack_string ')' ';' set_canvas_title : SET_CANVAS_TITLE '(' STRING_CONST add_const_to_operand_stack_string ')' ';' set_canvas_bg : SET_CANVAS_BG '(' STRING_CONST add_const_to_operand_stack_string ')' ';' get_window_h : GET_WINDOW_H '(' ')' get_window_w : GET_WINDOW_W '(' ')' get_game_ev : GET_GAME_EV '(' ')' draw_game_object : DRAW_GAME_OBJECT '(' expression ',' expression ',' expression ',' expression ',' STRING_CONST add_const_to_operand_stack_string ')' ';' quit_game :  QUIT_GAME '(' ')' ';' function_block : vars stm\n                        | stm stm : statements stm_p stm_p : stm\n             | emptyvars : VAR ids ':' vars_types ';' store_ids vars_pvars_types : type\n                  | array_typevars_p : vars\n              | emptyids : ID store_id ids_p\n           | ID store_id_array array_indexing_init ids_pstore_id : store_id_array : store_ids : ids_p : ',' ids\n             | emptytype : INT set_current_type\n            | FLOAT set_current_type\n            | CHAR set_current_type\n            | BOOL set_current_type set_current_type : array_type : ARRAY '<' type '>' functions : return_function functions\n                 | void_function functions\n                 | return_function\n                 | void_functionreturn_function : type FUNC ID store_function '(' p ')' store_all_params '{' start_function_ic function_block end_function '}' p : params\n         | emptyvoid_function : VOID set_current_type FUNC ID store_function '(' p ')' store_all_params '{' start_function_ic function_block end_function '}' store_function : start_function_ic : end_function : \n    store_all_params :\n    statements : assignment ';'\n                  | call_to_fun ';'\n                  | array_init ';' \n                  | write\n                  | begin_if_stm conditionals\n                  | while\n                  | for\n                  | special_function_statement\n                  | RETURN expression ';' handle_return_statement \n    handle_return_statement : \n    conditionals : if_statement end_if\n                    | if_else_statement end_if\n                    | if_else_if_statement end_if \n    begin_if_stm :\n    if_statement : simple_if_statementsimple_if_statement : IF '(' expression ')' start_if  interior_blockif_else_statement : simple_if_statement simple_else_statementsimple_else_statement : start_else ELSE interior_blockif_else_if_statement : simple_if_statement simple_else_if_statement simple_else_statement\n                            | simple_if_statement simple_else_if_statementsimple_else_if_statement : start_else ELIF '(' expression ')' start_if interior_block more_else_if_statement more_else_if_statement : simple_else_if_statement\n                              | emptystart_if : start_else : end_if : interior_block : '{' '}'\n                      | '{' stm '}' params : ID ':' type ',' params\n              | ID ':' typeassignment : variable '=' add_op expression array_init : variable '=' '[' exp_1d ']'\n                  | variable '=' '[' exp_2d ']' exp_1d : expression ',' exp_1d\n              | expressionexp_2d : '[' exp_1d  ']' ',' exp_2d\n              | '[' exp_1d ']' write : PRINT '(' write_p ')' ';'\n             | PRINT '(' write_p ')' '<' '<' ENDL  ';' write_p : write_param ',' write_p \n               | write_param write_param : STRING_CONST add_const_to_operand_stack_string print_value\n                   | variable print_value\n    print_value :\n    call_to_fun : ID verify_function '(' gen_activation_quad ')' verify_params_number end_function_call\n                   | ID verify_function '(' gen_activation_quad call_p ')' verify_params_number end_function_call call_p : expression call_argument ',' move_to_next_param  call_p\n              | expression call_argument  verify_function :  gen_activation_quad :  call_argument :  move_to_next_param :  verify_params_number :  end_function_call : array_indexing : ID '[' expression ']'\n                      | ID '[' expression ']'  '[' expression ']' array_indexing_init : '[' I_CONST set_dim1_size ']'\n                           | '[' I_CONST set_dim1_size ']'  '[' I_CONST set_dim2_size ']'  set_dim1_size :  set_dim2_size : while : WHILE start_while '(' expression ')' evaluate_while_expression interior_block end_while\n    start_while :\n    \n    evaluate_while_expression :\n    \n    end_while :\n    for : FOR '(' assignment ';' start_for expression ';' eval_for_expression assignment save_for_increment ')' interior_block end_for\n    start_for :\n    \n    eval_for_expression :\n    \n    end_for :\n    \n    save_for_increment : \n    expression : t_exp \n                  | t_exp OR add_op expression gen_operationt_exp : g_exp \n             | g_exp AND add_op t_exp gen_operationg_exp : m_exp \n          | m_exp op g_exp gen_operation\n          | '!' add_op g_exp not_action\n    not_action : \n    op : '>' add_op\n          | '<' add_op\n          | GREATER_EQ add_op\n          | LESS_EQ add_op\n          | EQUAL add_op\n          | DIFFERENT add_opm_exp : term\n           | m_exp '+' add_op term gen_operation\n           | m_exp '-' add_op term gen_operation term : factor\n            | term '*' add_op factor gen_operation\n            | term '/' add_op factor gen_operation\n    add_op :\n    factor : '(' expression ')'\n              | constants constants : I_CONST add_const_to_operand_stack_int\n                 | F_CONST add_const_to_operand_stack_float\n                 | C_CONST add_const_to_operand_stack_char\n                 | TRUE add_const_to_operand_stack_bool\n                 | FALSE add_const_to_operand_stack_bool\n                 | variable\n                 | call_to_fun\n                 | get_window_h\n                 | get_window_w\n                 | get_game_evvariable : array_indexing \n                | ID\n    add_const_to_operand_stack_string : \n    add_const_to_operand_stack_int : add_const_to_operand_stack_float : add_const_to_operand_stack_char :  gen_operation : add_const_to_operand_stack_bool : empty :"
+    
+_lr_action_items = {'FUNC':([0,2,4,6,7,9,10,11,12,13,14,15,16,19,22,23,25,26,27,28,29,49,57,68,69,70,78,110,321,340,],[5,5,-3,-5,-6,-58,-59,24,-54,-54,-54,-54,-54,-4,-56,-57,35,-50,-51,-52,-53,-47,-178,-38,-41,-42,111,161,-60,-63,]),'VAR':([0,49,56,57,159,212,213,262,],[8,-47,8,8,-65,8,-65,8,]),'VOID':([0,6,9,10,49,57,66,67,68,69,70,77,79,80,84,86,87,88,95,96,97,98,112,113,114,115,116,117,118,119,120,121,122,163,164,165,166,167,170,216,221,257,265,285,299,318,319,321,328,330,337,340,342,350,351,358,364,365,366,373,376,379,],[12,12,12,12,-47,-178,78,-12,-38,-41,-42,110,-11,-178,-71,-73,-74,-75,-21,-22,-23,-24,-35,-36,-37,-68,-69,-70,-72,-93,-93,-93,-82,-78,-79,-80,-84,-87,-77,-86,-76,-32,-85,-105,-94,-26,-27,-60,-95,-83,-131,-63,-13,-106,-128,-178,-88,-89,-90,-135,-132,-31,]),'INT':([0,6,9,10,31,49,50,57,68,69,70,73,321,340,],[13,13,13,13,13,-47,13,-178,-38,-41,-42,13,-60,-63,]),'FLOAT':([0,6,9,10,31,49,50,57,68,69,70,73,321,340,],[14,14,14,14,14,-47,14,-178,-38,-41,-42,14,-60,-63,]),'CHAR':([0,6,9,10,31,49,50,57,68,69,70,73,321,340,],[15,15,15,15,15,-47,15,-178,-38,-41,-42,15,-60,-63,]),'BOOL':([0,6,9,10,31,49,50,57,68,69,70,73,321,340,],[16,16,16,16,16,-47,16,-178,-38,-41,-42,16,-60,-63,]),'$end':([1,3,17,76,108,],[0,-2,-1,-9,-7,]),'MAIN':([5,],[18,]),'ID':([8,24,35,42,49,54,57,64,67,68,69,70,80,84,86,87,88,89,95,96,97,98,115,116,117,118,119,120,121,122,128,131,147,149,150,152,155,158,159,163,164,165,166,167,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,194,195,196,203,212,213,216,221,222,223,225,226,227,228,229,230,231,232,234,235,241,245,248,252,253,256,257,260,262,265,266,267,280,284,285,290,298,299,318,319,320,325,326,328,330,334,337,338,343,344,345,349,350,351,352,353,358,362,364,365,366,373,376,379,381,],[21,34,47,21,-47,60,-178,60,91,-38,-41,-42,91,-71,-73,-74,-75,143,-21,-22,-23,-24,-68,-69,-70,-72,-93,-93,-93,-82,-157,143,-157,143,202,202,143,60,-65,-78,-79,-80,-84,-87,143,-77,-157,-157,143,-157,-157,-157,-157,-157,-157,-157,-157,143,-157,-157,143,143,-117,143,91,-65,-86,-76,143,143,143,143,-145,-146,-147,-148,-149,-150,143,143,143,143,202,-133,-157,143,-32,91,91,-85,91,143,143,143,-105,143,-19,-94,-26,-27,143,-20,-20,-95,-83,-119,-131,-134,91,91,143,143,-106,-128,202,143,-178,143,-88,-89,-90,-135,-132,-31,-25,]),';':([13,14,15,16,26,27,28,29,37,38,39,71,81,82,83,99,124,125,126,127,129,130,132,133,134,135,136,137,138,139,140,141,142,143,186,187,188,189,190,204,209,224,233,236,237,238,239,240,246,247,269,270,271,272,273,274,275,276,278,279,281,291,292,303,304,305,306,307,308,311,312,317,332,333,335,336,348,377,380,],[-54,-54,-54,-54,-50,-51,-52,-53,49,-39,-40,-55,115,116,117,-170,170,-137,-139,-141,-151,-154,-159,-173,-174,-175,-177,-177,-165,-166,-167,-168,-169,-171,-160,-161,-162,-163,-164,252,257,-176,-144,-158,-28,-29,-30,-98,-122,285,-176,-176,-142,-176,-176,-143,-176,-176,-99,-100,-120,318,319,-138,-140,-152,-153,-155,-156,-121,-120,338,-112,-121,-123,350,-113,379,381,]),'>':([13,14,15,16,26,27,28,29,58,99,127,129,130,132,133,134,135,136,137,138,139,140,141,142,143,186,187,188,189,190,236,237,238,239,246,272,273,275,276,281,305,306,307,308,311,312,332,333,335,348,],[-54,-54,-54,-54,-50,-51,-52,-53,71,-170,176,-151,-154,-159,-173,-174,-175,-177,-177,-165,-166,-167,-168,-169,-171,-160,-161,-162,-163,-164,-158,-28,-29,-30,-122,-176,-176,-176,-176,-120,-152,-153,-155,-156,-121,-120,-112,-121,-123,-113,]),',':([13,14,15,16,21,26,27,28,29,32,44,72,99,105,125,126,127,129,130,132,133,134,135,136,137,138,139,140,141,142,143,186,187,188,189,190,199,200,201,202,208,224,233,236,237,238,239,244,246,249,250,258,269,270,271,272,273,274,275,276,281,283,288,293,303,304,305,306,307,308,309,311,312,313,332,333,335,339,348,357,361,369,],[-54,-54,-54,-54,-45,-50,-51,-52,-53,42,42,-124,-170,158,-137,-139,-141,-151,-154,-159,-173,-174,-175,-177,-177,-165,-166,-167,-168,-169,-171,-160,-161,-162,-163,-164,248,-172,-111,-171,256,-176,-144,-158,-28,-29,-30,280,-122,-111,-110,-125,-176,-176,-142,-176,-176,-143,-176,-176,-120,-118,-109,320,-138,-140,-152,-153,-155,-156,331,-121,-120,334,-112,-121,-123,353,-113,362,368,372,]),')':([13,14,15,16,26,27,28,29,36,54,61,62,63,64,75,99,105,125,126,127,129,130,132,133,134,135,136,137,138,139,140,141,142,143,156,185,186,187,188,189,190,191,192,193,196,198,199,200,201,202,206,207,211,215,220,224,233,236,237,238,239,240,245,246,249,250,251,254,255,269,270,271,272,273,274,275,276,281,282,283,287,288,297,301,303,304,305,306,307,308,311,312,313,332,333,335,348,359,360,367,371,374,375,378,],[-54,-54,-54,-54,-50,-51,-52,-53,48,-178,74,-61,-62,-178,107,-170,-97,-137,-139,-141,-151,-154,-159,-173,-174,-175,-177,-177,-165,-166,-167,-168,-169,-171,209,236,-160,-161,-162,-163,-164,237,238,239,-117,247,-108,-172,-111,-171,-172,-172,-96,264,268,-176,-144,-158,-28,-29,-30,-98,281,-122,-111,-110,289,291,292,-176,-176,-142,-176,-176,-143,-176,-176,-120,312,-118,-107,-109,323,329,-138,-140,-152,-153,-155,-156,-121,-120,-115,-112,-121,-123,-113,-114,-136,370,-172,377,-172,380,]),'(':([18,30,34,46,47,55,89,91,92,93,94,100,101,102,103,123,128,131,143,144,145,146,147,148,149,151,155,162,169,171,172,173,174,175,176,177,178,179,180,181,182,183,184,194,195,196,203,214,219,222,223,225,226,227,228,229,230,231,232,234,235,241,245,252,253,256,263,267,280,284,290,320,327,334,345,349,353,362,],[-8,36,-64,54,-64,64,131,-116,150,-129,152,153,154,155,156,169,-157,131,-116,191,192,193,-157,196,131,203,131,215,131,-157,-157,131,-157,-157,-157,-157,-157,-157,-157,-157,131,-157,-157,131,131,-117,131,-15,267,131,131,131,131,-145,-146,-147,-148,-149,-150,131,131,131,131,-133,-157,131,297,131,131,131,131,131,345,-119,131,131,131,131,]),':':([20,21,32,41,43,44,51,52,60,72,258,],[31,-45,-178,-43,-49,-178,-48,-44,73,-124,-125,]),'[':([21,33,72,91,143,147,195,202,246,331,],[-46,45,104,149,149,195,241,149,284,241,]),'ARRAY':([31,],[40,]),'<':([40,99,127,129,130,132,133,134,135,136,137,138,139,140,141,142,143,186,187,188,189,190,236,237,238,239,246,247,272,273,275,276,281,286,305,306,307,308,311,312,332,333,335,348,],[50,-170,177,-151,-154,-159,-173,-174,-175,-177,-177,-165,-166,-167,-168,-169,-171,-160,-161,-162,-163,-164,-158,-28,-29,-30,-122,286,-176,-176,-176,-176,-120,315,-152,-153,-155,-156,-121,-120,-112,-121,-123,-113,]),'I_CONST':([45,89,104,128,131,147,149,155,169,171,172,173,174,175,176,177,178,179,180,181,182,183,184,194,195,196,203,222,223,225,226,227,228,229,230,231,232,234,235,241,245,252,253,256,267,280,284,290,320,334,345,349,353,362,],[53,133,157,-157,133,-157,133,133,133,-157,-157,133,-157,-157,-157,-157,-157,-157,-157,-157,133,-157,-157,133,133,-117,133,133,133,133,133,-145,-146,-147,-148,-149,-150,133,133,133,133,-133,-157,133,133,133,133,133,133,-119,133,133,133,133,]),'{':([48,74,106,107,160,218,264,268,289,302,316,323,329,346,370,],[56,-67,159,-67,213,266,298,-91,-130,266,266,266,-91,266,266,]),'RETURN':([49,57,67,68,69,70,80,84,86,87,88,95,96,97,98,115,116,117,118,119,120,121,122,159,163,164,165,166,167,170,212,213,216,221,257,260,262,265,266,285,298,299,318,319,325,326,328,330,337,343,344,350,351,358,364,365,366,373,376,379,381,],[-47,-178,89,-38,-41,-42,89,-71,-73,-74,-75,-21,-22,-23,-24,-68,-69,-70,-72,-93,-93,-93,-82,-65,-78,-79,-80,-84,-87,-77,89,-65,-86,-76,-32,89,89,-85,89,-105,-19,-94,-26,-27,-20,-20,-95,-83,-131,89,89,-106,-128,-178,-88,-89,-90,-135,-132,-31,-25,]),'PRINT':([49,57,67,68,69,70,80,84,86,87,88,95,96,97,98,115,116,117,118,119,120,121,122,159,163,164,165,166,167,170,212,213,216,221,257,260,262,265,266,285,298,299,318,319,325,326,328,330,337,343,344,350,351,358,364,365,366,373,376,379,381,],[-47,-178,92,-38,-41,-42,92,-71,-73,-74,-75,-21,-22,-23,-24,-68,-69,-70,-72,-93,-93,-93,-82,-65,-78,-79,-80,-84,-87,-77,92,-65,-86,-76,-32,92,92,-85,92,-105,-19,-94,-26,-27,-20,-20,-95,-83,-131,92,92,-106,-128,-178,-88,-89,-90,-135,-132,-31,-25,]),'WHILE':([49,57,67,68,69,70,80,84,86,87,88,95,96,97,98,115,116,117,118,119,120,121,122,159,163,164,165,166,167,170,212,213,216,221,257,260,262,265,266,285,298,299,318,319,325,326,328,330,337,343,344,350,351,358,364,365,366,373,376,379,381,],[-47,-178,93,-38,-41,-42,93,-71,-73,-74,-75,-21,-22,-23,-24,-68,-69,-70,-72,-93,-93,-93,-82,-65,-78,-79,-80,-84,-87,-77,93,-65,-86,-76,-32,93,93,-85,93,-105,-19,-94,-26,-27,-20,-20,-95,-83,-131,93,93,-106,-128,-178,-88,-89,-90,-135,-132,-31,-25,]),'FOR':([49,57,67,68,69,70,80,84,86,87,88,95,96,97,98,115,116,117,118,119,120,121,122,159,163,164,165,166,167,170,212,213,216,221,257,260,262,265,266,285,298,299,318,319,325,326,328,330,337,343,344,350,351,358,364,365,366,373,376,379,381,],[-47,-178,94,-38,-41,-42,94,-71,-73,-74,-75,-21,-22,-23,-24,-68,-69,-70,-72,-93,-93,-93,-82,-65,-78,-79,-80,-84,-87,-77,94,-65,-86,-76,-32,94,94,-85,94,-105,-19,-94,-26,-27,-20,-20,-95,-83,-131,94,94,-106,-128,-178,-88,-89,-90,-135,-132,-31,-25,]),'SET_CANVAS_TITLE':([49,57,67,68,69,70,80,84,86,87,88,95,96,97,98,115,116,117,118,119,120,121,122,159,163,164,165,166,167,170,212,213,216,221,257,260,262,265,266,285,298,299,318,319,325,326,328,330,337,343,344,350,351,358,364,365,366,373,376,379,381,],[-47,-178,100,-38,-41,-42,100,-71,-73,-74,-75,-21,-22,-23,-24,-68,-69,-70,-72,-93,-93,-93,-82,-65,-78,-79,-80,-84,-87,-77,100,-65,-86,-76,-32,100,100,-85,100,-105,-19,-94,-26,-27,-20,-20,-95,-83,-131,100,100,-106,-128,-178,-88,-89,-90,-135,-132,-31,-25,]),'SET_CANVAS_BG':([49,57,67,68,69,70,80,84,86,87,88,95,96,97,98,115,116,117,118,119,120,121,122,159,163,164,165,166,167,170,212,213,216,221,257,260,262,265,266,285,298,299,318,319,325,326,328,330,337,343,344,350,351,358,364,365,366,373,376,379,381,],[-47,-178,101,-38,-41,-42,101,-71,-73,-74,-75,-21,-22,-23,-24,-68,-69,-70,-72,-93,-93,-93,-82,-65,-78,-79,-80,-84,-87,-77,101,-65,-86,-76,-32,101,101,-85,101,-105,-19,-94,-26,-27,-20,-20,-95,-83,-131,101,101,-106,-128,-178,-88,-89,-90,-135,-132,-31,-25,]),'DRAW_GAME_OBJECT':([49,57,67,68,69,70,80,84,86,87,88,95,96,97,98,115,116,117,118,119,120,121,122,159,163,164,165,166,167,170,212,213,216,221,257,260,262,265,266,285,298,299,318,319,325,326,328,330,337,343,344,350,351,358,364,365,366,373,376,379,381,],[-47,-178,102,-38,-41,-42,102,-71,-73,-74,-75,-21,-22,-23,-24,-68,-69,-70,-72,-93,-93,-93,-82,-65,-78,-79,-80,-84,-87,-77,102,-65,-86,-76,-32,102,102,-85,102,-105,-19,-94,-26,-27,-20,-20,-95,-83,-131,102,102,-106,-128,-178,-88,-89,-90,-135,-132,-31,-25,]),'QUIT_GAME':([49,57,67,68,69,70,80,84,86,87,88,95,96,97,98,115,116,117,118,119,120,121,122,159,163,164,165,166,167,170,212,213,216,221,257,260,262,265,266,285,298,299,318,319,325,326,328,330,337,343,344,350,351,358,364,365,366,373,376,379,381,],[-47,-178,103,-38,-41,-42,103,-71,-73,-74,-75,-21,-22,-23,-24,-68,-69,-70,-72,-93,-93,-93,-82,-65,-78,-79,-80,-84,-87,-77,103,-65,-86,-76,-32,103,103,-85,103,-105,-19,-94,-26,-27,-20,-20,-95,-83,-131,103,103,-106,-128,-178,-88,-89,-90,-135,-132,-31,-25,]),'IF':([49,57,67,68,69,70,80,84,85,86,87,88,95,96,97,98,115,116,117,118,119,120,121,122,159,163,164,165,166,167,170,212,213,216,221,257,260,262,265,266,285,298,299,318,319,325,326,328,330,337,343,344,350,351,358,364,365,366,373,376,379,381,],[-47,-178,-81,-38,-41,-42,-81,-71,123,-73,-74,-75,-21,-22,-23,-24,-68,-69,-70,-72,-93,-93,-93,-82,-65,-78,-79,-80,-84,-87,-77,-81,-65,-86,-76,-32,-81,-81,-85,-81,-105,-19,-94,-26,-27,-20,-20,-95,-83,-131,-81,-81,-106,-128,-178,-88,-89,-90,-135,-132,-31,-25,]),']':([53,59,99,125,126,127,129,130,132,133,134,135,136,137,138,139,140,141,142,143,157,186,187,188,189,190,197,210,224,233,236,237,238,239,242,243,244,246,269,270,271,272,273,274,275,276,277,281,303,304,305,306,307,308,309,310,311,312,314,332,333,335,347,348,],[-126,72,-170,-137,-139,-141,-151,-154,-159,-173,-174,-175,-177,-177,-165,-166,-167,-168,-169,-171,-127,-160,-161,-162,-163,-164,246,258,-176,-144,-158,-28,-29,-30,278,279,-102,-122,-176,-176,-142,-176,-176,-143,-176,-176,309,-120,-138,-140,-152,-153,-155,-156,-104,-101,-121,-120,335,-112,-121,-123,-103,-113,]),'}':([65,80,84,86,87,88,95,96,97,98,109,112,113,114,115,116,117,118,119,120,121,122,163,164,165,166,167,170,216,221,257,259,261,265,266,285,294,295,296,299,300,318,319,322,324,328,330,337,341,350,351,354,355,356,358,364,365,366,373,376,379,],[76,-178,-71,-73,-74,-75,-21,-22,-23,-24,-10,-35,-36,-37,-68,-69,-70,-72,-93,-93,-93,-82,-78,-79,-80,-84,-87,-77,-86,-76,-32,-66,-34,-85,299,-105,321,-33,-66,-94,328,-26,-27,340,342,-95,-83,-131,-16,-106,-128,-14,-17,-18,-178,-88,-89,-90,-135,-132,-31,]),'!':([89,128,131,147,149,155,169,171,172,173,176,177,178,179,180,181,182,194,195,196,203,222,223,227,228,229,230,231,232,241,245,252,253,256,267,280,284,290,320,334,345,349,353,362,],[128,-157,128,-157,128,128,128,-157,-157,128,-157,-157,-157,-157,-157,-157,128,128,128,-117,128,128,128,-145,-146,-147,-148,-149,-150,128,128,-133,-157,128,128,128,128,128,128,-119,128,128,128,128,]),'F_CONST':([89,128,131,147,149,155,169,171,172,173,174,175,176,177,178,179,180,181,182,183,184,194,195,196,203,222,223,225,226,227,228,229,230,231,232,234,235,241,245,252,253,256,267,280,284,290,320,334,345,349,353,362,],[134,-157,134,-157,134,134,134,-157,-157,134,-157,-157,-157,-157,-157,-157,-157,-157,134,-157,-157,134,134,-117,134,134,134,134,134,-145,-146,-147,-148,-149,-150,134,134,134,134,-133,-157,134,134,134,134,134,134,-119,134,134,134,134,]),'C_CONST':([89,128,131,147,149,155,169,171,172,173,174,175,176,177,178,179,180,181,182,183,184,194,195,196,203,222,223,225,226,227,228,229,230,231,232,234,235,241,245,252,253,256,267,280,284,290,320,334,345,349,353,362,],[135,-157,135,-157,135,135,135,-157,-157,135,-157,-157,-157,-157,-157,-157,-157,-157,135,-157,-157,135,135,-117,135,135,135,135,135,-145,-146,-147,-148,-149,-150,135,135,135,135,-133,-157,135,135,135,135,135,135,-119,135,135,135,135,]),'TRUE':([89,128,131,147,149,155,169,171,172,173,174,175,176,177,178,179,180,181,182,183,184,194,195,196,203,222,223,225,226,227,228,229,230,231,232,234,235,241,245,252,253,256,267,280,284,290,320,334,345,349,353,362,],[136,-157,136,-157,136,136,136,-157,-157,136,-157,-157,-157,-157,-157,-157,-157,-157,136,-157,-157,136,136,-117,136,136,136,136,136,-145,-146,-147,-148,-149,-150,136,136,136,136,-133,-157,136,136,136,136,136,136,-119,136,136,136,136,]),'FALSE':([89,128,131,147,149,155,169,171,172,173,174,175,176,177,178,179,180,181,182,183,184,194,195,196,203,222,223,225,226,227,228,229,230,231,232,234,235,241,245,252,253,256,267,280,284,290,320,334,345,349,353,362,],[137,-157,137,-157,137,137,137,-157,-157,137,-157,-157,-157,-157,-157,-157,-157,-157,137,-157,-157,137,137,-117,137,137,137,137,137,-145,-146,-147,-148,-149,-150,137,137,137,137,-133,-157,137,137,137,137,137,137,-119,137,137,137,137,]),'GET_WINDOW_H':([89,128,131,147,149,155,169,171,172,173,174,175,176,177,178,179,180,181,182,183,184,194,195,196,203,222,223,225,226,227,228,229,230,231,232,234,235,241,245,252,253,256,267,280,284,290,320,334,345,349,353,362,],[144,-157,144,-157,144,144,144,-157,-157,144,-157,-157,-157,-157,-157,-157,-157,-157,144,-157,-157,144,144,-117,144,144,144,144,144,-145,-146,-147,-148,-149,-150,144,144,144,144,-133,-157,144,144,144,144,144,144,-119,144,144,144,144,]),'GET_WINDOW_W':([89,128,131,147,149,155,169,171,172,173,174,175,176,177,178,179,180,181,182,183,184,194,195,196,203,222,223,225,226,227,228,229,230,231,232,234,235,241,245,252,253,256,267,280,284,290,320,334,345,349,353,362,],[145,-157,145,-157,145,145,145,-157,-157,145,-157,-157,-157,-157,-157,-157,-157,-157,145,-157,-157,145,145,-117,145,145,145,145,145,-145,-146,-147,-148,-149,-150,145,145,145,145,-133,-157,145,145,145,145,145,145,-119,145,145,145,145,]),'GET_GAME_EV':([89,128,131,147,149,155,169,171,172,173,174,175,176,177,178,179,180,181,182,183,184,194,195,196,203,222,223,225,226,227,228,229,230,231,232,234,235,241,245,252,253,256,267,280,284,290,320,334,345,349,353,362,],[146,-157,146,-157,146,146,146,-157,-157,146,-157,-157,-157,-157,-157,-157,-157,-157,146,-157,-157,146,146,-117,146,146,146,146,146,-145,-146,-147,-148,-149,-150,146,146,146,146,-133,-157,146,146,146,146,146,146,-119,146,146,146,146,]),'=':([90,91,99,202,205,246,335,],[147,-171,-170,-171,253,-122,-123,]),'*':([99,129,130,132,133,134,135,136,137,138,139,140,141,142,143,186,187,188,189,190,236,237,238,239,246,272,273,275,276,281,307,308,311,312,332,333,335,348,],[-170,183,-154,-159,-173,-174,-175,-177,-177,-165,-166,-167,-168,-169,-171,-160,-161,-162,-163,-164,-158,-28,-29,-30,-122,183,183,-176,-176,-120,-155,-156,-121,-120,-112,-121,-123,-113,]),'/':([99,129,130,132,133,134,135,136,137,138,139,140,141,142,143,186,187,188,189,190,236,237,238,239,246,272,273,275,276,281,307,308,311,312,332,333,335,348,],[-170,184,-154,-159,-173,-174,-175,-177,-177,-165,-166,-167,-168,-169,-171,-160,-161,-162,-163,-164,-158,-28,-29,-30,-122,184,184,-176,-176,-120,-155,-156,-121,-120,-112,-121,-123,-113,]),'+':([99,127,129,130,132,133,134,135,136,137,138,139,140,141,142,143,186,187,188,189,190,236,237,238,239,246,272,273,275,276,281,305,306,307,308,311,312,332,333,335,348,],[-170,174,-151,-154,-159,-173,-174,-175,-177,-177,-165,-166,-167,-168,-169,-171,-160,-161,-162,-163,-164,-158,-28,-29,-30,-122,-176,-176,-176,-176,-120,-152,-153,-155,-156,-121,-120,-112,-121,-123,-113,]),'-':([99,127,129,130,132,133,134,135,136,137,138,139,140,141,142,143,186,187,188,189,190,236,237,238,239,246,272,273,275,276,281,305,306,307,308,311,312,332,333,335,348,],[-170,175,-151,-154,-159,-173,-174,-175,-177,-177,-165,-166,-167,-168,-169,-171,-160,-161,-162,-163,-164,-158,-28,-29,-30,-122,-176,-176,-176,-176,-120,-152,-153,-155,-156,-121,-120,-112,-121,-123,-113,]),'GREATER_EQ':([99,127,129,130,132,133,134,135,136,137,138,139,140,141,142,143,186,187,188,189,190,236,237,238,239,246,272,273,275,276,281,305,306,307,308,311,312,332,333,335,348,],[-170,178,-151,-154,-159,-173,-174,-175,-177,-177,-165,-166,-167,-168,-169,-171,-160,-161,-162,-163,-164,-158,-28,-29,-30,-122,-176,-176,-176,-176,-120,-152,-153,-155,-156,-121,-120,-112,-121,-123,-113,]),'LESS_EQ':([99,127,129,130,132,133,134,135,136,137,138,139,140,141,142,143,186,187,188,189,190,236,237,238,239,246,272,273,275,276,281,305,306,307,308,311,312,332,333,335,348,],[-170,179,-151,-154,-159,-173,-174,-175,-177,-177,-165,-166,-167,-168,-169,-171,-160,-161,-162,-163,-164,-158,-28,-29,-30,-122,-176,-176,-176,-176,-120,-152,-153,-155,-156,-121,-120,-112,-121,-123,-113,]),'EQUAL':([99,127,129,130,132,133,134,135,136,137,138,139,140,141,142,143,186,187,188,189,190,236,237,238,239,246,272,273,275,276,281,305,306,307,308,311,312,332,333,335,348,],[-170,180,-151,-154,-159,-173,-174,-175,-177,-177,-165,-166,-167,-168,-169,-171,-160,-161,-162,-163,-164,-158,-28,-29,-30,-122,-176,-176,-176,-176,-120,-152,-153,-155,-156,-121,-120,-112,-121,-123,-113,]),'DIFFERENT':([99,127,129,130,132,133,134,135,136,137,138,139,140,141,142,143,186,187,188,189,190,236,237,238,239,246,272,273,275,276,281,305,306,307,308,311,312,332,333,335,348,],[-170,181,-151,-154,-159,-173,-174,-175,-177,-177,-165,-166,-167,-168,-169,-171,-160,-161,-162,-163,-164,-158,-28,-29,-30,-122,-176,-176,-176,-176,-120,-152,-153,-155,-156,-121,-120,-112,-121,-123,-113,]),'AND':([99,126,127,129,130,132,133,134,135,136,137,138,139,140,141,142,143,186,187,188,189,190,224,233,236,237,238,239,246,271,272,273,274,275,276,281,305,306,307,308,311,312,332,333,335,348,],[-170,172,-141,-151,-154,-159,-173,-174,-175,-177,-177,-165,-166,-167,-168,-169,-171,-160,-161,-162,-163,-164,-176,-144,-158,-28,-29,-30,-122,-142,-176,-176,-143,-176,-176,-120,-152,-153,-155,-156,-121,-120,-112,-121,-123,-113,]),'OR':([99,125,126,127,129,130,132,133,134,135,136,137,138,139,140,141,142,143,186,187,188,189,190,224,233,236,237,238,239,246,270,271,272,273,274,275,276,281,304,305,306,307,308,311,312,332,333,335,348,],[-170,171,-139,-141,-151,-154,-159,-173,-174,-175,-177,-177,-165,-166,-167,-168,-169,-171,-160,-161,-162,-163,-164,-176,-144,-158,-28,-29,-30,-122,-176,-142,-176,-176,-143,-176,-176,-120,-140,-152,-153,-155,-156,-121,-120,-112,-121,-123,-113,]),'START':([111,],[162,]),'ELSE':([122,167,168,217,299,328,330,358,364,365,366,],[-92,-92,218,218,-94,-95,-83,-178,-88,-89,-90,]),'ELIF':([122,168,299,328,330,358,363,],[-92,219,-94,-95,-83,-92,219,]),'STRING_CONST':([150,153,154,248,368,372,],[200,206,207,200,371,375,]),'UPDATE':([161,],[214,]),'GEN_CANVAS':([298,],[327,]),'ENDL':([315,],[336,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'global_vars_funs':([0,],[2,]),'main':([0,2,],[3,17,]),'g_vf':([0,],[4,]),'vars':([0,56,57,212,262,],[6,67,69,260,260,]),'functions':([0,6,9,10,],[7,19,22,23,]),'return_function':([0,6,9,10,],[9,9,9,9,]),'void_function':([0,6,9,10,],[10,10,10,10,]),'type':([0,6,9,10,31,50,73,],[11,11,11,11,38,58,105,]),'ids':([8,42,],[20,51,]),'set_current_type':([12,13,14,15,16,],[25,26,27,28,29,]),'found_main_function':([18,],[30,]),'store_id':([21,],[32,]),'store_id_array':([21,],[33,]),'vars_types':([31,],[37,]),'array_type':([31,],[39,]),'ids_p':([32,44,],[41,52,]),'empty':([32,44,54,57,64,80,358,],[43,43,63,70,63,114,366,]),'array_indexing_init':([33,],[44,]),'store_function':([34,47,],[46,55,]),'store_ids':([49,],[57,]),'set_dim1_size':([53,],[59,]),'p':([54,64,],[61,75,]),'params':([54,64,158,],[62,62,211,]),'main_block':([56,],[65,]),'main_block_p':([56,],[66,]),'vars_p':([57,],[68,]),'start_function':([66,],[77,]),'stm':([67,80,212,260,262,266,343,344,],[79,113,261,295,261,300,355,356,]),'statements':([67,80,212,260,262,266,343,344,],[80,80,80,80,80,80,80,80,]),'assignment':([67,80,152,212,260,262,266,343,344,352,],[81,81,204,81,81,81,81,81,81,360,]),'call_to_fun':([67,80,89,131,149,155,169,173,182,194,195,203,212,222,223,225,226,234,235,241,245,256,260,262,266,267,280,284,290,320,343,344,345,349,353,362,],[82,82,139,139,139,139,139,139,139,139,139,139,82,139,139,139,139,139,139,139,139,139,82,82,82,139,139,139,139,139,82,82,139,139,139,139,]),'array_init':([67,80,212,260,262,266,343,344,],[83,83,83,83,83,83,83,83,]),'write':([67,80,212,260,262,266,343,344,],[84,84,84,84,84,84,84,84,]),'begin_if_stm':([67,80,212,260,262,266,343,344,],[85,85,85,85,85,85,85,85,]),'while':([67,80,212,260,262,266,343,344,],[86,86,86,86,86,86,86,86,]),'for':([67,80,212,260,262,266,343,344,],[87,87,87,87,87,87,87,87,]),'special_function_statement':([67,80,212,260,262,266,343,344,],[88,88,88,88,88,88,88,88,]),'variable':([67,80,89,131,149,150,152,155,169,173,182,194,195,203,212,222,223,225,226,234,235,241,245,248,256,260,262,266,267,280,284,290,320,343,344,345,349,352,353,362,],[90,90,138,138,138,201,205,138,138,138,138,138,138,138,90,138,138,138,138,138,138,138,138,201,138,90,90,90,138,138,138,138,138,90,90,138,138,205,138,138,]),'set_canvas_title':([67,80,212,260,262,266,343,344,],[95,95,95,95,95,95,95,95,]),'set_canvas_bg':([67,80,212,260,262,266,343,344,],[96,96,96,96,96,96,96,96,]),'draw_game_object':([67,80,212,260,262,266,343,344,],[97,97,97,97,97,97,97,97,]),'quit_game':([67,80,212,260,262,266,343,344,],[98,98,98,98,98,98,98,98,]),'array_indexing':([67,80,89,131,149,150,152,155,169,173,182,194,195,203,212,222,223,225,226,234,235,241,245,248,256,260,262,266,267,280,284,290,320,343,344,345,349,352,353,362,],[99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,]),'store_all_params':([74,107,],[106,160,]),'end_main_func':([76,],[108,]),'update_function':([77,],[109,]),'stm_p':([80,],[112,]),'conditionals':([85,],[118,]),'if_statement':([85,],[119,]),'if_else_statement':([85,],[120,]),'if_else_if_statement':([85,],[121,]),'simple_if_statement':([85,],[122,]),'expression':([89,131,149,155,169,194,195,203,222,241,245,256,267,280,284,290,320,345,349,353,362,],[124,185,197,208,220,240,244,251,269,244,283,293,301,244,314,317,339,357,283,361,369,]),'t_exp':([89,131,149,155,169,194,195,203,222,223,241,245,256,267,280,284,290,320,345,349,353,362,],[125,125,125,125,125,125,125,125,125,270,125,125,125,125,125,125,125,125,125,125,125,125,]),'g_exp':([89,131,149,155,169,173,182,194,195,203,222,223,241,245,256,267,280,284,290,320,345,349,353,362,],[126,126,126,126,126,224,233,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,]),'m_exp':([89,131,149,155,169,173,182,194,195,203,222,223,241,245,256,267,280,284,290,320,345,349,353,362,],[127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,]),'term':([89,131,149,155,169,173,182,194,195,203,222,223,225,226,241,245,256,267,280,284,290,320,345,349,353,362,],[129,129,129,129,129,129,129,129,129,129,129,129,272,273,129,129,129,129,129,129,129,129,129,129,129,129,]),'factor':([89,131,149,155,169,173,182,194,195,203,222,223,225,226,234,235,241,245,256,267,280,284,290,320,345,349,353,362,],[130,130,130,130,130,130,130,130,130,130,130,130,130,130,275,276,130,130,130,130,130,130,130,130,130,130,130,130,]),'constants':([89,131,149,155,169,173,182,194,195,203,222,223,225,226,234,235,241,245,256,267,280,284,290,320,345,349,353,362,],[132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,]),'get_window_h':([89,131,149,155,169,173,182,194,195,203,222,223,225,226,234,235,241,245,256,267,280,284,290,320,345,349,353,362,],[140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,]),'get_window_w':([89,131,149,155,169,173,182,194,195,203,222,223,225,226,234,235,241,245,256,267,280,284,290,320,345,349,353,362,],[141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,]),'get_game_ev':([89,131,149,155,169,173,182,194,195,203,222,223,225,226,234,235,241,245,256,267,280,284,290,320,345,349,353,362,],[142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,]),'verify_function':([91,143,],[148,148,]),'start_while':([93,],[151,]),'end_if':([119,120,121,],[163,164,165,]),'simple_else_statement':([122,167,],[166,216,]),'simple_else_if_statement':([122,358,],[167,365,]),'start_else':([122,167,358,],[168,217,363,]),'op':([127,],[173,]),'add_op':([128,147,171,172,174,175,176,177,178,179,180,181,183,184,253,],[182,194,222,223,225,226,227,228,229,230,231,232,234,235,194,]),'add_const_to_operand_stack_int':([133,],[186,]),'add_const_to_operand_stack_float':([134,],[187,]),'add_const_to_operand_stack_char':([135,],[188,]),'add_const_to_operand_stack_bool':([136,137,],[189,190,]),'write_p':([150,248,],[198,287,]),'write_param':([150,248,],[199,199,]),'set_dim2_size':([157,],[210,]),'start_function_ic':([159,213,],[212,262,]),'handle_return_statement':([170,],[221,]),'exp_1d':([195,241,280,],[242,277,310,]),'exp_2d':([195,331,],[243,347,]),'gen_activation_quad':([196,],[245,]),'add_const_to_operand_stack_string':([200,206,207,371,375,],[249,254,255,374,378,]),'print_value':([201,249,],[250,288,]),'function_block':([212,262,],[259,296,]),'update_start':([214,],[263,]),'interior_block':([218,302,316,323,346,370,],[265,330,337,341,358,373,]),'gen_operation':([224,269,270,272,273,275,276,],[271,303,304,305,306,307,308,]),'not_action':([233,],[274,]),'call_p':([245,349,],[282,359,]),'start_for':([252,],[290,]),'end_function':([259,296,],[294,322,]),'start_if':([268,329,],[302,346,]),'verify_params_number':([281,312,],[311,333,]),'call_argument':([283,],[313,]),'evaluate_while_expression':([289,],[316,]),'sft':([298,],[324,]),'gen_canvas':([298,],[325,]),'default_gen_canvas':([298,],[326,]),'end_function_call':([311,333,],[332,348,]),'gen_canvas_quad':([325,326,],[343,344,]),'move_to_next_param':([334,],[349,]),'end_while':([337,],[351,]),'eval_for_expression':([338,],[352,]),'update_end':([341,],[354,]),'more_else_if_statement':([358,],[364,]),'save_for_increment':([360,],[367,]),'end_for':([373,],[376,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('program -> global_vars_funs main','program',2,'p_program','ali_parser.py',15),
+  ('program -> main','program',1,'p_program','ali_parser.py',16),
+  ('global_vars_funs -> g_vf','global_vars_funs',1,'p_global_vars_funs','ali_parser.py',19),
+  ('g_vf -> vars functions','g_vf',2,'p_g_vf','ali_parser.py',22),
+  ('g_vf -> vars','g_vf',1,'p_g_vf','ali_parser.py',23),
+  ('g_vf -> functions','g_vf',1,'p_g_vf','ali_parser.py',24),
+  ('main -> FUNC MAIN found_main_function ( ) { main_block } end_main_func','main',9,'p_main','ali_parser.py',27),
+  ('found_main_function -> <empty>','found_main_function',0,'p_found_main_function','ali_parser.py',30),
+  ('end_main_func -> <empty>','end_main_func',0,'p_end_main_func','ali_parser.py',34),
+  ('main_block -> main_block_p start_function update_function','main_block',3,'p_main_block','ali_parser.py',40),
+  ('main_block_p -> vars stm','main_block_p',2,'p_main_block_p','ali_parser.py',44),
+  ('main_block_p -> vars','main_block_p',1,'p_main_block_p','ali_parser.py',45),
+  ('start_function -> VOID FUNC START ( ) { sft }','start_function',8,'p_start_function','ali_parser.py',48),
+  ('update_function -> VOID FUNC UPDATE update_start ( ) interior_block update_end','update_function',8,'p_update_function','ali_parser.py',52),
+  ('update_start -> <empty>','update_start',0,'p_update_start','ali_parser.py',56),
+  ('update_end -> <empty>','update_end',0,'p_update_end','ali_parser.py',62),
+  ('sft -> gen_canvas gen_canvas_quad stm','sft',3,'p_sft','ali_parser.py',67),
+  ('sft -> default_gen_canvas gen_canvas_quad stm','sft',3,'p_sft','ali_parser.py',68),
+  ('default_gen_canvas -> <empty>','default_gen_canvas',0,'p_default_gen_canvas','ali_parser.py',72),
+  ('gen_canvas_quad -> <empty>','gen_canvas_quad',0,'p_gen_canvas_quad','ali_parser.py',78),
+  ('special_function_statement -> set_canvas_title','special_function_statement',1,'p_special_function_statement','ali_parser.py',89),
+  ('special_function_statement -> set_canvas_bg','special_function_statement',1,'p_special_function_statement','ali_parser.py',90),
+  ('special_function_statement -> draw_game_object','special_function_statement',1,'p_special_function_statement','ali_parser.py',91),
+  ('special_function_statement -> quit_game','special_function_statement',1,'p_special_function_statement','ali_parser.py',92),
+  ('gen_canvas -> GEN_CANVAS ( expression , expression , STRING_CONST add_const_to_operand_stack_string ) ;','gen_canvas',10,'p_gen_canvas','ali_parser.py',96),
+  ('set_canvas_title -> SET_CANVAS_TITLE ( STRING_CONST add_const_to_operand_stack_string ) ;','set_canvas_title',6,'p_set_canvas_title','ali_parser.py',100),
+  ('set_canvas_bg -> SET_CANVAS_BG ( STRING_CONST add_const_to_operand_stack_string ) ;','set_canvas_bg',6,'p_set_canvas_bg','ali_parser.py',105),
+  ('get_window_h -> GET_WINDOW_H ( )','get_window_h',3,'p_get_window_h','ali_parser.py',110),
+  ('get_window_w -> GET_WINDOW_W ( )','get_window_w',3,'p_get_window_w','ali_parser.py',114),
+  ('get_game_ev -> GET_GAME_EV ( )','get_game_ev',3,'p_get_game_ev','ali_parser.py',118),
+  ('draw_game_object -> DRAW_GAME_OBJECT ( expression , expression , expression , expression , STRING_CONST add_const_to_operand_stack_string ) ;','draw_game_object',14,'p_draw_game_object','ali_parser.py',122),
+  ('quit_game -> QUIT_GAME ( ) ;','quit_game',4,'p_quit_game','ali_parser.py',126),
+  ('function_block -> vars stm','function_block',2,'p_function_block','ali_parser.py',133),
+  ('function_block -> stm','function_block',1,'p_function_block','ali_parser.py',134),
+  ('stm -> statements stm_p','stm',2,'p_stm','ali_parser.py',137),
+  ('stm_p -> stm','stm_p',1,'p_stm_p','ali_parser.py',140),
+  ('stm_p -> empty','stm_p',1,'p_stm_p','ali_parser.py',141),
+  ('vars -> VAR ids : vars_types ; store_ids vars_p','vars',7,'p_vars','ali_parser.py',144),
+  ('vars_types -> type','vars_types',1,'p_vars_types','ali_parser.py',147),
+  ('vars_types -> array_type','vars_types',1,'p_vars_types','ali_parser.py',148),
+  ('vars_p -> vars','vars_p',1,'p_vars_p','ali_parser.py',151),
+  ('vars_p -> empty','vars_p',1,'p_vars_p','ali_parser.py',152),
+  ('ids -> ID store_id ids_p','ids',3,'p_ids','ali_parser.py',155),
+  ('ids -> ID store_id_array array_indexing_init ids_p','ids',4,'p_ids','ali_parser.py',156),
+  ('store_id -> <empty>','store_id',0,'p_store_id','ali_parser.py',159),
+  ('store_id_array -> <empty>','store_id_array',0,'p_store_id_array','ali_parser.py',163),
+  ('store_ids -> <empty>','store_ids',0,'p_store_ids','ali_parser.py',167),
+  ('ids_p -> , ids','ids_p',2,'p_ids_p','ali_parser.py',171),
+  ('ids_p -> empty','ids_p',1,'p_ids_p','ali_parser.py',172),
+  ('type -> INT set_current_type','type',2,'p_type','ali_parser.py',175),
+  ('type -> FLOAT set_current_type','type',2,'p_type','ali_parser.py',176),
+  ('type -> CHAR set_current_type','type',2,'p_type','ali_parser.py',177),
+  ('type -> BOOL set_current_type','type',2,'p_type','ali_parser.py',178),
+  ('set_current_type -> <empty>','set_current_type',0,'p_set_current_type','ali_parser.py',182),
+  ('array_type -> ARRAY < type >','array_type',4,'p_array_type','ali_parser.py',186),
+  ('functions -> return_function functions','functions',2,'p_functions','ali_parser.py',189),
+  ('functions -> void_function functions','functions',2,'p_functions','ali_parser.py',190),
+  ('functions -> return_function','functions',1,'p_functions','ali_parser.py',191),
+  ('functions -> void_function','functions',1,'p_functions','ali_parser.py',192),
+  ('return_function -> type FUNC ID store_function ( p ) store_all_params { start_function_ic function_block end_function }','return_function',13,'p_return_function','ali_parser.py',195),
+  ('p -> params','p',1,'p_p','ali_parser.py',198),
+  ('p -> empty','p',1,'p_p','ali_parser.py',199),
+  ('void_function -> VOID set_current_type FUNC ID store_function ( p ) store_all_params { start_function_ic function_block end_function }','void_function',14,'p_void_function','ali_parser.py',202),
+  ('store_function -> <empty>','store_function',0,'p_store_function','ali_parser.py',205),
+  ('start_function_ic -> <empty>','start_function_ic',0,'p_start_function_ic','ali_parser.py',209),
+  ('end_function -> <empty>','end_function',0,'p_end_function','ali_parser.py',213),
+  ('store_all_params -> <empty>','store_all_params',0,'p_store_all_params','ali_parser.py',218),
+  ('statements -> assignment ;','statements',2,'p_statements','ali_parser.py',223),
+  ('statements -> call_to_fun ;','statements',2,'p_statements','ali_parser.py',224),
+  ('statements -> array_init ;','statements',2,'p_statements','ali_parser.py',225),
+  ('statements -> write','statements',1,'p_statements','ali_parser.py',226),
+  ('statements -> begin_if_stm conditionals','statements',2,'p_statements','ali_parser.py',227),
+  ('statements -> while','statements',1,'p_statements','ali_parser.py',228),
+  ('statements -> for','statements',1,'p_statements','ali_parser.py',229),
+  ('statements -> special_function_statement','statements',1,'p_statements','ali_parser.py',230),
+  ('statements -> RETURN expression ; handle_return_statement','statements',4,'p_statements','ali_parser.py',231),
+  ('handle_return_statement -> <empty>','handle_return_statement',0,'p_handle_return_statement','ali_parser.py',235),
+  ('conditionals -> if_statement end_if','conditionals',2,'p_conditionals','ali_parser.py',240),
+  ('conditionals -> if_else_statement end_if','conditionals',2,'p_conditionals','ali_parser.py',241),
+  ('conditionals -> if_else_if_statement end_if','conditionals',2,'p_conditionals','ali_parser.py',242),
+  ('begin_if_stm -> <empty>','begin_if_stm',0,'p_begin_if_stm','ali_parser.py',246),
+  ('if_statement -> simple_if_statement','if_statement',1,'p_if_statement','ali_parser.py',251),
+  ('simple_if_statement -> IF ( expression ) start_if interior_block','simple_if_statement',6,'p_simple_if_statement','ali_parser.py',254),
+  ('if_else_statement -> simple_if_statement simple_else_statement','if_else_statement',2,'p_if_else_statement','ali_parser.py',257),
+  ('simple_else_statement -> start_else ELSE interior_block','simple_else_statement',3,'p_simple_else_statement','ali_parser.py',260),
+  ('if_else_if_statement -> simple_if_statement simple_else_if_statement simple_else_statement','if_else_if_statement',3,'p_if_else_if_statement','ali_parser.py',263),
+  ('if_else_if_statement -> simple_if_statement simple_else_if_statement','if_else_if_statement',2,'p_if_else_if_statement','ali_parser.py',264),
+  ('simple_else_if_statement -> start_else ELIF ( expression ) start_if interior_block more_else_if_statement','simple_else_if_statement',8,'p_simple_else_if_statement','ali_parser.py',267),
+  ('more_else_if_statement -> simple_else_if_statement','more_else_if_statement',1,'p_more_else_if_statement','ali_parser.py',270),
+  ('more_else_if_statement -> empty','more_else_if_statement',1,'p_more_else_if_statement','ali_parser.py',271),
+  ('start_if -> <empty>','start_if',0,'p_start_if','ali_parser.py',274),
+  ('start_else -> <empty>','start_else',0,'p_start_else','ali_parser.py',278),
+  ('end_if -> <empty>','end_if',0,'p_end_if','ali_parser.py',282),
+  ('interior_block -> { }','interior_block',2,'p_interior_block','ali_parser.py',286),
+  ('interior_block -> { stm }','interior_block',3,'p_interior_block','ali_parser.py',287),
+  ('params -> ID : type , params','params',5,'p_params','ali_parser.py',290),
+  ('params -> ID : type','params',3,'p_params','ali_parser.py',291),
+  ('assignment -> variable = add_op expression','assignment',4,'p_assignment','ali_parser.py',295),
+  ('array_init -> variable = [ exp_1d ]','array_init',5,'p_array_init','ali_parser.py',299),
+  ('array_init -> variable = [ exp_2d ]','array_init',5,'p_array_init','ali_parser.py',300),
+  ('exp_1d -> expression , exp_1d','exp_1d',3,'p_exp_1d','ali_parser.py',304),
+  ('exp_1d -> expression','exp_1d',1,'p_exp_1d','ali_parser.py',305),
+  ('exp_2d -> [ exp_1d ] , exp_2d','exp_2d',5,'p_exp_2d','ali_parser.py',308),
+  ('exp_2d -> [ exp_1d ]','exp_2d',3,'p_exp_2d','ali_parser.py',309),
+  ('write -> PRINT ( write_p ) ;','write',5,'p_write','ali_parser.py',312),
+  ('write -> PRINT ( write_p ) < < ENDL ;','write',8,'p_write','ali_parser.py',313),
+  ('write_p -> write_param , write_p','write_p',3,'p_write_p','ali_parser.py',318),
+  ('write_p -> write_param','write_p',1,'p_write_p','ali_parser.py',319),
+  ('write_param -> STRING_CONST add_const_to_operand_stack_string print_value','write_param',3,'p_write_param','ali_parser.py',322),
+  ('write_param -> variable print_value','write_param',2,'p_write_param','ali_parser.py',323),
+  ('print_value -> <empty>','print_value',0,'p_print_value','ali_parser.py',327),
+  ('call_to_fun -> ID verify_function ( gen_activation_quad ) verify_params_number end_function_call','call_to_fun',7,'p_call_to_fun','ali_parser.py',333),
+  ('call_to_fun -> ID verify_function ( gen_activation_quad call_p ) verify_params_number end_function_call','call_to_fun',8,'p_call_to_fun','ali_parser.py',334),
+  ('call_p -> expression call_argument , move_to_next_param call_p','call_p',5,'p_call_p','ali_parser.py',337),
+  ('call_p -> expression call_argument','call_p',2,'p_call_p','ali_parser.py',338),
+  ('verify_function -> <empty>','verify_function',0,'p_verify_function','ali_parser.py',341),
+  ('gen_activation_quad -> <empty>','gen_activation_quad',0,'p_gen_activation_quad','ali_parser.py',345),
+  ('call_argument -> <empty>','call_argument',0,'p_call_argument','ali_parser.py',349),
+  ('move_to_next_param -> <empty>','move_to_next_param',0,'p_move_to_next_param','ali_parser.py',353),
+  ('verify_params_number -> <empty>','verify_params_number',0,'p_verify_params_number','ali_parser.py',357),
+  ('end_function_call -> <empty>','end_function_call',0,'p_end_function_call','ali_parser.py',361),
+  ('array_indexing -> ID [ expression ]','array_indexing',4,'p_array_indexing','ali_parser.py',365),
+  ('array_indexing -> ID [ expression ] [ expression ]','array_indexing',7,'p_array_indexing','ali_parser.py',366),
+  ('array_indexing_init -> [ I_CONST set_dim1_size ]','array_indexing_init',4,'p_array_indexing_init','ali_parser.py',373),
+  ('array_indexing_init -> [ I_CONST set_dim1_size ] [ I_CONST set_dim2_size ]','array_indexing_init',8,'p_array_indexing_init','ali_parser.py',374),
+  ('set_dim1_size -> <empty>','set_dim1_size',0,'p_set_dim1_size','ali_parser.py',377),
+  ('set_dim2_size -> <empty>','set_dim2_size',0,'p_set_dim2_size','ali_parser.py',381),
+  ('while -> WHILE start_while ( expression ) evaluate_while_expression interior_block end_while','while',8,'p_while','ali_parser.py',385),
+  ('start_while -> <empty>','start_while',0,'p_start_while','ali_parser.py',389),
+  ('evaluate_while_expression -> <empty>','evaluate_while_expression',0,'p_evaluate_while_expression','ali_parser.py',395),
+  ('end_while -> <empty>','end_while',0,'p_end_while','ali_parser.py',401),
+  ('for -> FOR ( assignment ; start_for expression ; eval_for_expression assignment save_for_increment ) interior_block end_for','for',13,'p_for','ali_parser.py',406),
+  ('start_for -> <empty>','start_for',0,'p_start_for','ali_parser.py',410),
+  ('eval_for_expression -> <empty>','eval_for_expression',0,'p_eval_for_expression','ali_parser.py',416),
+  ('end_for -> <empty>','end_for',0,'p_end_for','ali_parser.py',422),
+  ('save_for_increment -> <empty>','save_for_increment',0,'p_save_for_increment','ali_parser.py',428),
+  ('expression -> t_exp','expression',1,'p_expression','ali_parser.py',436),
+  ('expression -> t_exp OR add_op expression gen_operation','expression',5,'p_expression','ali_parser.py',437),
+  ('t_exp -> g_exp','t_exp',1,'p_t_exp','ali_parser.py',440),
+  ('t_exp -> g_exp AND add_op t_exp gen_operation','t_exp',5,'p_t_exp','ali_parser.py',441),
+  ('g_exp -> m_exp','g_exp',1,'p_g_exp','ali_parser.py',444),
+  ('g_exp -> m_exp op g_exp gen_operation','g_exp',4,'p_g_exp','ali_parser.py',445),
+  ('g_exp -> ! add_op g_exp not_action','g_exp',4,'p_g_exp','ali_parser.py',446),
+  ('not_action -> <empty>','not_action',0,'p_not_action','ali_parser.py',450),
+  ('op -> > add_op','op',2,'p_op','ali_parser.py',455),
+  ('op -> < add_op','op',2,'p_op','ali_parser.py',456),
+  ('op -> GREATER_EQ add_op','op',2,'p_op','ali_parser.py',457),
+  ('op -> LESS_EQ add_op','op',2,'p_op','ali_parser.py',458),
+  ('op -> EQUAL add_op','op',2,'p_op','ali_parser.py',459),
+  ('op -> DIFFERENT add_op','op',2,'p_op','ali_parser.py',460),
+  ('m_exp -> term','m_exp',1,'p_m_exp','ali_parser.py',463),
+  ('m_exp -> m_exp + add_op term gen_operation','m_exp',5,'p_m_exp','ali_parser.py',464),
+  ('m_exp -> m_exp - add_op term gen_operation','m_exp',5,'p_m_exp','ali_parser.py',465),
+  ('term -> factor','term',1,'p_term','ali_parser.py',468),
+  ('term -> term * add_op factor gen_operation','term',5,'p_term','ali_parser.py',469),
+  ('term -> term / add_op factor gen_operation','term',5,'p_term','ali_parser.py',470),
+  ('add_op -> <empty>','add_op',0,'p_add_op','ali_parser.py',474),
+  ('factor -> ( expression )','factor',3,'p_factor','ali_parser.py',479),
+  ('factor -> constants','factor',1,'p_factor','ali_parser.py',480),
+  ('constants -> I_CONST add_const_to_operand_stack_int','constants',2,'p_constants','ali_parser.py',483),
+  ('constants -> F_CONST add_const_to_operand_stack_float','constants',2,'p_constants','ali_parser.py',484),
+  ('constants -> C_CONST add_const_to_operand_stack_char','constants',2,'p_constants','ali_parser.py',485),
+  ('constants -> TRUE add_const_to_operand_stack_bool','constants',2,'p_constants','ali_parser.py',486),
+  ('constants -> FALSE add_const_to_operand_stack_bool','constants',2,'p_constants','ali_parser.py',487),
+  ('constants -> variable','constants',1,'p_constants','ali_parser.py',488),
+  ('constants -> call_to_fun','constants',1,'p_constants','ali_parser.py',489),
+  ('constants -> get_window_h','constants',1,'p_constants','ali_parser.py',490),
+  ('constants -> get_window_w','constants',1,'p_constants','ali_parser.py',491),
+  ('constants -> get_game_ev','constants',1,'p_constants','ali_parser.py',492),
+  ('variable -> array_indexing','variable',1,'p_variable','ali_parser.py',495),
+  ('variable -> ID','variable',1,'p_variable','ali_parser.py',496),
+  ('add_const_to_operand_stack_string -> <empty>','add_const_to_operand_stack_string',0,'p_add_const_to_operand_stack_string','ali_parser.py',504),
+  ('add_const_to_operand_stack_int -> <empty>','add_const_to_operand_stack_int',0,'p_add_const_to_operand_stack_int','ali_parser.py',509),
+  ('add_const_to_operand_stack_float -> <empty>','add_const_to_operand_stack_float',0,'p_add_const_to_operand_stack_float','ali_parser.py',513),
+  ('add_const_to_operand_stack_char -> <empty>','add_const_to_operand_stack_char',0,'p_add_const_to_operand_stack_char','ali_parser.py',517),
+  ('gen_operation -> <empty>','gen_operation',0,'p_gen_operation','ali_parser.py',521),
+  ('add_const_to_operand_stack_bool -> <empty>','add_const_to_operand_stack_bool',0,'p_add_const_to_operand_stack_bool','ali_parser.py',525),
+  ('empty -> <empty>','empty',0,'p_empty','ali_parser.py',532),
+]
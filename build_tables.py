@@ -0,0 +1,28 @@
+# ------------------------------------------------------------
+# build_tables.py
+#
+# generates the lexer and parser tables of the ALi language ahead of time
+# ------------------------------------------------------------
+import compileall
+import os
+
+TABLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ali_tables')
+
+'''
+build_tables function
+Removes the tables in ali_tables and builds the lexer and parser again, which write new ones. The parser is built in debug mode, so the grammar is
+checked and its states and conflicts are described in ali_tables/parser.out. The tables are also compiled to bytecode, since compiling the parser
+table from its source takes longer than building the parser from it, and Python may be set to never write bytecode on its own.
+'''
+def build_tables() -> None:
+    for table in ('lextab.py', 'parsetab.py'):
+        table_path = os.path.join(TABLES_DIR, table)
+        if os.path.exists(table_path):
+            os.remove(table_path)
+    os.environ['ALI_PARSER_DEBUG'] = '1'
+    import ali_parser
+    compileall.compile_dir(TABLES_DIR, quiet=1)
+
+if __name__ == '__main__':
+    build_tables()
+    print(f'Wrote the lexer and parser tables to {TABLES_DIR}')
@@ -0,0 +1,667 @@
+import operator
+from collections import deque
+from typing import Any, Callable, Union
+
+from game_engine import convert_string_to_rgb_tuple, create_game_engine
+from linker import LinkedProgram, LinkedQuadruple
+from quadruple import quadruple_operations
+from runtime_memory import RuntimeMemory, TypedArray, ARRAY_ELEMENT, FRAME_STORES_START, TEMP_POINTER
+from stack_memory import FRAME_SLOT
+from virtual_machine import HALT, MemoCache, build_constant_blocks, build_memo_caches, check_index
+
+'''
+ClosureBackend class
+Alternative execution backend for linked ALi code. Before running, every quadruple is compiled into a specialised Python closure that has its operand
+stores, indexes and next instruction pointer bound in. Executing a quadruple is a single call that returns the next instruction pointer, so the run loop
+does no decoding or dispatching at all. Quadruples that read or write through a temp pointer fall back to the runtime memory handle methods, since the
+address they access is only known during execution. With a stack memory, closures bind the list of values and add the current frame pointer instead.
+'''
+class ClosureBackend():
+    def __init__(self, linked_program: LinkedProgram, memory_model: type = RuntimeMemory, game_engine: Any = None) -> None:
+        self.func_dir = linked_program.func_dir
+        self.runtime_memory = memory_model(linked_program.consts_table, linked_program.func_dir)
+        # Closures can only bind the lists they access when the memory keeps one list per frame store
+        self.has_frame_stores = isinstance(self.runtime_memory, RuntimeMemory)
+        self.call_stack = deque()
+        self.memo_caches : dict[str, MemoCache] = build_memo_caches(linked_program.func_dir)
+        # (memo cache, arguments, call stack depth) of every call to a pure function that missed its cache and has not ended yet
+        self.pending_results : list[tuple[MemoCache, tuple, int]] = []
+        # The engine of headless runs is given by the caller. Otherwise it depends on the special functions the program uses
+        self.game_engine = game_engine if game_engine is not None else create_game_engine(linked_program.quadruples)
+        self.quads_executed = 0
+        quadruples = self.runtime_memory.relink_quadruples(linked_program.quadruples, linked_program.func_dir)
+        self.constant_blocks : dict[int, tuple] = build_constant_blocks(quadruples, self.runtime_memory)
+        compiler_table = self.build_compiler_table()
+        self.code : list[Callable[[], int]] = [compiler_table[quadruple.op_code](quadruple, ip) for (ip, quadruple) in enumerate(quadruples)]
+
+    '''
+    build_compiler_table method
+    Builds a dense list with one closure compiler per op code. Op codes without a compiler produce a closure that raises an error when executed.
+    '''
+    def build_compiler_table(self) -> list[Callable[[LinkedQuadruple, int], Callable[[], int]]]:
+        compilers = {
+            'endprogram': self.compile_halt,
+            '+': self.compile_binary_operation(operator.add),
+            '-': self.compile_binary_operation(operator.sub),
+            '*': self.compile_binary_operation(operator.mul),
+            '/': self.compile_binary_operation(operator.truediv),
+            '&&': self.compile_binary_operation(lambda left, right: left and right),
+            '||': self.compile_binary_operation(lambda left, right: left or right),
+            '==': self.compile_binary_operation(operator.eq),
+            '!=': self.compile_binary_operation(operator.ne),
+            '>': self.compile_binary_operation(operator.gt),
+            '<': self.compile_binary_operation(operator.lt),
+            '>=': self.compile_binary_operation(operator.ge),
+            '<=': self.compile_binary_operation(operator.le),
+            '=': self.compile_assign,
+            '!': self.compile_negate,
+            'print': self.compile_print_value,
+            'endprint': self.compile_end_print,
+            'goto': self.compile_goto,
+            'gotot': self.compile_conditional_goto(True),
+            'gotof': self.compile_conditional_goto(False),
+            'gosub': self.compile_gosub,
+            'era': self.compile_era,
+            'parameter': self.compile_parameter,
+            'endfunc': self.compile_end_function,
+            'return': self.compile_assign,
+            'verify': self.compile_verify,
+            'add_base_address': self.compile_add_base_address,
+            'multiply_displacement': self.compile_multiply_displacement,
+            'array_init': self.compile_array_init,
+            'load_idx': self.compile_load_indexed,
+            'store_idx': self.compile_store_indexed,
+            'jlt': self.compile_compare_and_branch(operator.lt),
+            'jle': self.compile_compare_and_branch(operator.le),
+            'jgt': self.compile_compare_and_branch(operator.gt),
+            'jge': self.compile_compare_and_branch(operator.ge),
+            'jeq': self.compile_compare_and_branch(operator.eq),
+            'jne': self.compile_compare_and_branch(operator.ne),
+            # Special functions
+            'start': self.compile_start,
+            'update': self.compile_update,
+            'gen_default_canvas': self.compile_gen_default_canvas,
+            'gen_canvas': self.compile_gen_canvas,
+            'set_canvas_title': self.compile_set_canvas_title,
+            'set_canvas_background': self.compile_set_canvas_background,
+            'get_window_width': self.compile_get_window_width,
+            'get_window_height': self.compile_get_window_height,
+            'get_game_event': self.compile_get_game_event,
+            'draw_game_object': self.compile_draw_game_object,
+            'quit_game': self.compile_quit_game,
+        }
+        compiler_table = [self.compile_unknown_operation] * (max(quadruple_operations.values()) + 1)
+        for operation, compiler in compilers.items():
+            compiler_table[quadruple_operations[operation]] = compiler
+        return compiler_table
+
+    def run(self) -> None:
+        code = self.code
+        ip = 0
+        executed = 0
+        print('--ALi CONSOLE OUTPUT--')
+        while ip != HALT:
+            ip = code[ip]()
+            executed += 1
+        self.quads_executed = executed
+        print('\n--END OF ALi CONSOLE OUTPUT--')
+
+    # Helper to know if a closure has to go through the runtime memory, to follow a temp pointer or address an array element, or because there
+    # are no frame stores to bind
+    def needs_handle_access(self, *handles: tuple[int, int]) -> bool:
+        return not self.has_frame_stores or any(store >= TEMP_POINTER for (store, _) in handles)
+
+    # Helper to know if the closure of a quadruple can address the slots of a stack memory directly, which holds unless it follows a temp pointer
+    # or addresses an array element
+    def binds_stack_slots(self, *handles: tuple[int, int]) -> bool:
+        return not self.has_frame_stores and all(store < TEMP_POINTER for (store, _) in handles)
+
+    '''
+    bind_stack_handle method
+    Returns the list that holds the value of a handle of a stack memory, its index in that list, and whether the index is relative to the frame
+    pointer. Both lists never change, so closures only read the current frame pointer.
+    '''
+    def bind_stack_handle(self, handle: tuple[int, int]) -> tuple[list, int, bool]:
+        (store, index) = handle
+        if store == FRAME_SLOT:
+            return (self.runtime_memory.values, index, True)
+        return (self.runtime_memory.stores[store], index, False)
+
+    def compile_unknown_operation(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        def unknown_operation() -> int:
+            raise RuntimeError('Unknown action for virtual machine')
+        return unknown_operation
+
+    def compile_halt(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        def halt() -> int:
+            return HALT
+        return halt
+
+    def compile_binary_operation(self, operation: Callable) -> Callable[[LinkedQuadruple, int], Callable[[], int]]:
+        def compiler(quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+            next_ip = ip + 1
+            if self.binds_stack_slots(quadruple.operator1, quadruple.operator2, quadruple.result):
+                memory = self.runtime_memory
+                (left_values, left_index, is_left_in_frame) = self.bind_stack_handle(quadruple.operator1)
+                (right_values, right_index, is_right_in_frame) = self.bind_stack_handle(quadruple.operator2)
+                (result_values, result_index, is_result_in_frame) = self.bind_stack_handle(quadruple.result)
+                def stack_binary_operation() -> int:
+                    frame_pointer = memory.frame_pointer
+                    left_operand = left_values[left_index + frame_pointer if is_left_in_frame else left_index]
+                    right_operand = right_values[right_index + frame_pointer if is_right_in_frame else right_index]
+                    if left_operand is None or right_operand is None:
+                        raise RuntimeError('Cannot use uninitialized variable.')
+                    result_values[result_index + frame_pointer if is_result_in_frame else result_index] = operation(left_operand, right_operand)
+                    return next_ip
+                return stack_binary_operation
+            if self.needs_handle_access(quadruple.operator1, quadruple.operator2, quadruple.result):
+                retrieve = self.runtime_memory.retrieve_from_handle
+                assign = self.runtime_memory.assign_to_handle
+                (left_handle, right_handle, result_handle) = (quadruple.operator1, quadruple.operator2, quadruple.result)
+                def pointer_binary_operation() -> int:
+                    assign(result_handle, operation(retrieve(left_handle), retrieve(right_handle)))
+                    return next_ip
+                return pointer_binary_operation
+            stores = self.runtime_memory.stores
+            (left_store, left_index) = quadruple.operator1
+            (right_store, right_index) = quadruple.operator2
+            (result_store, result_index) = quadruple.result
+            def binary_operation() -> int:
+                left_operand = stores[left_store][left_index]
+                right_operand = stores[right_store][right_index]
+                if left_operand is None or right_operand is None:
+                    raise RuntimeError('Cannot use uninitialized variable.')
+                stores[result_store][result_index] = operation(left_operand, right_operand)
+                return next_ip
+            return binary_operation
+        return compiler
+
+    # Assignment and return quadruples both copy the content of operator1 into result
+    def compile_assign(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        next_ip = ip + 1
+        if self.binds_stack_slots(quadruple.operator1, quadruple.result):
+            memory = self.runtime_memory
+            (source_values, source_index, is_source_in_frame) = self.bind_stack_handle(quadruple.operator1)
+            (result_values, result_index, is_result_in_frame) = self.bind_stack_handle(quadruple.result)
+            def stack_assign() -> int:
+                frame_pointer = memory.frame_pointer
+                value = source_values[source_index + frame_pointer if is_source_in_frame else source_index]
+                if value is None:
+                    raise RuntimeError('Cannot use uninitialized variable.')
+                result_values[result_index + frame_pointer if is_result_in_frame else result_index] = value
+                return next_ip
+            return stack_assign
+        if self.needs_handle_access(quadruple.operator1, quadruple.result):
+            retrieve = self.runtime_memory.retrieve_from_handle
+            assign = self.runtime_memory.assign_to_handle
+            (value_handle, result_handle) = (quadruple.operator1, quadruple.result)
+            def pointer_assign() -> int:
+                assign(result_handle, retrieve(value_handle))
+                return next_ip
+            return pointer_assign
+        stores = self.runtime_memory.stores
+        (value_store, value_index) = quadruple.operator1
+        (result_store, result_index) = quadruple.result
+        def assign() -> int:
+            value = stores[value_store][value_index]
+            if value is None:
+                raise RuntimeError('Cannot use uninitialized variable.')
+            stores[result_store][result_index] = value
+            return next_ip
+        return assign
+
+    def compile_negate(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        next_ip = ip + 1
+        retrieve = self.runtime_memory.retrieve_from_handle
+        assign = self.runtime_memory.assign_to_handle
+        (value_handle, result_handle) = (quadruple.operator1, quadruple.result)
+        def negate() -> int:
+            assign(result_handle, not retrieve(value_handle))
+            return next_ip
+        return negate
+
+    def compile_print_value(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        next_ip = ip + 1
+        retrieve = self.runtime_memory.retrieve_from_handle
+        print_handle = quadruple.result
+        def print_value() -> int:
+            print(retrieve(print_handle), end='')
+            return next_ip
+        return print_value
+
+    def compile_end_print(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        next_ip = ip + 1
+        def end_print() -> int:
+            print()
+            return next_ip
+        return end_print
+
+    def compile_goto(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        jump_to = quadruple.result
+        def goto() -> int:
+            return jump_to
+        return goto
+
+    # Fused compare and branch quadruples jump to their result when the comparison of their operators holds
+    def compile_compare_and_branch(self, comparison: Callable) -> Callable[[LinkedQuadruple, int], Callable[[], int]]:
+        def compiler(quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+            next_ip = ip + 1
+            jump_to = quadruple.result
+            if self.binds_stack_slots(quadruple.operator1, quadruple.operator2):
+                memory = self.runtime_memory
+                (left_values, left_index, is_left_in_frame) = self.bind_stack_handle(quadruple.operator1)
+                (right_values, right_index, is_right_in_frame) = self.bind_stack_handle(quadruple.operator2)
+                def stack_compare_and_branch() -> int:
+                    frame_pointer = memory.frame_pointer
+                    left_operand = left_values[left_index + frame_pointer if is_left_in_frame else left_index]
+                    right_operand = right_values[right_index + frame_pointer if is_right_in_frame else right_index]
+                    if left_operand is None or right_operand is None:
+                        raise RuntimeError('Cannot use uninitialized variable.')
+                    if comparison(left_operand, right_operand):
+                        return jump_to
+                    return next_ip
+                return stack_compare_and_branch
+            if self.needs_handle_access(quadruple.operator1, quadruple.operator2):
+                retrieve = self.runtime_memory.retrieve_from_handle
+                (left_handle, right_handle) = (quadruple.operator1, quadruple.operator2)
+                def pointer_compare_and_branch() -> int:
+                    if comparison(retrieve(left_handle), retrieve(right_handle)):
+                        return jump_to
+                    return next_ip
+                return pointer_compare_and_branch
+            stores = self.runtime_memory.stores
+            (left_store, left_index) = quadruple.operator1
+            (right_store, right_index) = quadruple.operator2
+            def compare_and_branch() -> int:
+                left_operand = stores[left_store][left_index]
+                right_operand = stores[right_store][right_index]
+                if left_operand is None or right_operand is None:
+                    raise RuntimeError('Cannot use uninitialized variable.')
+                if comparison(left_operand, right_operand):
+                    return jump_to
+                return next_ip
+            return compare_and_branch
+        return compiler
+
+    def compile_conditional_goto(self, jump_when: bool) -> Callable[[LinkedQuadruple, int], Callable[[], int]]:
+        def compiler(quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+            next_ip = ip + 1
+            jump_to = quadruple.result
+            if self.needs_handle_access(quadruple.operator1):
+                retrieve = self.runtime_memory.retrieve_from_handle
+                test_handle = quadruple.operator1
+                def pointer_conditional_goto() -> int:
+                    test = retrieve(test_handle)
+                    if (test if jump_when else test == False):
+                        return jump_to
+                    return next_ip
+                return pointer_conditional_goto
+            stores = self.runtime_memory.stores
+            (test_store, test_index) = quadruple.operator1
+            if jump_when:
+                def goto_true() -> int:
+                    test = stores[test_store][test_index]
+                    if test is None:
+                        raise RuntimeError('Cannot use uninitialized variable.')
+                    if test:
+                        return jump_to
+                    return next_ip
+                return goto_true
+            def goto_false() -> int:
+                test = stores[test_store][test_index]
+                if test is None:
+                    raise RuntimeError('Cannot use uninitialized variable.')
+                if test == False:
+                    return jump_to
+                return next_ip
+            return goto_false
+        return compiler
+
+    def compile_gosub(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        return_to = ip + 1
+        jump_to = quadruple.result
+        call_stack = self.call_stack
+        sleep_current_memory = self.runtime_memory.sleep_current_memory
+        if quadruple.operator1 in self.memo_caches:
+            return self.compile_memoized_gosub(quadruple, ip)
+        def gosub() -> int:
+            call_stack.append(return_to)
+            sleep_current_memory()
+            return jump_to
+        return gosub
+
+    def compile_era(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        next_ip = ip + 1
+        layout = self.runtime_memory.frame_layouts[quadruple.result]
+        create_mem_segment = self.runtime_memory.create_mem_segment
+        def era() -> int:
+            create_mem_segment(layout)
+            return next_ip
+        return era
+
+    def compile_parameter(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        next_ip = ip + 1
+        runtime_memory = self.runtime_memory
+        retrieve = runtime_memory.retrieve_from_handle
+        value_handle = quadruple.operator1
+        if not self.has_frame_stores:
+            assign_parameter = runtime_memory.assign_parameter
+            parameter_handle = quadruple.result
+            def handle_parameter() -> int:
+                assign_parameter(parameter_handle, retrieve(value_handle))
+                return next_ip
+            return handle_parameter
+        (parameter_store, parameter_index) = quadruple.result
+        frame_store = parameter_store - FRAME_STORES_START
+        def parameter() -> int:
+            # The value is copied into the activation record before it is set as the current memory
+            runtime_memory.activation_record.stores[frame_store][parameter_index] = retrieve(value_handle)
+            return next_ip
+        return parameter
+
+    '''
+    compile_memoized_gosub method
+    Calls to pure functions look up the values of their arguments in the cache of the function, skipping the call on a hit. See the memoized_gosub
+    method of the virtual machine.
+    '''
+    def compile_memoized_gosub(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        return_to = ip + 1
+        jump_to = quadruple.result
+        call_stack = self.call_stack
+        pending_results = self.pending_results
+        runtime_memory = self.runtime_memory
+        memo_cache = self.memo_caches[quadruple.operator1]
+        (param_handles, return_handle, lookup) = (memo_cache.param_handles, memo_cache.return_handle, memo_cache.lookup)
+        def memoized_gosub() -> int:
+            arguments = runtime_memory.retrieve_parameters(param_handles)
+            (is_cached, value) = lookup(arguments)
+            if is_cached:
+                runtime_memory.discard_activation_record()
+                runtime_memory.assign_to_handle(return_handle, value)
+                return return_to
+            call_stack.append(return_to)
+            pending_results.append((memo_cache, arguments, len(call_stack)))
+            runtime_memory.sleep_current_memory()
+            return jump_to
+        return memoized_gosub
+
+    def compile_end_function(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        call_stack = self.call_stack
+        destroy_current_mem_segment = self.runtime_memory.destroy_current_mem_segment
+        if self.memo_caches:
+            pending_results = self.pending_results
+            retrieve = self.runtime_memory.retrieve_from_handle
+            def memoized_end_function() -> int:
+                # Calls to pure functions that missed their cache store their returned value once they end
+                if pending_results and pending_results[-1][2] == len(call_stack):
+                    (memo_cache, arguments, _) = pending_results.pop()
+                    memo_cache.store(arguments, retrieve(memo_cache.return_handle))
+                destroy_current_mem_segment()
+                return call_stack.pop()
+            return memoized_end_function
+        def end_function() -> int:
+            destroy_current_mem_segment()
+            return call_stack.pop()
+        return end_function
+
+    def compile_verify(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        next_ip = ip + 1
+        retrieve = self.runtime_memory.retrieve_from_handle
+        index_handle = quadruple.operator1
+        lower_bound = quadruple.operator2
+        upper_bound = quadruple.result
+        def verify() -> int:
+            index_to_verify = retrieve(index_handle)
+            if index_to_verify >= lower_bound and index_to_verify < upper_bound:
+                return next_ip
+            raise Exception(f'Index \'{index_to_verify}\' out of bounds. Expected index to be in range \'{lower_bound} - {upper_bound}\'')
+        return verify
+
+    def compile_add_base_address(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        next_ip = ip + 1
+        retrieve = self.runtime_memory.retrieve_from_handle
+        base_address = quadruple.operator1
+        add_handle = quadruple.operator2
+        if not self.has_frame_stores:
+            assign_address = self.runtime_memory.assign_address_to_handle
+            pointer_handle = quadruple.result
+            def handle_add_base_address() -> int:
+                assign_address(pointer_handle, base_address + retrieve(add_handle))
+                return next_ip
+            return handle_add_base_address
+        stores = self.runtime_memory.stores
+        (pointer_store, pointer_index) = quadruple.result
+        def add_base_address() -> int:
+            stores[pointer_store][pointer_index] = base_address + retrieve(add_handle)
+            return next_ip
+        return add_base_address
+
+    def compile_array_init(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        next_ip = ip + 1
+        assign_block = self.runtime_memory.assign_block
+        array_handle = quadruple.result
+        if ip in self.constant_blocks:
+            constant_block = self.constant_blocks[ip]
+            def constant_array_init() -> int:
+                assign_block(array_handle, constant_block)
+                return next_ip
+            return constant_array_init
+        retrieve = self.runtime_memory.retrieve_from_handle
+        value_handles = quadruple.operator1
+        def array_init() -> int:
+            assign_block(array_handle, tuple([retrieve(handle) for handle in value_handles]))
+            return next_ip
+        return array_init
+
+    '''
+    compile_element_offset method
+    Returns a closure that checks the indexes of a load_idx or store_idx and computes the offset of the element they address from the first element
+    of its array. One-dimensional accesses, which are the most common ones, check their index inline and read it straight from its store when it is
+    not an array element.
+    '''
+    def compile_element_offset(self, element: list[tuple[int, int]], indexing: tuple[tuple, Union[int, None]]) -> Callable[[], int]:
+        retrieve = self.runtime_memory.retrieve_from_handle
+        (bounds, stride) = indexing
+        if stride is not None:
+            checked_indexes = list(zip(element[1:], bounds))
+            def row_major_offset() -> int:
+                (row, column) = [check_index(retrieve(handle), index_bounds) for (handle, index_bounds) in checked_indexes]
+                return row * stride + column
+            return row_major_offset
+        index_handle = element[1]
+        if self.needs_handle_access(index_handle):
+            index_bounds = bounds[0]
+            def handle_offset() -> int:
+                return check_index(retrieve(index_handle), index_bounds)
+            return handle_offset
+        stores = self.runtime_memory.stores
+        (index_store, index_index) = index_handle
+        if bounds[0] is None:
+            def unchecked_offset() -> int:
+                index = stores[index_store][index_index]
+                if index is None:
+                    raise RuntimeError('Cannot use uninitialized variable.')
+                return index
+            return unchecked_offset
+        (lower_bound, upper_bound) = bounds[0]
+        def checked_offset() -> int:
+            index_to_verify = stores[index_store][index_index]
+            if index_to_verify is None:
+                raise RuntimeError('Cannot use uninitialized variable.')
+            if index_to_verify >= lower_bound and index_to_verify < upper_bound:
+                return index_to_verify
+            raise Exception(f'Index \'{index_to_verify}\' out of bounds. Expected index to be in range \'{lower_bound} - {upper_bound}\'')
+        return checked_offset
+
+    # Typed buffer of a global array addressed by a handle and the offset of the element it addresses, or None when it is not one. Global arrays
+    # keep the same buffers while the program runs, so closures bind them directly
+    def find_global_array_element(self, handle: tuple[int, int]) -> tuple[Union[TypedArray, None], int]:
+        (store, index) = handle
+        if store == ARRAY_ELEMENT and index[0] < FRAME_STORES_START:
+            return self.runtime_memory.find_array_element(index)
+        return (None, index)
+
+    def compile_load_indexed(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        next_ip = ip + 1
+        array_handle = quadruple.operator1[0]
+        element_offset = self.compile_element_offset(quadruple.operator1, quadruple.operator2)
+        result_handle = quadruple.result
+        (typed_array, start) = self.find_global_array_element(array_handle)
+        if typed_array is not None and not self.needs_handle_access(result_handle):
+            load = typed_array.load
+            stores = self.runtime_memory.stores
+            (result_store, result_index) = result_handle
+            def global_load_indexed() -> int:
+                stores[result_store][result_index] = load(start + element_offset())
+                return next_ip
+            return global_load_indexed
+        retrieve_element = self.runtime_memory.retrieve_element
+        assign = self.runtime_memory.assign_to_handle
+        def load_indexed() -> int:
+            assign(result_handle, retrieve_element(array_handle, element_offset()))
+            return next_ip
+        return load_indexed
+
+    def compile_store_indexed(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        next_ip = ip + 1
+        retrieve = self.runtime_memory.retrieve_from_handle
+        array_handle = quadruple.result[0]
+        element_offset = self.compile_element_offset(quadruple.result, quadruple.operator2)
+        value_handle = quadruple.operator1
+        (typed_array, start) = self.find_global_array_element(array_handle)
+        if typed_array is not None:
+            store = typed_array.store
+            def global_store_indexed() -> int:
+                store(start + element_offset(), retrieve(value_handle))
+                return next_ip
+            return global_store_indexed
+        assign_element = self.runtime_memory.assign_element
+        def store_indexed() -> int:
+            assign_element(array_handle, element_offset(), retrieve(value_handle))
+            return next_ip
+        return store_indexed
+
+    def compile_multiply_displacement(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        next_ip = ip + 1
+        retrieve = self.runtime_memory.retrieve_from_handle
+        assign = self.runtime_memory.assign_to_handle
+        index_handle = quadruple.operator1
+        multiplier = quadruple.operator2
+        result_handle = quadruple.result
+        def multiply_displacement() -> int:
+            assign(result_handle, retrieve(index_handle) * multiplier)
+            return next_ip
+        return multiply_displacement
+
+    # Special functions
+    def compile_start(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        next_ip = ip + 1
+        game_engine = self.game_engine
+        def start() -> int:
+            game_engine.start()
+            return next_ip
+        return start
+
+    def compile_update(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        next_ip = ip + 1
+        game_engine = self.game_engine
+        def update() -> int:
+            return next_ip if game_engine.update() else HALT
+        return update
+
+    def compile_gen_default_canvas(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        next_ip = ip + 1
+        game_engine = self.game_engine
+        (width, height, background) = (quadruple.operator1, quadruple.operator2, quadruple.result)
+        def gen_default_canvas() -> int:
+            game_engine.generate_canvas(width, height, background)
+            return next_ip
+        return gen_default_canvas
+
+    def compile_gen_canvas(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        next_ip = ip + 1
+        game_engine = self.game_engine
+        retrieve = self.runtime_memory.retrieve_from_handle
+        (width_handle, height_handle, color_handle) = (quadruple.operator1, quadruple.operator2, quadruple.result)
+        def gen_canvas() -> int:
+            width = retrieve(width_handle)
+            height = retrieve(height_handle)
+            color = retrieve(color_handle)
+            game_engine.generate_canvas(width, height, convert_string_to_rgb_tuple(color))
+            return next_ip
+        return gen_canvas
+
+    def compile_set_canvas_title(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        next_ip = ip + 1
+        game_engine = self.game_engine
+        retrieve = self.runtime_memory.retrieve_from_handle
+        caption_handle = quadruple.result
+        def set_canvas_title() -> int:
+            game_engine.set_canvas_title(retrieve(caption_handle))
+            return next_ip
+        return set_canvas_title
+
+    def compile_set_canvas_background(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        next_ip = ip + 1
+        game_engine = self.game_engine
+        retrieve = self.runtime_memory.retrieve_from_handle
+        color_handle = quadruple.result
+        def set_canvas_background() -> int:
+            game_engine.set_canvas_background(convert_string_to_rgb_tuple(retrieve(color_handle)))
+            return next_ip
+        return set_canvas_background
+
+    def compile_get_window_width(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        next_ip = ip + 1
+        game_engine = self.game_engine
+        assign = self.runtime_memory.assign_to_handle
+        result_handle = quadruple.result
+        def get_window_width() -> int:
+            assign(result_handle, game_engine.get_window_width())
+            return next_ip
+        return get_window_width
+
+    def compile_get_window_height(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        next_ip = ip + 1
+        game_engine = self.game_engine
+        assign = self.runtime_memory.assign_to_handle
+        result_handle = quadruple.result
+        def get_window_height() -> int:
+            assign(result_handle, game_engine.get_window_height())
+            return next_ip
+        return get_window_height
+
+    def compile_get_game_event(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        next_ip = ip + 1
+        game_engine = self.game_engine
+        assign = self.runtime_memory.assign_to_handle
+        result_handle = quadruple.result
+        def get_game_event() -> int:
+            key = game_engine.get_game_event()
+            if key is not None:
+                assign(result_handle, key)
+            return next_ip
+        return get_game_event
+
+    def compile_draw_game_object(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        next_ip = ip + 1
+        game_engine = self.game_engine
+        retrieve = self.runtime_memory.retrieve_from_handle
+        (xpos_handle, ypos_handle) = quadruple.operator1
+        (xsize_handle, ysize_handle) = quadruple.operator2
+        color_handle = quadruple.result
+        def draw_game_object() -> int:
+            rgb_color = convert_string_to_rgb_tuple(retrieve(color_handle))
+            xpos = retrieve(xpos_handle)
+            ypos = retrieve(ypos_handle)
+            xsize = retrieve(xsize_handle)
+            ysize = retrieve(ysize_handle)
+            game_engine.draw_game_object(xpos, ypos, xsize, ysize, rgb_color)
+            return next_ip
+        return draw_game_object
+
+    def compile_quit_game(self, quadruple: LinkedQuadruple, ip: int) -> Callable[[], int]:
+        def quit_game() -> int:
+            print('\nGame has been ended by the user.')
+            return HALT
+        return quit_game
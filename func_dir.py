@@ -1,5 +1,6 @@
 from vars_table import VarsTable
 from semantic_cube import types
+from virtual_memory import VirtualMemory
 
 class FuncDirEntry():
     def __init__(self, type: str) -> None:
@@ -17,6 +18,12 @@ class FuncDirEntry():
         self.num_pointer_temps = 0
         self.starts_at = -1
         self.is_returning_value = False
+        # Virtual address of the global variable that holds the value the function returns. Kept after the vars table is released
+        self.return_address = -1
+        # (base virtual address, total size) of every array declared in the scope. Kept after the vars table is released
+        self.arrays : list[tuple[int, int]] = []
+        # Set by the optimizer on functions whose returned value only depends on the values of their arguments
+        self.is_pure = False
 
     def __str__(self) -> str:
         return f'''type: {self.type} starts_at: {self.starts_at}\n 
@@ -44,6 +51,22 @@ class FuncDirEntry():
     def release_scope_vars_table(self):
         del self.vars_table
 
+    '''
+    get_param_address method
+    Reverse engineers the virtual address that was given to a parameter on the local var table of the function.
+    This will make generating an activation record with the params a whole lot easier
+    '''
+    def get_param_address(self, param_index: int) -> int:
+        param_type_indicator = self.params_list[param_index]
+        param_vaddr = param_index
+        if param_type_indicator == 'i':
+            param_vaddr += VirtualMemory.local_int_range[0]
+        elif param_type_indicator == 'f':
+            param_vaddr += VirtualMemory.local_float_range[0]
+        elif param_type_indicator == 'c':
+            param_vaddr += VirtualMemory.local_char_range[0]
+        return param_vaddr
+
 class FuncDir():
     def __init__(self) -> None:
         self.func_dir : dict[str, FuncDirEntry] = {}
@@ -96,6 +119,12 @@ class FuncDir():
         elif type == 'pointer':
             self.func_dir[scopeID].num_pointer_temps += 1
 
+    def add_array(self, scopeID: str, address: int, total_size: int) -> None:
+        self.func_dir[scopeID].arrays.append((address, total_size))
+
+    def set_return_address(self, scopeID: str, address: int) -> None:
+        self.func_dir[scopeID].return_address = address
+
     def set_scope_start(self, scopeID, start: int) -> None:
         self.func_dir[scopeID].starts_at = start
 
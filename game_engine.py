@@ -0,0 +1,85 @@
+from typing import Any, Union
+from quadruple import quadruple_operations
+
+'''
+convert_string_to_rgb_tuple function
+Receives a string with the format \'#XXXXXX\'. Converts the string into a tuple representing an RGB color.
+'''
+def convert_string_to_rgb_tuple(color: str) -> tuple[int]:
+    if len(color) != 7:
+        raise Exception(f'RGB string with 6 digits expected for color parameter. Instead given \'{color}\'')
+    color_s = color.lstrip('#')
+    return tuple(int(color_s[i:i+2], 16) for i in (0, 2, 4))
+
+# Special functions that open a window, draw on it or read the keyboard. Every program starts, updates and generates its default canvas, which
+# programs without any of these special functions never show
+GAME_OPERATIONS = {quadruple_operations[operation] for operation in ('gen_canvas', 'set_canvas_title', 'set_canvas_background', 'get_window_width',
+    'get_window_height', 'get_game_event', 'draw_game_object')}
+
+# Value getGameEvent returns for every event of a script. 'other' is an event that is not a key press, and 'none' a frame without events
+GAME_EVENT_VALUES = {'tab': 0, 'left': 1, 'up': 2, 'right': 3, 'down': 4, 'escape': 5, 'other': -1, 'none': None}
+
+'''
+read_game_events function
+Reads a script of game events, with the event of one frame on every line. Empty lines are frames without events.
+'''
+def read_game_events(filename: str) -> list[Union[int, None]]:
+    events = []
+    with open(filename) as script_file:
+        for (line_number, line) in enumerate(script_file, start=1):
+            event = line.strip().lower() or 'none'
+            if event not in GAME_EVENT_VALUES:
+                raise Exception(f'Unknown game event \'{event}\' on line {line_number} of {filename}. Expected one of {", ".join(GAME_EVENT_VALUES)}')
+            events.append(GAME_EVENT_VALUES[event])
+    return events
+
+'''
+ConsoleEngine class
+Implements the ALi special functions for programs that never draw or read game events, without opening a window. It has the same methods as the
+pygame engine, so backends use both alike.
+'''
+class ConsoleEngine():
+    def __init__(self) -> None:
+        self.width = 0
+        self.height = 0
+        self.canvas_background : tuple = None
+
+    def start(self) -> None:
+        pass
+
+    def update(self) -> bool:
+        return True
+
+    def generate_canvas(self, width: int, height: int, background: tuple) -> None:
+        self.width = width
+        self.height = height
+        self.canvas_background = background
+
+    def set_canvas_title(self, caption: str) -> None:
+        pass
+
+    def set_canvas_background(self, background: tuple) -> None:
+        self.canvas_background = background
+
+    def get_window_width(self) -> int:
+        return self.width
+
+    def get_window_height(self) -> int:
+        return self.height
+
+    def get_game_event(self) -> Union[int, None]:
+        return None
+
+    def draw_game_object(self, xpos: int, ypos: int, xsize: int, ysize: int, color: tuple) -> None:
+        pass
+
+'''
+create_game_engine function
+Game engine of a program, given its quadruples. pygame is only imported, and its subsystems only initialized, when the program uses a special
+function that needs a window or the keyboard. Any other program runs on a console engine.
+'''
+def create_game_engine(quadruples: list) -> Any:
+    if any(quadruple.op_code in GAME_OPERATIONS for quadruple in quadruples):
+        from pygame_engine import GameEngine
+        return GameEngine()
+    return ConsoleEngine()
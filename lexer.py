@@ -97,8 +97,8 @@ def t_error(t):
     print("Illegal character '%s'" % t.value[0])
     t.lexer.skip(1)
 
-# Build the lexer
-lexer = lex.lex()
+# Build the lexer from the master regex prebuilt in ali_tables, without validating every rule again. The table is written when it is missing
+lexer = lex.lex(optimize=1, lextab='ali_tables.lextab')
 
 def test():
     print('Testing')
@@ -0,0 +1,52 @@
+from typing import Any
+from func_dir import FuncDir
+from quadruple import Quadruple, address_operands
+from runtime_memory import decode_address, operation_names
+from semantic_rules import CompilationResults
+from vars_table import ConstVarsTable
+
+'''
+LinkedQuadruple class
+Same shape as a Quadruple, but every operand that held a virtual address holds its (store, index) handle instead.
+'''
+class LinkedQuadruple():
+    __slots__ = ('op_code', 'operator1', 'operator2', 'result')
+
+    def __init__(self, op_code: int, operator1: Any, operator2: Any, result: Any) -> None:
+        self.op_code = op_code
+        self.operator1 = operator1
+        self.operator2 = operator2
+        self.result = result
+
+    def __str__(self) -> str:
+        return f'{self.op_code} {self.operator1} {self.operator2} {self.result}'
+
+    def __repr__(self) -> str:
+        return f'{self.op_code} {self.operator1} {self.operator2} {self.result}'
+
+class LinkedProgram():
+    def __init__(self, func_dir: FuncDir, consts_table: ConstVarsTable, quadruples: list[LinkedQuadruple]) -> None:
+        self.func_dir : FuncDir = func_dir
+        self.consts_table : ConstVarsTable = consts_table
+        self.quadruples : list[LinkedQuadruple] = quadruples
+
+def link_operand(operand: Any) -> Any:
+    if isinstance(operand, list):
+        return [decode_address(virtual_address) for virtual_address in operand]
+    return decode_address(operand)
+
+def link_quadruple(quadruple: Quadruple) -> LinkedQuadruple:
+    fields = address_operands[operation_names[quadruple.op_code]]
+    operator1 = link_operand(quadruple.operator1) if 'operator1' in fields else quadruple.operator1
+    operator2 = link_operand(quadruple.operator2) if 'operator2' in fields else quadruple.operator2
+    result = link_operand(quadruple.result) if 'result' in fields else quadruple.result
+    return LinkedQuadruple(quadruple.op_code, operator1, operator2, result)
+
+'''
+link function
+Virtual addresses never change after compilation, so they are decoded once here instead of on every memory access during execution.
+Takes in the compilation results given out by the semantic_rules.py module and returns the program the virtual machine executes.
+'''
+def link(compilation_results: CompilationResults) -> LinkedProgram:
+    linked_quadruples = [link_quadruple(quadruple) for quadruple in compilation_results.quadruples]
+    return LinkedProgram(compilation_results.func_dir, compilation_results.consts_table, linked_quadruples)
@@ -0,0 +1,1449 @@
+import math
+from typing import Union
+from func_dir import FuncDirEntry
+from linker import operation_names
+from quadruple import Quadruple, address_operands
+from runtime_memory import FrameLayout
+from semantic_rules import CompilationResults
+from virtual_memory import VirtualMemory
+
+# Operations whose result field holds the index of the quadruple they jump to
+jump_operations = {'goto', 'gotot', 'gotof', 'gosub', 'jlt', 'jle', 'jgt', 'jge', 'jeq', 'jne'}
+
+# Operations that jump to their result depending on their operands
+conditional_jump_operations = {'gotot', 'gotof', 'jlt', 'jle', 'jgt', 'jge', 'jeq', 'jne'}
+
+# Operations after which execution never continues with the next quadruple
+terminating_operations = {'goto', 'endfunc', 'endprogram', 'quit_game'}
+
+# Arithmetic, logical and relational operations
+binary_operations = {'+', '-', '*', '/', '&&', '||', '==', '!=', '>', '<', '>=', '<='}
+
+# Operations whose result only depends on their operands, so they can be reused while their operands keep their values
+expression_operations = binary_operations | {'!', 'multiply_displacement', 'add_base_address'}
+
+# Operations whose result gives the same value when their operands are swapped
+commutative_operations = {'+', '*', '==', '!='}
+
+# Operations that store a value into their result field. array_init stores the elements of a whole array, starting at its result
+value_writing_operations = binary_operations | {'!', '=', 'return', 'multiply_displacement', 'get_window_width', 'get_window_height', 'get_game_event',
+    'array_init', 'load_idx'}
+
+# Virtual address ranges of the bool, char, float and int temporals (pointer temporals are excluded)
+temp_ranges = [
+    VirtualMemory.temp_int_range,
+    VirtualMemory.temp_float_range,
+    VirtualMemory.temp_char_range,
+    VirtualMemory.temp_bool_range,
+]
+
+# Virtual address ranges of the global variables and of the constants
+global_ranges = [
+    VirtualMemory.global_int_range,
+    VirtualMemory.global_float_range,
+    VirtualMemory.global_char_range,
+    VirtualMemory.global_bool_range,
+]
+constant_ranges = [
+    VirtualMemory.constant_int_range,
+    VirtualMemory.constant_float_range,
+    VirtualMemory.constant_char_range,
+    VirtualMemory.constant_bool_range,
+    VirtualMemory.constant_string_range,
+]
+
+# Fused jump that replaces a relational quadruple followed by a gotof, which jumps when the comparison does not hold
+fused_false_jumps = {
+    '<': 'jge',
+    '<=': 'jgt',
+    '>': 'jle',
+    '>=': 'jlt',
+    '==': 'jne',
+    '!=': 'jeq',
+}
+
+# Fused jump that replaces a relational quadruple followed by a gotot, which jumps when the comparison holds
+fused_true_jumps = {
+    '<': 'jlt',
+    '<=': 'jle',
+    '>': 'jgt',
+    '>=': 'jge',
+    '==': 'jeq',
+    '!=': 'jne',
+}
+
+'''
+count_address_uses function
+Counts how many times every virtual address appears as an operand or result of the quadruples.
+'''
+def count_address_uses(quadruples: list[Quadruple]) -> dict[int, int]:
+    uses = {}
+    for quadruple in quadruples:
+        for field in address_operands[operation_names[quadruple.op_code]]:
+            operand = getattr(quadruple, field)
+            for virtual_address in (operand if isinstance(operand, list) else [operand]):
+                uses[virtual_address] = uses.get(virtual_address, 0) + 1
+    return uses
+
+def is_temp_address(virtual_address: int) -> bool:
+    return any(virtual_address >= range_start and virtual_address <= range_end for (range_start, range_end) in temp_ranges)
+
+def is_global_address(virtual_address: int) -> bool:
+    return any(virtual_address >= range_start and virtual_address <= range_end for (range_start, range_end) in global_ranges)
+
+def is_constant_address(virtual_address: int) -> bool:
+    return any(virtual_address >= range_start and virtual_address <= range_end for (range_start, range_end) in constant_ranges)
+
+def is_pointer_address(virtual_address: int) -> bool:
+    return virtual_address >= VirtualMemory.temp_pointer_range[0] and virtual_address <= VirtualMemory.temp_pointer_range[1]
+
+def get_jump_targets(quadruples: list[Quadruple]) -> set[int]:
+    return {quadruple.result for quadruple in quadruples if operation_names[quadruple.op_code] in jump_operations}
+
+'''
+get_successors function
+Returns the indexes of the quadruples that may execute right after the quadruple at the given index. A gosub continues both on the function it
+calls and, once that function ends, on the quadruple that follows it.
+'''
+def get_successors(quadruples: list[Quadruple], index: int) -> list[int]:
+    quadruple = quadruples[index]
+    operation = operation_names[quadruple.op_code]
+    next_index = [index + 1] if index + 1 < len(quadruples) else []
+    if operation == 'goto':
+        return [quadruple.result]
+    if operation in conditional_jump_operations or operation == 'gosub':
+        return [quadruple.result] + next_index
+    if operation in terminating_operations:
+        return []
+    return next_index
+
+'''
+get_function_ranges function
+Returns the name, first quadruple and end of every function, main included. Each function ends where the next one starts.
+'''
+def get_function_ranges(compilation_results: CompilationResults) -> list[tuple[str, int, int]]:
+    starts = sorted((scope.starts_at, scopeID) for (scopeID, scope) in compilation_results.func_dir.get_func_dir().items() if scopeID != 'global' and scope.starts_at >= 0)
+    ranges = []
+    for (position, (start, scopeID)) in enumerate(starts):
+        end = starts[position + 1][0] if position + 1 < len(starts) else len(compilation_results.quadruples)
+        ranges.append((scopeID, start, end))
+    return ranges
+
+'''
+count_assignments function
+Counts how many quadruples store directly into every address. Stores through a pointer count as uses of the pointer, not as assignments.
+'''
+def count_assignments(quadruples: list[Quadruple]) -> dict[int, int]:
+    assignments = {}
+    for quadruple in quadruples:
+        operation = operation_names[quadruple.op_code]
+        if operation == 'add_base_address' or (operation in value_writing_operations and not is_pointer_address(quadruple.result)):
+            assignments[quadruple.result] = assignments.get(quadruple.result, 0) + 1
+    return assignments
+
+def rename_addresses(quadruple: Quadruple, renamed: dict[int, int], fields: Union[tuple[str, ...], None] = None) -> None:
+    for field in (address_operands[operation_names[quadruple.op_code]] if fields is None else fields):
+        operand = getattr(quadruple, field)
+        if isinstance(operand, list):
+            setattr(quadruple, field, [renamed.get(virtual_address, virtual_address) for virtual_address in operand])
+        else:
+            setattr(quadruple, field, renamed.get(operand, operand))
+
+'''
+replace_quadruples function
+Replaces the quadruples at the given indexes with lists of new quadruples, renumbering the jumps and the start of every function. Jumps of the new
+quadruples target indexes of the old ones. A jump to a quadruple replaced by an empty list lands on the next quadruple that is kept.
+'''
+def replace_quadruples(compilation_results: CompilationResults, replacements: dict[int, list[Quadruple]]) -> None:
+    new_quadruples = []
+    new_indexes = []
+    for (index, quadruple) in enumerate(compilation_results.quadruples):
+        new_indexes.append(len(new_quadruples))
+        new_quadruples.extend(replacements.get(index, [quadruple]))
+    new_indexes.append(len(new_quadruples))
+    compilation_results.quadruples = new_quadruples
+    for quadruple in new_quadruples:
+        if operation_names[quadruple.op_code] in jump_operations:
+            quadruple.result = new_indexes[quadruple.result]
+    for scope in compilation_results.func_dir.get_func_dir().values():
+        if scope.starts_at >= 0:
+            scope.starts_at = new_indexes[scope.starts_at]
+
+'''
+remove_quadruples function
+Deletes the quadruples at the given indexes, renumbering the jumps and the start of every function.
+'''
+def remove_quadruples(compilation_results: CompilationResults, removed: set[int]) -> None:
+    replace_quadruples(compilation_results, {index: [] for index in removed})
+
+'''
+fuse_compare_and_branch function
+Conditions of ifs and loops compile to a relational quadruple that stores a bool temporal, followed by a gotof that reads it. When that temporal
+is used nowhere else, both quadruples are replaced by a single fused jump that compares the operators directly. Returns the number of fused pairs.
+'''
+def fuse_compare_and_branch(compilation_results: CompilationResults) -> int:
+    quadruples = compilation_results.quadruples
+    jump_targets = get_jump_targets(quadruples)
+    removed = set()
+    for (_, start, end) in get_function_ranges(compilation_results):
+        # Temporals of different functions share their virtual addresses
+        uses = count_address_uses(quadruples[start:end])
+        for index in range(start, end - 1):
+            comparison = quadruples[index]
+            branch = quadruples[index + 1]
+            operation = operation_names[comparison.op_code]
+            branch_operation = operation_names[branch.op_code]
+            if operation not in fused_false_jumps or branch_operation not in ('gotof', 'gotot') or index + 1 in jump_targets:
+                continue
+            # The temporal must only be written by the comparison and read by the branch
+            if branch.operator1 != comparison.result or uses[comparison.result] != 2:
+                continue
+            fused_operation = fused_false_jumps[operation] if branch_operation == 'gotof' else fused_true_jumps[operation]
+            quadruples[index] = Quadruple(fused_operation, comparison.operator1, comparison.operator2, branch.result)
+            removed.add(index + 1)
+    remove_quadruples(compilation_results, removed)
+    return len(removed)
+
+# Temporal kind that holds the elements of the array that starts at the given virtual address. Globals, locals and temporals of every type have
+# the same position on their ranges
+def get_element_temp_range(base_address: int) -> tuple[list[int], str]:
+    for (type_position, (global_range, (local_range, _))) in enumerate(zip(global_ranges, local_slot_ranges)):
+        if (base_address >= global_range[0] and base_address <= global_range[1]) or (base_address >= local_range[0] and base_address <= local_range[1]):
+            return temp_slot_ranges[type_position]
+    raise Exception(f'Array base address \'{base_address}\' does not belong to a global or local variable')
+
+'''
+find_fused_indexes function
+Returns the indexes an add_base_address quadruple addresses its array with, the size of the rows of a two-dimensional access, and the first quadruple
+of the access. The displacement of a two-dimensional access is only replaced by its indexes when it is computed by the multiply_displacement and +
+right before the add_base_address.
+'''
+def find_fused_indexes(quadruples: list[Quadruple], index: int, start: int, uses: dict[int, int], jump_targets: set[int]) -> tuple[list[int], Union[int, None], int]:
+    displacement = quadruples[index].operator2
+    if index - 2 >= start and index not in jump_targets and index - 1 not in jump_targets and is_temp_address(displacement) and uses[displacement] == 2:
+        (multiplication, addition) = (quadruples[index - 2], quadruples[index - 1])
+        if operation_names[multiplication.op_code] == 'multiply_displacement' and operation_names[addition.op_code] == '+' \
+                and addition.result == displacement and addition.operator1 == multiplication.result and uses[multiplication.result] == 2:
+            return ([multiplication.operator1, addition.operator2], multiplication.operator2, index - 2)
+    return ([displacement], None, index)
+
+'''
+find_fused_bounds function
+Returns the (lower, upper) bounds every index of an access is verified against right before the access starts, or None when it is not checked there,
+along with the first of those bounds checks. Checks are generated in the order of the indexes, so walking back the last unchecked index comes first.
+'''
+def find_fused_bounds(quadruples: list[Quadruple], indexes: list[int], first: int, start: int, jump_targets: set[int]) -> tuple[list, int]:
+    bounds = [None] * len(indexes)
+    while first - 1 >= start and first not in jump_targets and operation_names[quadruples[first - 1].op_code] == 'verify':
+        check = quadruples[first - 1]
+        unchecked = [position for position in range(len(indexes)) if indexes[position] == check.operator1 and bounds[position] is None]
+        if not unchecked:
+            break
+        bounds[unchecked[-1]] = (check.operator2, check.result)
+        first -= 1
+    return (bounds, first)
+
+'''
+find_pointer_uses function
+Returns the indexes of the quadruples that use the pointer an add_base_address stores into, when all of them are on its basic block. Returns None
+when the pointer is used anywhere else or written again.
+'''
+def find_pointer_uses(quadruples: list[Quadruple], index: int, end: int, uses: dict[int, int], jump_targets: set[int]) -> Union[list[int], None]:
+    pointer = quadruples[index].result
+    pending_uses = uses[pointer] - 1
+    use_indexes = []
+    for use_index in range(index + 1, end):
+        quadruple = quadruples[use_index]
+        operation = operation_names[quadruple.op_code]
+        if use_index in jump_targets or (operation == 'add_base_address' and quadruple.result == pointer):
+            return None
+        pointer_uses = count_address_uses([quadruple]).get(pointer, 0)
+        if pointer_uses:
+            use_indexes.append(use_index)
+            pending_uses -= pointer_uses
+            if pending_uses == 0:
+                return use_indexes
+        if (operation in jump_operations and operation != 'gosub') or operation in terminating_operations:
+            return None
+    return None
+
+'''
+keeps_indexes function
+Checks that the indexes of an access keep their values from its add_base_address up to the last use of its pointer. Calls may only change globals.
+Indexes read through a pointer may change with any store into an array, so they are only kept when the pointer is used right away.
+'''
+def keeps_indexes(quadruples: list[Quadruple], indexes: list[int], index: int, use_indexes: list[int]) -> bool:
+    if any(is_pointer_address(virtual_address) for virtual_address in indexes):
+        return use_indexes == [index + 1]
+    for between in range(index + 1, use_indexes[-1]):
+        quadruple = quadruples[between]
+        operation = operation_names[quadruple.op_code]
+        if operation == 'gosub' and any(is_global_address(virtual_address) for virtual_address in indexes):
+            return False
+        if (operation in value_writing_operations or operation == 'add_base_address') and quadruple.result in indexes:
+            return False
+    return True
+
+# Fields of a quadruple that read the addresses they hold
+def get_read_fields(quadruple: Quadruple) -> tuple[str, ...]:
+    operation = operation_names[quadruple.op_code]
+    return tuple(field for field in get_frame_fields(quadruple) if not (field == 'result' and operation in value_writing_operations))
+
+'''
+fuse_array_accesses function
+Every access to an array element compiles to the bounds checks of its indexes, the computation of its displacement, an add_base_address that stores
+the address of the element into a temp pointer, and the quadruples that read or write through that pointer. When every use of the pointer is on the
+basic block of its add_base_address, each of them becomes a load_idx or store_idx and the add_base_address is dropped. They hold the base address of
+the array followed by the indexes on one address list, and (bounds of every index, size of the rows) on their operator2, so the backends check the
+indexes and address the element directly. Bounds checks are only folded into a use that follows the add_base_address right away, so checks still
+run before anything that comes in between. Pointers read by operations other than a copy are replaced by a new temporal the element is loaded into.
+It runs after the other passes, since they rely on the separate bounds checks and pointers. Returns the number of fused accesses of every function.
+'''
+def fuse_array_accesses(compilation_results: CompilationResults) -> dict[str, int]:
+    quadruples = compilation_results.quadruples
+    jump_targets = get_jump_targets(quadruples)
+    replacements = {}
+    fused_counts = {}
+    for (scopeID, start, end) in get_function_ranges(compilation_results):
+        scope = compilation_results.func_dir.get_scope(scopeID)
+        # Temporals and pointers of different functions share their virtual addresses
+        uses = count_address_uses(quadruples[start:end])
+        frame_sizes = get_frame_slot_sizes(quadruples, scope, start, end)
+        for index in range(start, end - 1):
+            addressing = quadruples[index]
+            if operation_names[addressing.op_code] != 'add_base_address' or index in replacements:
+                continue
+            pointer = addressing.result
+            use_indexes = find_pointer_uses(quadruples, index, end, uses, jump_targets)
+            # Quadruples that use several pointers keep the loads of the elements fused before them
+            accesses = {use_index: replacements.get(use_index, [quadruples[use_index]]) for use_index in use_indexes or []}
+            # Only copies write through a pointer
+            if use_indexes is None or any(operation_names[fused[-1].op_code] in value_writing_operations and operation_names[fused[-1].op_code] != '='
+                    and fused[-1].result == pointer for fused in accesses.values()):
+                continue
+            (indexes, stride, first) = find_fused_indexes(quadruples, index, start, uses, jump_targets)
+            (bounds, first) = find_fused_bounds(quadruples, indexes, first, start, jump_targets) if use_indexes[0] == index + 1 else ([None] * len(indexes), first)
+            if not keeps_indexes(quadruples, indexes, index, use_indexes) or any(fused_index in replacements for fused_index in range(first, index)):
+                continue
+            element = [addressing.operator1] + indexes
+            for use_index in use_indexes:
+                access = accesses[use_index][-1]
+                operation = operation_names[access.op_code]
+                indexing = (tuple(bounds) if use_index == use_indexes[0] else (None,) * len(indexes), stride)
+                if operation == '=' and access.result == pointer:
+                    replacements[use_index] = accesses[use_index][:-1] + [Quadruple('store_idx', access.operator1, indexing, element)]
+                elif operation == '=' and access.operator1 == pointer and not is_pointer_address(access.result):
+                    replacements[use_index] = accesses[use_index][:-1] + [Quadruple('load_idx', element, indexing, access.result)]
+                else:
+                    (temp_range, counter) = get_element_temp_range(addressing.operator1)
+                    element_temp = temp_range[0] + frame_sizes[counter]
+                    frame_sizes[counter] += 1
+                    rename_addresses(access, {pointer: element_temp}, get_read_fields(access))
+                    # The indexes of a later access are checked before the elements of the earlier ones are read, as the separate checks did
+                    replacements[use_index] = [Quadruple('load_idx', element, indexing, element_temp)] + accesses[use_index]
+            for fused_index in range(first, index + 1):
+                replacements[fused_index] = []
+            fused_counts[scopeID] = fused_counts.get(scopeID, 0) + len(use_indexes)
+        for (_, counter) in temp_slot_ranges:
+            setattr(scope, counter, max(getattr(scope, counter), frame_sizes[counter]))
+    replace_quadruples(compilation_results, replacements)
+    return fused_counts
+
+'''
+collapse_goto_chains function
+Makes every jump that lands on a goto jump straight to the final target of the chain of gotos.
+'''
+def collapse_goto_chains(quadruples: list[Quadruple]) -> None:
+    for quadruple in quadruples:
+        operation = operation_names[quadruple.op_code]
+        if operation != 'goto' and operation not in conditional_jump_operations:
+            continue
+        visited = set()
+        target = quadruple.result
+        while operation_names[quadruples[target].op_code] == 'goto' and target not in visited:
+            visited.add(target)
+            target = quadruples[target].result
+        quadruple.result = target
+
+'''
+find_unreachable_quadruples function
+Walks the quadruples that can execute starting from the first one, and returns the indexes of the rest. Functions that are never called are
+unreachable as a whole, so their start is cleared.
+'''
+def find_unreachable_quadruples(compilation_results: CompilationResults) -> set[int]:
+    quadruples = compilation_results.quadruples
+    reachable = set()
+    pending = [0]
+    while pending:
+        index = pending.pop()
+        if index in reachable:
+            continue
+        reachable.add(index)
+        pending.extend(get_successors(quadruples, index))
+    unreachable = set(range(len(quadruples))) - reachable
+    for scope in compilation_results.func_dir.get_func_dir().values():
+        if scope.starts_at in unreachable:
+            scope.starts_at = -1
+    return unreachable
+
+'''
+find_redundant_copies function
+A function call that returns a value copies it into a temporal, which an assignment copies again into a variable. When the temporal is used
+nowhere else, the first copy is made to store directly into the final destination and the second copy is removed.
+'''
+def find_redundant_copies(quadruples: list[Quadruple]) -> set[int]:
+    uses = count_address_uses(quadruples)
+    jump_targets = get_jump_targets(quadruples)
+    removed = set()
+    for index in range(len(quadruples) - 1):
+        first_copy = quadruples[index]
+        second_copy = quadruples[index + 1]
+        if index in removed or operation_names[first_copy.op_code] != '=' or operation_names[second_copy.op_code] != '=':
+            continue
+        temp_address = first_copy.result
+        if second_copy.operator1 == temp_address and is_temp_address(temp_address) and uses[temp_address] == 2 and index + 1 not in jump_targets:
+            first_copy.result = second_copy.result
+            removed.add(index + 1)
+    return removed
+
+'''
+peephole_optimize function
+Repeatedly collapses goto chains, removes redundant copies, gotos to the next quadruple and unreachable quadruples until none of them is left.
+Returns the number of removed quadruples.
+'''
+def peephole_optimize(compilation_results: CompilationResults) -> int:
+    removed_count = 0
+    while True:
+        quadruples = compilation_results.quadruples
+        collapse_goto_chains(quadruples)
+        removed = find_redundant_copies(quadruples)
+        removed |= {index for (index, quadruple) in enumerate(quadruples) if operation_names[quadruple.op_code] == 'goto' and quadruple.result == index + 1}
+        removed |= find_unreachable_quadruples(compilation_results)
+        if not removed:
+            return removed_count
+        remove_quadruples(compilation_results, removed)
+        removed_count += len(removed)
+
+'''
+expression_key function
+Returns the operation and operands that identify the value computed by a quadruple, along with the operands whose values it reads.
+'''
+def expression_key(quadruple: Quadruple) -> tuple[tuple, tuple]:
+    operation = operation_names[quadruple.op_code]
+    if operation == 'add_base_address':
+        # The base address is an immediate value, only the displacement is read
+        return ((operation, quadruple.operator1, quadruple.operator2), (quadruple.operator2,))
+    if operation in ('!', 'multiply_displacement'):
+        return ((operation, quadruple.operator1, quadruple.operator2), (quadruple.operator1,))
+    operands = (quadruple.operator1, quadruple.operator2)
+    if operation in commutative_operations:
+        operands = tuple(sorted(operands))
+    return ((operation,) + operands, operands)
+
+'''
+invalidate_expressions function
+Forgets the expressions that read an address that was just written or are held by it. Storing a value through a pointer, or into a variable that
+may be an array element, also forgets every expression that reads a value through a pointer.
+'''
+def invalidate_expressions(available: dict, verified: dict, written_address: int, is_memory_write: bool) -> None:
+    for (key, (holder, read_operands)) in list(available.items()):
+        if holder == written_address or written_address in read_operands or (is_memory_write and any(is_pointer_address(operand) for operand in read_operands)):
+            del available[key]
+    for key in list(verified):
+        index_to_verify = key[0]
+        if index_to_verify == written_address or (is_memory_write and is_pointer_address(index_to_verify)):
+            del verified[key]
+
+'''
+eliminate_common_subexpressions function
+Local common-subexpression elimination over extended basic blocks. A quadruple that is not a jump target can only be reached from the one before
+it, so the expressions available there stay available. When an arithmetic, logical, relational or array addressing quadruple computes an
+expression that a temporal or pointer already holds, its result is renamed to that holder everywhere in the function and the quadruple is
+removed. Repeated bounds checks of an index that kept its value are removed as well. Only temporals and pointers assigned once in the function
+are renamed, so the holder keeps its value on every later use. Returns the quadruples and temporals saved in every function.
+'''
+def eliminate_common_subexpressions(compilation_results: CompilationResults) -> dict[str, tuple[int, int]]:
+    quadruples = compilation_results.quadruples
+    jump_targets = get_jump_targets(quadruples)
+    removed = set()
+    savings = {}
+    for (scopeID, start, end) in get_function_ranges(compilation_results):
+        assignments = count_assignments(quadruples[start:end])
+        renamed = {}
+        # Expression key -> (temporal holding its value, operands it reads)
+        available = {}
+        # Bounds checks already done -> None
+        verified = {}
+        removed_before = len(removed)
+        for index in range(start, end):
+            if index in jump_targets:
+                available.clear()
+                verified.clear()
+            quadruple = quadruples[index]
+            rename_addresses(quadruple, renamed)
+            operation = operation_names[quadruple.op_code]
+            result = quadruple.result
+            if operation == 'verify':
+                key = (quadruple.operator1, quadruple.operator2, result)
+                if key in verified:
+                    removed.add(index)
+                else:
+                    verified[key] = None
+            elif operation in expression_operations and (operation == 'add_base_address' or not is_pointer_address(result)):
+                (key, read_operands) = expression_key(quadruple)
+                if key in available and assignments.get(result) == 1:
+                    renamed[result] = available[key][0]
+                    removed.add(index)
+                    continue
+                invalidate_expressions(available, verified, result, is_memory_write=not is_temp_address(result) and not is_pointer_address(result))
+                if assignments.get(result) == 1 and (is_temp_address(result) or is_pointer_address(result)) and result not in read_operands:
+                    available[key] = (result, read_operands)
+            elif operation == 'gosub':
+                # The called function may change any global variable or array
+                available.clear()
+                verified.clear()
+            elif operation in value_writing_operations:
+                invalidate_expressions(available, verified, result, is_memory_write=not is_temp_address(result))
+        # Uses of a renamed temporal that come before its holder in the quadruple list are renamed too
+        for index in range(start, end):
+            rename_addresses(quadruples[index], renamed)
+        savings[scopeID] = (len(removed) - removed_before, len(renamed))
+    remove_quadruples(compilation_results, removed)
+    return savings
+
+'''
+find_loops function
+Returns the (header, back edge) of every loop in the [start, end) range, from the innermost to the outermost. Loops are closed by the goto back to
+their header generated at the end of every while and for.
+'''
+def find_loops(quadruples: list[Quadruple], start: int, end: int) -> list[tuple[int, int]]:
+    back_edges = {}
+    for index in range(start, end):
+        quadruple = quadruples[index]
+        if operation_names[quadruple.op_code] == 'goto' and quadruple.result <= index and quadruple.result >= start:
+            back_edges[quadruple.result] = index
+    return sorted(back_edges.items(), key=lambda loop: loop[1] - loop[0])
+
+'''
+find_loop_invariants function
+Returns the indexes of the quadruples of a loop that compute the same value on every iteration: expressions stored in a temporal or pointer
+assigned once, whose operands are not assigned inside the loop. Globals are not invariant if the loop calls a function, and values read through
+pointers or array elements are not invariant if the loop stores into arrays or calls a function.
+Quadruples that may raise an error are only hoisted when running them before the loop cannot raise an error the loop would not have raised.
+That holds for the quadruples at the start of the loop that run before any jump or side effect, since they run whenever the loop is reached.
+It also holds for quadruples past that point that are not divisions and only read constants, hoisted values or operands read at the start.
+'''
+def find_loop_invariants(compilation_results: CompilationResults, header: int, back_edge: int, assignments: dict[int, int]) -> list[int]:
+    quadruples = compilation_results.quadruples
+    array_ranges = [(address, address + size - 1) for scope in compilation_results.func_dir.get_func_dir().values() for (address, size) in scope.arrays]
+    is_array_element = lambda virtual_address: any(virtual_address >= range_start and virtual_address <= range_end for (range_start, range_end) in array_ranges)
+    assigned = set()
+    has_call = False
+    has_memory_write = False
+    for index in range(header, back_edge + 1):
+        quadruple = quadruples[index]
+        operation = operation_names[quadruple.op_code]
+        if operation == 'gosub':
+            has_call = True
+        elif operation == 'add_base_address' or (operation in value_writing_operations and not is_pointer_address(quadruple.result)):
+            assigned.add(quadruple.result)
+            has_memory_write = has_memory_write or is_array_element(quadruple.result)
+        elif operation in value_writing_operations:
+            has_memory_write = True
+    # Operands read by the quadruples that run every time the loop is reached, before any jump or side effect
+    entry_reads = set()
+    entry_end = header
+    while entry_end <= back_edge and operation_names[quadruples[entry_end].op_code] in expression_operations | {'='}:
+        entry_reads.update(expression_key(quadruples[entry_end])[1] if operation_names[quadruples[entry_end].op_code] != '=' else (quadruples[entry_end].operator1,))
+        entry_end += 1
+    hoisted = []
+    hoisted_results = set()
+    def is_invariant(virtual_address: int) -> bool:
+        if virtual_address in hoisted_results or is_constant_address(virtual_address):
+            return True
+        if virtual_address in assigned:
+            return False
+        if is_pointer_address(virtual_address) or is_array_element(virtual_address):
+            return not has_memory_write and not has_call
+        return not (has_call and is_global_address(virtual_address))
+    for index in range(header, back_edge + 1):
+        quadruple = quadruples[index]
+        operation = operation_names[quadruple.op_code]
+        result = quadruple.result
+        if operation not in expression_operations or assignments.get(result) != 1 or not (is_temp_address(result) or is_pointer_address(result)):
+            continue
+        if operation != 'add_base_address' and is_pointer_address(result):
+            continue
+        (_, read_operands) = expression_key(quadruple)
+        if result in read_operands or not all(is_invariant(operand) for operand in read_operands):
+            continue
+        if index >= entry_end and (operation == '/' or not all(is_constant_address(operand) or operand in hoisted_results or operand in entry_reads for operand in read_operands)):
+            continue
+        hoisted.append(index)
+        hoisted_results.add(result)
+    return hoisted
+
+'''
+move_to_preheader function
+Moves the given quadruples of a loop right before its header, in their original order. Jumps from outside the loop to its header enter through the
+moved quadruples, while jumps from inside the loop keep skipping them.
+'''
+def move_to_preheader(compilation_results: CompilationResults, header: int, back_edge: int, hoisted: list[int]) -> None:
+    quadruples = compilation_results.quadruples
+    hoisted_indexes = set(hoisted)
+    kept = [index for index in range(header, back_edge + 1) if index not in hoisted_indexes]
+    order = hoisted + kept
+    new_indexes = {old_index: header + position for (position, old_index) in enumerate(order)}
+    # A jump to a moved quadruple lands on the first quadruple that stayed in the loop after it
+    landing = {}
+    next_kept = back_edge
+    for index in range(back_edge, header - 1, -1):
+        if index not in hoisted_indexes:
+            next_kept = index
+        landing[index] = new_indexes[next_kept]
+    quadruples[header:back_edge + 1] = [quadruples[index] for index in order]
+    for (index, quadruple) in enumerate(quadruples):
+        if operation_names[quadruple.op_code] not in jump_operations or quadruple.result < header or quadruple.result > back_edge:
+            continue
+        is_inside_loop = index >= header and index <= back_edge
+        if quadruple.result == header and not is_inside_loop:
+            continue
+        quadruple.result = landing[quadruple.result]
+    for scope in compilation_results.func_dir.get_func_dir().values():
+        if scope.starts_at > header and scope.starts_at <= back_edge:
+            scope.starts_at = landing[scope.starts_at]
+
+'''
+hoist_loop_invariants function
+Loop-invariant code motion. Moves the invariant quadruples of every loop into a preheader, from the innermost loops to the outermost ones, so a
+value hoisted out of an inner loop may be hoisted again out of the loop around it. Returns the number of hoisted quadruples in every function.
+'''
+def hoist_loop_invariants(compilation_results: CompilationResults) -> dict[str, int]:
+    hoisted_count = {}
+    is_changed = True
+    while is_changed:
+        is_changed = False
+        for (scopeID, start, end) in get_function_ranges(compilation_results):
+            assignments = count_assignments(compilation_results.quadruples[start:end])
+            for (header, back_edge) in find_loops(compilation_results.quadruples, start, end):
+                hoisted = find_loop_invariants(compilation_results, header, back_edge, assignments)
+                if hoisted:
+                    move_to_preheader(compilation_results, header, back_edge, hoisted)
+                    hoisted_count[scopeID] = hoisted_count.get(scopeID, 0) + len(hoisted)
+                    is_changed = True
+                    break
+            if is_changed:
+                break
+    return hoisted_count
+
+'''
+is_int_address function
+Tells whether a virtual address holds an int global, constant, local or temporal. The int segments are contiguous.
+'''
+def is_int_address(virtual_address: int) -> bool:
+    return isinstance(virtual_address, int) and virtual_address >= VirtualMemory.global_int_range[0] and virtual_address <= VirtualMemory.temp_int_range[1]
+
+def add_ranges(left_range: tuple, right_range: tuple) -> tuple:
+    return (left_range[0] + right_range[0], left_range[1] + right_range[1])
+
+def subtract_ranges(left_range: tuple, right_range: tuple) -> tuple:
+    return (left_range[0] - right_range[1], left_range[1] - right_range[0])
+
+def multiply_ranges(left_range: tuple, right_range: tuple) -> tuple:
+    # Zero times an unbounded end is zero, not nan
+    products = [0 if left_bound == 0 or right_bound == 0 else left_bound * right_bound for left_bound in left_range for right_bound in right_range]
+    return (min(products), max(products))
+
+# Interval arithmetic of the int operations whose result range can be derived from the ranges of their operands
+range_operations = {
+    '+': add_ranges,
+    '-': subtract_ranges,
+    '*': multiply_ranges,
+}
+
+# Relational operation that holds when the given one does not hold
+negated_comparisons = {
+    '<': '>=',
+    '<=': '>',
+    '>': '<=',
+    '>=': '<',
+    '==': '!=',
+    '!=': '==',
+}
+
+# Relational operation that holds when a fused jump jumps
+fused_jump_comparisons = {
+    'jlt': '<',
+    'jle': '<=',
+    'jgt': '>',
+    'jge': '>=',
+    'jeq': '==',
+    'jne': '!=',
+}
+
+unbounded_range = (-math.inf, math.inf)
+
+# Times the range analysis may reach a loop header before it widens every range on it
+max_loop_visits = 16
+
+'''
+RangeAnalysis class
+Forward interval analysis of the int values of one function. The state before every quadruple maps int variables and temporals to the
+(lowest, highest) values they may hold, where addresses that are not mapped may hold any value, and bool temporals to the comparison of two int
+operands they hold. Conditional jumps narrow the ranges of the compared operands on each of their branches, so the induction variable of a loop
+gets bounded by its condition inside the body. Loop headers are widened to make the analysis finish, and a few descending passes then recover the
+bounds lost by widening. Int values are assumed to be integers, except the result of a division, which is never bounded.
+'''
+class RangeAnalysis():
+    def __init__(self, compilation_results: CompilationResults, scopeID: str, start: int, end: int) -> None:
+        self.quadruples = compilation_results.quadruples
+        self.consts_table = compilation_results.consts_table
+        self.start = start
+        self.end = end
+        # Local addresses of other functions overlap the ones of this function, so only its own arrays and the global ones are excluded
+        self.array_ranges = [(address, address + size - 1) for scope in (compilation_results.func_dir.get_scope(scopeID), compilation_results.func_dir.get_scope('global')) for (address, size) in scope.arrays]
+        # Quadruples reached by a jump from a later quadruple, where loops are closed, and the addresses written inside each loop. Only those
+        # are widened, so the bounds of the variables of an outer loop are kept on the header of an inner loop
+        self.loop_writes : dict[int, set[int]] = {}
+        for index in range(start, end):
+            quadruple = self.quadruples[index]
+            if operation_names[quadruple.op_code] in jump_operations - {'gosub'} and quadruple.result <= index and quadruple.result >= start:
+                self.loop_writes[quadruple.result] = set(count_assignments(self.quadruples[quadruple.result:index + 1])) | self.loop_writes.get(quadruple.result, set())
+        self.header_visits : dict[int, int] = {}
+        # Index -> (ranges, comparisons) before the quadruple, or None while it has not been reached
+        self.states : dict[int, tuple[dict, dict]] = {}
+
+    def is_tracked(self, virtual_address: int) -> bool:
+        return is_int_address(virtual_address) and not is_constant_address(virtual_address) and not any(virtual_address >= range_start and virtual_address <= range_end for (range_start, range_end) in self.array_ranges)
+
+    def get_range(self, ranges: dict, virtual_address: int) -> tuple:
+        if is_int_address(virtual_address) and is_constant_address(virtual_address):
+            (_, value) = self.consts_table.lookup_address(virtual_address)
+            return (value, value) if isinstance(value, int) else unbounded_range
+        return ranges.get(virtual_address, unbounded_range)
+
+    def set_range(self, ranges: dict, virtual_address: int, value_range: tuple) -> None:
+        if value_range == unbounded_range:
+            ranges.pop(virtual_address, None)
+        else:
+            ranges[virtual_address] = value_range
+
+    '''
+    transfer method
+    Returns the state after the quadruple at the given index runs, given the state before it.
+    '''
+    def transfer(self, index: int, state: tuple[dict, dict]) -> tuple[dict, dict]:
+        (ranges, comparisons) = (dict(state[0]), dict(state[1]))
+        quadruple = self.quadruples[index]
+        operation = operation_names[quadruple.op_code]
+        result = quadruple.result
+        if operation == 'gosub':
+            # The called function may change any global variable
+            for virtual_address in [virtual_address for virtual_address in ranges if is_global_address(virtual_address)]:
+                del ranges[virtual_address]
+            comparisons = {holder: comparison for (holder, comparison) in comparisons.items() if not any(is_global_address(operand) for operand in comparison[1:])}
+            return (ranges, comparisons)
+        if operation != 'multiply_displacement' and (operation not in value_writing_operations or is_pointer_address(result)):
+            return (ranges, comparisons)
+        # The written address no longer holds the comparisons it held or was compared in
+        comparisons = {holder: comparison for (holder, comparison) in comparisons.items() if holder != result and result not in comparison[1:]}
+        if not self.is_tracked(result):
+            if operation in negated_comparisons and self.is_comparable(quadruple.operator1) and self.is_comparable(quadruple.operator2):
+                comparisons[result] = (operation, quadruple.operator1, quadruple.operator2)
+            return (ranges, comparisons)
+        if operation in range_operations:
+            value_range = range_operations[operation](self.get_range(ranges, quadruple.operator1), self.get_range(ranges, quadruple.operator2))
+        elif operation == 'multiply_displacement':
+            value_range = multiply_ranges(self.get_range(ranges, quadruple.operator1), (quadruple.operator2, quadruple.operator2))
+        elif operation == '=' and is_int_address(quadruple.operator1) and not is_pointer_address(quadruple.operator1):
+            value_range = self.get_range(ranges, quadruple.operator1)
+        else:
+            value_range = unbounded_range
+        self.set_range(ranges, result, value_range)
+        return (ranges, comparisons)
+
+    def is_comparable(self, virtual_address: int) -> bool:
+        return self.is_tracked(virtual_address) or (is_int_address(virtual_address) and is_constant_address(virtual_address))
+
+    '''
+    narrow method
+    Returns the ranges under which the comparison holds, or None when it can never hold.
+    '''
+    def narrow(self, ranges: dict, comparison: str, left_operand: int, right_operand: int) -> Union[dict, None]:
+        if comparison in ('>', '>='):
+            return self.narrow(ranges, '<' if comparison == '>' else '<=', right_operand, left_operand)
+        (left_range, right_range) = (self.get_range(ranges, left_operand), self.get_range(ranges, right_operand))
+        if comparison == '<':
+            (left_range, right_range) = ((left_range[0], min(left_range[1], right_range[1] - 1)), (max(right_range[0], left_range[0] + 1), right_range[1]))
+        elif comparison == '<=':
+            (left_range, right_range) = ((left_range[0], min(left_range[1], right_range[1])), (max(right_range[0], left_range[0]), right_range[1]))
+        elif comparison == '==':
+            left_range = right_range = (max(left_range[0], right_range[0]), min(left_range[1], right_range[1]))
+        else:
+            # A value different from a single value is only narrowed when that value is one of its ends
+            if right_range[0] == right_range[1]:
+                left_range = (left_range[0] + (left_range[0] == right_range[0]), left_range[1] - (left_range[1] == right_range[0]))
+            if left_range[0] == left_range[1]:
+                right_range = (right_range[0] + (right_range[0] == left_range[0]), right_range[1] - (right_range[1] == left_range[0]))
+        if left_range[0] > left_range[1] or right_range[0] > right_range[1]:
+            return None
+        ranges = dict(ranges)
+        for (virtual_address, value_range) in ((left_operand, left_range), (right_operand, right_range)):
+            if self.is_tracked(virtual_address):
+                self.set_range(ranges, virtual_address, value_range)
+        return ranges
+
+    '''
+    get_branches method
+    Returns the (successor, state) pairs that leave the quadruple at the given index. Calls continue on the next quadruple, and conditional jumps
+    narrow the ranges with the comparison that holds on each branch. Branches that can never be taken are left out.
+    '''
+    def get_branches(self, index: int, state: tuple[dict, dict]) -> list[tuple[int, tuple[dict, dict]]]:
+        quadruple = self.quadruples[index]
+        operation = operation_names[quadruple.op_code]
+        state_after = self.transfer(index, state)
+        if operation == 'gosub':
+            successors = [index + 1]
+        else:
+            successors = get_successors(self.quadruples, index)
+        successors = [successor for successor in successors if successor >= self.start and successor < self.end]
+        if operation in fused_jump_comparisons:
+            jump_comparison = (fused_jump_comparisons[operation], quadruple.operator1, quadruple.operator2)
+        elif operation in ('gotot', 'gotof') and quadruple.operator1 in state[1]:
+            jump_comparison = state[1][quadruple.operator1]
+            if operation == 'gotof':
+                jump_comparison = (negated_comparisons[jump_comparison[0]],) + jump_comparison[1:]
+        else:
+            return [(successor, state_after) for successor in successors]
+        if not self.is_comparable(jump_comparison[1]) or not self.is_comparable(jump_comparison[2]):
+            return [(successor, state_after) for successor in successors]
+        branches = []
+        for successor in successors:
+            if successor == quadruple.result:
+                comparison = jump_comparison
+            else:
+                comparison = (negated_comparisons[jump_comparison[0]],) + jump_comparison[1:]
+            ranges = self.narrow(state_after[0], *comparison)
+            if ranges is not None:
+                branches.append((successor, (ranges, state_after[1])))
+        return branches
+
+    def join(self, state: tuple[dict, dict], other_state: tuple[dict, dict], widened: Union[set[int], None] = None) -> tuple[dict, dict]:
+        ranges = {}
+        for (virtual_address, value_range) in state[0].items():
+            if virtual_address not in other_state[0]:
+                continue
+            other_range = other_state[0][virtual_address]
+            if widened is not None and virtual_address in widened:
+                # Ends that keep moving are dropped, so every range can only change a finite number of times
+                joined_range = (value_range[0] if other_range[0] >= value_range[0] else -math.inf, value_range[1] if other_range[1] <= value_range[1] else math.inf)
+            else:
+                joined_range = (min(value_range[0], other_range[0]), max(value_range[1], other_range[1]))
+            self.set_range(ranges, virtual_address, joined_range)
+        comparisons = {holder: comparison for (holder, comparison) in state[1].items() if other_state[1].get(holder) == comparison}
+        return (ranges, comparisons)
+
+    '''
+    analyze method
+    Computes the state before every reachable quadruple of the function.
+    '''
+    def analyze(self, narrowing_passes: int = 2) -> dict[int, tuple[dict, dict]]:
+        self.states = {self.start: ({}, {})}
+        pending = [self.start]
+        while pending:
+            index = pending.pop()
+            for (successor, state) in self.get_branches(index, self.states[index]):
+                if successor not in self.states:
+                    self.states[successor] = state
+                    pending.append(successor)
+                    continue
+                joined_state = self.join(self.states[successor], state)
+                if successor in self.loop_writes:
+                    # A header that keeps changing widens every address, so the analysis always finishes
+                    self.header_visits[successor] = self.header_visits.get(successor, 0) + 1
+                    widened = self.loop_writes[successor] if self.header_visits[successor] <= max_loop_visits else set(self.states[successor][0])
+                    joined_state = self.join(self.states[successor], joined_state, widened)
+                if joined_state != self.states[successor]:
+                    self.states[successor] = joined_state
+                    pending.append(successor)
+        # Every descending pass recomputes the states from the previous ones without widening, which keeps them sound
+        for _ in range(narrowing_passes):
+            states = {self.start: ({}, {})}
+            for index in sorted(self.states):
+                for (successor, state) in self.get_branches(index, self.states[index]):
+                    states[successor] = self.join(states[successor], state) if successor in states else state
+            self.states = states
+        return self.states
+
+'''
+eliminate_bounds_checks function
+Removes the bounds checks whose index is proven to be within the bounds of the array by the range analysis of its function, such as the index
+of a for loop that is compared against the size of the array it walks. Returns the number of removed checks in every function.
+'''
+def eliminate_bounds_checks(compilation_results: CompilationResults) -> dict[str, int]:
+    quadruples = compilation_results.quadruples
+    removed = set()
+    removed_count = {}
+    for (scopeID, start, end) in get_function_ranges(compilation_results):
+        range_analysis = RangeAnalysis(compilation_results, scopeID, start, end)
+        states = range_analysis.analyze()
+        for index in range(start, end):
+            quadruple = quadruples[index]
+            if operation_names[quadruple.op_code] != 'verify' or index not in states:
+                continue
+            (lowest, highest) = range_analysis.get_range(states[index][0], quadruple.operator1)
+            if lowest >= quadruple.operator2 and highest < quadruple.result:
+                removed.add(index)
+                removed_count[scopeID] = removed_count.get(scopeID, 0) + 1
+    remove_quadruples(compilation_results, removed)
+    return removed_count
+
+# Virtual address ranges of every kind of temporal, with the function directory counter that sizes its store on every activation record
+temp_slot_ranges = [
+    (VirtualMemory.temp_int_range, 'num_temps_int'),
+    (VirtualMemory.temp_float_range, 'num_temps_float'),
+    (VirtualMemory.temp_char_range, 'num_temps_char'),
+    (VirtualMemory.temp_bool_range, 'num_temps_bool'),
+    (VirtualMemory.temp_pointer_range, 'num_pointer_temps'),
+]
+
+def get_temp_slot_range(virtual_address: int) -> Union[tuple[list[int], str], None]:
+    if not isinstance(virtual_address, int):
+        return None
+    for (temp_range, counter) in temp_slot_ranges:
+        if virtual_address >= temp_range[0] and virtual_address <= temp_range[1]:
+            return (temp_range, counter)
+    return None
+
+'''
+get_temp_reads_and_write function
+Returns the temporals read by a quadruple and the temporal it writes, if any. Storing through a pointer reads the pointer.
+'''
+def get_temp_reads_and_write(quadruple: Quadruple) -> tuple[set[int], Union[int, None]]:
+    operation = operation_names[quadruple.op_code]
+    reads = set()
+    written = None
+    for field in address_operands[operation]:
+        operand = getattr(quadruple, field)
+        if field == 'result' and (operation == 'add_base_address' or (operation in value_writing_operations and not is_pointer_address(operand))):
+            written = operand if get_temp_slot_range(operand) else None
+            continue
+        reads.update(virtual_address for virtual_address in (operand if isinstance(operand, list) else [operand]) if get_temp_slot_range(virtual_address))
+    return (reads, written)
+
+'''
+find_live_temps function
+Backward liveness analysis of the temporals of the function in the [start, end) range. Returns the temporals that are live after every quadruple,
+and the ones live when the function starts. A call continues on the next quadruple, since the called function runs on its own activation record.
+'''
+def find_live_temps(quadruples: list[Quadruple], start: int, end: int) -> tuple[dict[int, set[int]], set[int]]:
+    accesses = {index: get_temp_reads_and_write(quadruples[index]) for index in range(start, end)}
+    successors = {}
+    for index in range(start, end):
+        next_indexes = [index + 1] if operation_names[quadruples[index].op_code] == 'gosub' else get_successors(quadruples, index)
+        successors[index] = [successor for successor in next_indexes if successor >= start and successor < end]
+    live_in = {index: set() for index in range(start, end)}
+    live_out = {index: set() for index in range(start, end)}
+    is_changed = True
+    while is_changed:
+        is_changed = False
+        for index in range(end - 1, start - 1, -1):
+            live_out[index] = set().union(*(live_in[successor] for successor in successors[index]))
+            (reads, written) = accesses[index]
+            new_live_in = reads | (live_out[index] - {written})
+            if new_live_in != live_in[index]:
+                live_in[index] = new_live_in
+                is_changed = True
+    return (live_out, live_in[start] if end > start else set())
+
+'''
+reuse_temp_slots function
+Temporals get a new address for every expression of a function, so its activation records hold one slot for each of them. This pass finds the
+temporals that are never live at the same time and gives them the same slot, rewriting the quadruples and the temporal counters of every function.
+It runs last, since the other passes rely on temporals being written once. Returns the (previous, new) number of temporal slots of every function.
+'''
+def reuse_temp_slots(compilation_results: CompilationResults) -> dict[str, tuple[int, int]]:
+    quadruples = compilation_results.quadruples
+    slot_counts = {}
+    for (scopeID, start, end) in get_function_ranges(compilation_results):
+        scope = compilation_results.func_dir.get_scope(scopeID)
+        (live_out, live_on_entry) = find_live_temps(quadruples, start, end)
+        # Temporal -> temporals it may not share a slot with, in order of first appearance
+        interferences : dict[int, set[int]] = {}
+        for index in range(start, end):
+            (reads, written) = get_temp_reads_and_write(quadruples[index])
+            for virtual_address in sorted(reads) + ([written] if written is not None else []):
+                interferences.setdefault(virtual_address, set())
+            if written is not None:
+                for live_address in live_out[index] - {written}:
+                    interferences[written].add(live_address)
+                    interferences.setdefault(live_address, set()).add(written)
+        # Temporals live when the function starts may be read before any write, so they never share their slot
+        for entry_address in live_on_entry:
+            interferences[entry_address] |= set(interferences) - {entry_address}
+            for virtual_address in interferences[entry_address]:
+                interferences[virtual_address].add(entry_address)
+        # Greedy coloring: every temporal takes the lowest slot of its kind that no interfering temporal holds
+        renamed = {}
+        slots_used = {counter: 0 for (_, counter) in temp_slot_ranges}
+        for (virtual_address, neighbours) in interferences.items():
+            (temp_range, counter) = get_temp_slot_range(virtual_address)
+            taken = {renamed[neighbour] for neighbour in neighbours if neighbour in renamed}
+            slot_address = temp_range[0]
+            while slot_address in taken:
+                slot_address += 1
+            renamed[virtual_address] = slot_address
+            slots_used[counter] = max(slots_used[counter], slot_address - temp_range[0] + 1)
+        for index in range(start, end):
+            rename_addresses(quadruples[index], renamed)
+        previous_count = sum(getattr(scope, counter) for (_, counter) in temp_slot_ranges)
+        for (counter, slot_count) in slots_used.items():
+            setattr(scope, counter, slot_count)
+        slot_counts[scopeID] = (previous_count, sum(slots_used.values()))
+    return slot_counts
+
+# Virtual address ranges of every kind of local variable, with the function directory counter that sizes its store on every activation record
+local_slot_ranges = [
+    (VirtualMemory.local_int_range, 'num_vars_int'),
+    (VirtualMemory.local_float_range, 'num_vars_float'),
+    (VirtualMemory.local_char_range, 'num_vars_char'),
+    (VirtualMemory.local_bool_range, 'num_vars_bool'),
+]
+
+# Every kind of address that lives on the activation record of a function
+frame_slot_ranges = local_slot_ranges + temp_slot_ranges
+
+def get_frame_slot_range(virtual_address: int) -> Union[tuple[list[int], str], None]:
+    if not isinstance(virtual_address, int):
+        return None
+    for (slot_range, counter) in frame_slot_ranges:
+        if virtual_address >= slot_range[0] and virtual_address <= slot_range[1]:
+            return (slot_range, counter)
+    return None
+
+def is_local_address(virtual_address: int) -> bool:
+    return any(virtual_address >= slot_range[0] and virtual_address <= slot_range[1] for (slot_range, _) in local_slot_ranges)
+
+# Fields of a quadruple that hold addresses of the activation record of the function it belongs to. Parameters are written into the activation
+# record of the function being called
+def get_frame_fields(quadruple: Quadruple) -> tuple[str, ...]:
+    operation = operation_names[quadruple.op_code]
+    return ('operator1',) if operation == 'parameter' else address_operands[operation]
+
+def get_frame_addresses(quadruple: Quadruple) -> set[int]:
+    addresses = set()
+    for field in get_frame_fields(quadruple):
+        operand = getattr(quadruple, field)
+        addresses.update(virtual_address for virtual_address in (operand if isinstance(operand, list) else [operand]) if get_frame_slot_range(virtual_address))
+    return addresses
+
+# Number of parameters of every type indicator kept on each local store
+def count_param_slots(params_list: list[str]) -> dict[str, int]:
+    param_slots = {}
+    for param in params_list:
+        counter = local_slot_ranges[FrameLayout.param_stores[param]][1]
+        param_slots[counter] = param_slots.get(counter, 0) + 1
+    return param_slots
+
+'''
+get_frame_slot_sizes function
+Returns the number of slots of every kind the activation records of a function take. It covers both the function directory counters, which
+parameters are not part of, and every address used by the quadruples of the function in the [start, end) range.
+'''
+def get_frame_slot_sizes(quadruples: list[Quadruple], scope: FuncDirEntry, start: int, end: int) -> dict[str, int]:
+    sizes = {counter: getattr(scope, counter) for (_, counter) in frame_slot_ranges}
+    for (counter, param_count) in count_param_slots(scope.params_list).items():
+        sizes[counter] += param_count
+    for index in range(start, end):
+        for virtual_address in get_frame_addresses(quadruples[index]):
+            (slot_range, counter) = get_frame_slot_range(virtual_address)
+            sizes[counter] = max(sizes[counter], virtual_address - slot_range[0] + 1)
+    return sizes
+
+def get_local_reads_and_write(quadruple: Quadruple) -> tuple[set[int], Union[int, None]]:
+    operation = operation_names[quadruple.op_code]
+    reads = set()
+    written = None
+    for field in get_frame_fields(quadruple):
+        operand = getattr(quadruple, field)
+        if field == 'result' and (operation == 'add_base_address' or (operation in value_writing_operations and not is_pointer_address(operand))):
+            written = operand if is_local_address(operand) else None
+            continue
+        reads.update(virtual_address for virtual_address in (operand if isinstance(operand, list) else [operand]) if is_local_address(virtual_address))
+    return (reads, written)
+
+def get_function_successors(quadruples: list[Quadruple], index: int, start: int, end: int) -> list[int]:
+    # A call continues on the next quadruple, since the called function runs on its own activation record
+    next_indexes = [index + 1] if operation_names[quadruples[index].op_code] == 'gosub' else get_successors(quadruples, index)
+    return [successor for successor in next_indexes if successor >= start and successor < end]
+
+'''
+reads_uninitialized_locals function
+Forward analysis of the local variables that are assigned on every path to each quadruple of the function in the [start, end) range, starting with
+its parameters. Returns whether any quadruple may read a local variable before it is assigned, which raises an error when the function is called
+and would silently read a stale value once its variables are kept on the activation record of its caller.
+'''
+def reads_uninitialized_locals(quadruples: list[Quadruple], scope: FuncDirEntry, start: int, end: int) -> bool:
+    accesses = {index: get_local_reads_and_write(quadruples[index]) for index in range(start, end)}
+    local_addresses = set().union(*(reads | {written} for (reads, written) in accesses.values())) - {None}
+    assigned = {index: set(local_addresses) for index in range(start, end)}
+    assigned[start] = {scope.get_param_address(param_index) for param_index in range(len(scope.params_list))}
+    is_changed = True
+    while is_changed:
+        is_changed = False
+        for index in range(start, end):
+            written = accesses[index][1]
+            assigned_after = assigned[index] | ({written} if written is not None else set())
+            for successor in get_function_successors(quadruples, index, start, end):
+                new_assigned = assigned[successor] & assigned_after
+                if new_assigned != assigned[successor]:
+                    assigned[successor] = new_assigned
+                    is_changed = True
+    return any(reads - assigned[index] for (index, (reads, _)) in accesses.items())
+
+'''
+find_recursive_functions function
+Returns the functions that may call themselves, directly or through other functions of the call graph.
+'''
+def find_recursive_functions(compilation_results: CompilationResults) -> set[str]:
+    quadruples = compilation_results.quadruples
+    calls = {}
+    for (scopeID, start, end) in get_function_ranges(compilation_results):
+        calls[scopeID] = {quadruples[index].result for index in range(start, end) if operation_names[quadruples[index].op_code] == 'era'}
+    recursive = set()
+    for (scopeID, callees) in calls.items():
+        pending = list(callees)
+        visited = set()
+        while pending:
+            callee = pending.pop()
+            if callee == scopeID:
+                recursive.add(scopeID)
+                break
+            if callee not in visited:
+                visited.add(callee)
+                pending.extend(calls.get(callee, ()))
+    return recursive
+
+'''
+find_inlining_candidates function
+Returns the functions whose calls can be replaced by a copy of their quadruples: functions of at most the given number of quadruples that are not
+recursive, declare no arrays, keep every parameter on their activation record and never read a local variable before assigning it. Functions are
+inlined from the leaves of the call graph up, so a function that calls another candidate waits until that call has been inlined.
+'''
+def find_inlining_candidates(compilation_results: CompilationResults, threshold: int) -> set[str]:
+    quadruples = compilation_results.quadruples
+    recursive = find_recursive_functions(compilation_results)
+    candidate_callees = {}
+    for (scopeID, start, end) in get_function_ranges(compilation_results):
+        scope = compilation_results.func_dir.get_scope(scopeID)
+        if scopeID == 'main' or scopeID in recursive or end - start > threshold or scope.arrays:
+            continue
+        if any(get_frame_slot_range(scope.get_param_address(param_index)) is None for param_index in range(len(scope.params_list))):
+            continue
+        if reads_uninitialized_locals(quadruples, scope, start, end):
+            continue
+        candidate_callees[scopeID] = {quadruples[index].result for index in range(start, end) if operation_names[quadruples[index].op_code] == 'era'}
+    return {scopeID for (scopeID, callees) in candidate_callees.items() if not callees & candidate_callees.keys()}
+
+'''
+get_forwarded_return_address function
+The value returned by a function is stored on a global variable, which the caller copies into a temporal right after the gosub. When the function
+has a single return that every path goes through, and that global variable is only read by those copies, inlined calls may store the returned
+value straight into the temporal of the copy. Returns the address of that global variable in that case, or None.
+'''
+def get_forwarded_return_address(quadruples: list[Quadruple], scopeID: str, start: int, end: int) -> Union[int, None]:
+    returns = [index for index in range(start, end) if operation_names[quadruples[index].op_code] == 'return']
+    if len(returns) != 1:
+        return None
+    reachable = set()
+    pending = [start]
+    while pending:
+        index = pending.pop()
+        if index not in reachable:
+            reachable.add(index)
+            pending.extend(get_function_successors(quadruples, index, start, end))
+    # The last endfunc of a function is only reached when it ends without returning a value
+    if end - 1 in reachable:
+        return None
+    return_address = quadruples[returns[0]].result
+    for (index, quadruple) in enumerate(quadruples):
+        operation = operation_names[quadruple.op_code]
+        if operation == 'return' or return_address not in count_address_uses([quadruple]):
+            continue
+        previous = quadruples[index - 1]
+        if operation != '=' or operation_names[previous.op_code] != 'gosub' or previous.operator1 != scopeID:
+            return None
+    return return_address
+
+'''
+allocate_inlined_slots function
+Gives every local variable, parameter and temporal of the function in the [start, end) range a new slot on the activation records of the caller,
+whose slot sizes are updated. Returns the renamed addresses, or None when the stores of the caller have no room left for them.
+'''
+def allocate_inlined_slots(quadruples: list[Quadruple], caller_sizes: dict[str, int], callee_scope: FuncDirEntry, start: int, end: int) -> Union[dict[int, int], None]:
+    used = {callee_scope.get_param_address(param_index) for param_index in range(len(callee_scope.params_list))}
+    for index in range(start, end):
+        used |= get_frame_addresses(quadruples[index])
+    renamed = {}
+    new_sizes = dict(caller_sizes)
+    for virtual_address in sorted(used):
+        (slot_range, counter) = get_frame_slot_range(virtual_address)
+        renamed[virtual_address] = slot_range[0] + new_sizes[counter]
+        new_sizes[counter] += 1
+        if renamed[virtual_address] > slot_range[1]:
+            return None
+    caller_sizes.update(new_sizes)
+    return renamed
+
+'''
+inline_calls function
+Replaces every call to the given functions by a copy of their quadruples, working on the caller's activation record. Arguments are copied into the
+slots given to the parameters, returns store into the global variable of the function (or straight into the temporal the caller copies it into)
+and every endfunc jumps to the quadruple that follows the call. Returns the number of inlined calls of every caller.
+'''
+def inline_calls(compilation_results: CompilationResults, inlined_functions: set[str]) -> dict[str, int]:
+    quadruples = compilation_results.quadruples
+    func_dir = compilation_results.func_dir
+    function_ranges = get_function_ranges(compilation_results)
+    bodies = {scopeID: (start, end) for (scopeID, start, end) in function_ranges}
+    frame_sizes = {scopeID: get_frame_slot_sizes(quadruples, func_dir.get_scope(scopeID), start, end) for (scopeID, start, end) in function_ranges}
+    forwarded_returns = {scopeID: get_forwarded_return_address(quadruples, scopeID, *bodies[scopeID]) for scopeID in inlined_functions}
+    new_quadruples = []
+    # Old index -> index of the first new quadruple generated for it
+    new_indexes = []
+    # New quadruples whose jump target is still an old index
+    pending_targets = []
+    # (called function, renamed addresses) of every call whose gosub was not reached yet, or None for calls that are kept
+    pending_calls = []
+    skipped = set()
+    inlined_counts = {}
+    for (scopeID, start, end) in [(None, 0, function_ranges[0][1] if function_ranges else len(quadruples))] + function_ranges:
+        for index in range(start, end):
+            new_indexes.append(len(new_quadruples))
+            if index in skipped:
+                continue
+            quadruple = quadruples[index]
+            operation = operation_names[quadruple.op_code]
+            if operation == 'era':
+                renamed = None
+                if quadruple.result in inlined_functions and scopeID is not None:
+                    callee_scope = func_dir.get_scope(quadruple.result)
+                    renamed = allocate_inlined_slots(quadruples, frame_sizes[scopeID], callee_scope, *bodies[quadruple.result])
+                pending_calls.append(None if renamed is None else (quadruple.result, renamed))
+                if renamed is not None:
+                    continue
+            elif operation == 'parameter' and pending_calls[-1] is not None:
+                renamed = pending_calls[-1][1]
+                new_quadruples.append(Quadruple('=', quadruple.operator1, result=renamed[quadruple.result]))
+                continue
+            elif operation == 'gosub':
+                call = pending_calls.pop()
+                if call is not None:
+                    (callee, renamed) = call
+                    (callee_start, callee_end) = bodies[callee]
+                    destination = None
+                    next_quadruple = quadruples[index + 1] if index + 1 < end else None
+                    if forwarded_returns[callee] is not None and next_quadruple is not None and next_quadruple.operator1 == forwarded_returns[callee]:
+                        destination = next_quadruple.result
+                        skipped.add(index + 1)
+                    # Callee index -> index of its copy. Jumps inside the copy are renumbered once all of it is generated
+                    body_indexes = {}
+                    body_jumps = []
+                    for callee_index in range(callee_start, callee_end):
+                        body_indexes[callee_index] = len(new_quadruples)
+                        callee_quadruple = quadruples[callee_index]
+                        callee_operation = operation_names[callee_quadruple.op_code]
+                        if callee_operation == 'endfunc':
+                            # The last endfunc is followed by the quadruple after the call
+                            if callee_index == callee_end - 1:
+                                continue
+                            copy = Quadruple('goto', result=callee_end)
+                        elif callee_operation == 'return':
+                            copy = Quadruple('=', callee_quadruple.operator1, result=callee_quadruple.result)
+                        else:
+                            copy = Quadruple(callee_operation, callee_quadruple.operator1, callee_quadruple.operator2, callee_quadruple.result)
+                        rename_addresses(copy, renamed, get_frame_fields(copy))
+                        if callee_operation == 'return' and destination is not None:
+                            copy.result = destination
+                        new_quadruples.append(copy)
+                        if callee_operation == 'gosub':
+                            pending_targets.append(len(new_quadruples) - 1)
+                        elif callee_operation in jump_operations or callee_operation == 'endfunc':
+                            body_jumps.append(len(new_quadruples) - 1)
+                    body_indexes[callee_end] = len(new_quadruples)
+                    for position in body_jumps:
+                        new_quadruples[position].result = body_indexes[new_quadruples[position].result]
+                    inlined_counts[scopeID] = inlined_counts.get(scopeID, 0) + 1
+                    continue
+            new_quadruples.append(quadruple)
+            if operation in jump_operations:
+                pending_targets.append(len(new_quadruples) - 1)
+    new_indexes.append(len(new_quadruples))
+    for position in pending_targets:
+        new_quadruples[position].result = new_indexes[new_quadruples[position].result]
+    compilation_results.quadruples = new_quadruples
+    for scope in func_dir.get_func_dir().values():
+        if scope.starts_at >= 0:
+            scope.starts_at = new_indexes[scope.starts_at]
+    # Callers keep the slots of the inlined functions on their activation records
+    for scopeID in inlined_counts:
+        scope = func_dir.get_scope(scopeID)
+        param_slots = count_param_slots(scope.params_list)
+        for (counter, size) in frame_sizes[scopeID].items():
+            setattr(scope, counter, size - param_slots.get(counter, 0))
+    return inlined_counts
+
+'''
+inline_functions function
+Inlines the calls to small functions of at most the given number of quadruples until none of them is left, so a call to a small function that
+calls other small functions ends up as a single copy of all of them. Functions that are no longer called are removed later as unreachable
+quadruples. Returns the number of inlined calls of every caller.
+'''
+def inline_functions(compilation_results: CompilationResults, threshold: int) -> dict[str, int]:
+    inlined_counts = {}
+    while True:
+        candidates = find_inlining_candidates(compilation_results, threshold)
+        round_counts = inline_calls(compilation_results, candidates) if candidates else {}
+        if not round_counts:
+            return inlined_counts
+        for (scopeID, inlined_calls) in round_counts.items():
+            inlined_counts[scopeID] = inlined_counts.get(scopeID, 0) + inlined_calls
+
+# Tells whether the gosub at the given index is followed by the copy of the value returned by the call and the return of that same value
+def is_returning_call_value(quadruples: list[Quadruple], index: int, jump_targets: set[int]) -> bool:
+    if index + 2 >= len(quadruples) or index + 1 in jump_targets or index + 2 in jump_targets:
+        return False
+    (copy, value_return) = quadruples[index + 1:index + 3]
+    return operation_names[copy.op_code] == '=' and operation_names[value_return.op_code] == 'return' \
+        and value_return.operator1 == copy.result and copy.operator1 == value_return.result
+
+'''
+is_tail_call function
+Tells whether the gosub at the given index ends its function: it is followed by an endfunc, possibly through gotos, or by the return of the value
+returned by the call.
+'''
+def is_tail_call(quadruples: list[Quadruple], index: int, jump_targets: set[int]) -> bool:
+    next_index = index + 3 if is_returning_call_value(quadruples, index, jump_targets) else index + 1
+    visited = set()
+    while operation_names[quadruples[next_index].op_code] == 'goto' and next_index not in visited:
+        visited.add(next_index)
+        next_index = quadruples[next_index].result
+    return operation_names[quadruples[next_index].op_code] == 'endfunc'
+
+# Index of the era that opens the call of the gosub at the given index, skipping the calls made while evaluating its arguments
+def find_call_start(quadruples: list[Quadruple], index: int) -> int:
+    depth = 0
+    while True:
+        index -= 1
+        operation = operation_names[quadruples[index].op_code]
+        if operation == 'gosub':
+            depth += 1
+        elif operation == 'era' and depth > 0:
+            depth -= 1
+        elif operation == 'era':
+            return index
+
+'''
+eliminate_tail_calls function
+A function that calls itself right before ending keeps one activation record per pending call. Those self tail calls are lowered into copies of
+the arguments into the parameters of the running activation record and a goto to the start of the function, so tail recursion runs in constant
+frame space. Arguments are copied once every argument has been evaluated. Arguments that a later argument or another parameter copy may change are
+saved into a new temporal first: globals, array elements and the parameters of the function. Functions that declare arrays or may read a local
+variable before assigning it are skipped, since reusing the activation record would let them read the values of the previous call.
+Returns the number of lowered calls of every function.
+'''
+def eliminate_tail_calls(compilation_results: CompilationResults) -> dict[str, int]:
+    quadruples = compilation_results.quadruples
+    jump_targets = get_jump_targets(quadruples)
+    replacements = {}
+    lowered_counts = {}
+    for (scopeID, start, end) in get_function_ranges(compilation_results):
+        scope = compilation_results.func_dir.get_scope(scopeID)
+        param_addresses = [scope.get_param_address(param_index) for param_index in range(len(scope.params_list))]
+        if scopeID == 'main' or scope.arrays or any(get_frame_slot_range(param_address) is None for param_address in param_addresses):
+            continue
+        tail_calls = [index for index in range(start, end) if operation_names[quadruples[index].op_code] == 'gosub' and quadruples[index].operator1 == scopeID
+            and is_tail_call(quadruples, index, jump_targets)]
+        if not tail_calls or reads_uninitialized_locals(quadruples, scope, start, end):
+            continue
+        frame_sizes = get_frame_slot_sizes(quadruples, scope, start, end)
+        for index in tail_calls:
+            call_start = find_call_start(quadruples, index)
+            replacements[call_start] = []
+            arguments = []
+            depth = 0
+            for argument_index in range(call_start + 1, index):
+                quadruple = quadruples[argument_index]
+                operation = operation_names[quadruple.op_code]
+                depth += 1 if operation == 'era' else -1 if operation == 'gosub' else 0
+                if operation != 'parameter' or depth > 0:
+                    continue
+                (argument, param_address) = (quadruple.operator1, quadruple.result)
+                replacements[argument_index] = []
+                if is_global_address(argument) or is_pointer_address(argument) or (argument in param_addresses and argument != param_address):
+                    # Locals and temporals of every type have the same position on their slot ranges
+                    (temp_range, counter) = temp_slot_ranges[local_slot_ranges.index(get_frame_slot_range(param_address))]
+                    saved_argument = temp_range[0] + frame_sizes[counter]
+                    frame_sizes[counter] += 1
+                    replacements[argument_index] = [Quadruple('=', argument, result=saved_argument)]
+                    argument = saved_argument
+                if argument != param_address:
+                    arguments.append(Quadruple('=', argument, result=param_address))
+            replacements[index] = arguments + [Quadruple('goto', result=start)]
+            # The copy of the returned value and its return are left behind by the goto
+            if is_returning_call_value(quadruples, index, jump_targets):
+                replacements[index + 1] = []
+                replacements[index + 2] = []
+        for (_, counter) in temp_slot_ranges:
+            setattr(scope, counter, max(getattr(scope, counter), frame_sizes[counter]))
+        lowered_counts[scopeID] = len(tail_calls)
+    replace_quadruples(compilation_results, replacements)
+    return lowered_counts
+
+# Operations that interact with the console or the game engine, so calling a function that runs them may not be skipped
+side_effect_operations = {'print', 'endprint', 'start', 'update', 'gen_default_canvas', 'gen_canvas', 'set_canvas_title', 'set_canvas_background',
+    'get_window_width', 'get_window_height', 'get_game_event', 'draw_game_object', 'quit_game', 'endprogram'}
+
+'''
+find_pure_functions function
+Finds the functions whose returned value only depends on the values of their arguments, and marks them on the function directory so the backends
+can memoize them. A pure function returns a value, keeps every parameter on its activation record, runs no side effect operation, neither reads
+nor writes globals or global arrays (besides storing the value it returns and copying the values returned by its calls) and only calls pure
+functions. Returns the names of the pure functions.
+'''
+def find_pure_functions(compilation_results: CompilationResults) -> set[str]:
+    quadruples = compilation_results.quadruples
+    func_dir = compilation_results.func_dir
+    calls = {}
+    for (scopeID, start, end) in get_function_ranges(compilation_results):
+        scope = func_dir.get_scope(scopeID)
+        if scopeID == 'main' or scope.type == 'void':
+            continue
+        if any(get_frame_slot_range(scope.get_param_address(param_index)) is None for param_index in range(len(scope.params_list))):
+            continue
+        is_pure = True
+        for index in range(start, end):
+            quadruple = quadruples[index]
+            operation = operation_names[quadruple.op_code]
+            if operation in side_effect_operations or (operation == 'add_base_address' and is_global_address(quadruple.operator1)):
+                is_pure = False
+            elif operation == 'return':
+                is_pure = is_pure and not is_global_address(quadruple.operator1)
+            # The value returned by a call is copied out of the global variable of the called function right after its gosub
+            elif operation == '=' and operation_names[quadruples[index - 1].op_code] == 'gosub':
+                is_pure = is_pure and not is_global_address(quadruple.result)
+            else:
+                is_pure = is_pure and not any(is_global_address(virtual_address) for virtual_address in count_address_uses([quadruple]))
+        if is_pure:
+            calls[scopeID] = {quadruples[index].result for index in range(start, end) if operation_names[quadruples[index].op_code] == 'era'}
+    # Functions that call a function that is not pure are not pure either
+    is_changed = True
+    while is_changed:
+        is_changed = False
+        for (scopeID, callees) in list(calls.items()):
+            if not callees <= calls.keys():
+                del calls[scopeID]
+                is_changed = True
+    for scopeID in calls:
+        func_dir.get_scope(scopeID).is_pure = True
+    return set(calls)
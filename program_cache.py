@@ -0,0 +1,96 @@
+import hashlib
+import marshal
+import os
+import sys
+from typing import Union
+from func_dir import FuncDir
+from quadruple import PACKED_ITEM_SIZE, read_packed_quadruples, pack_quadruples
+from semantic_rules import CompilationResults
+from vars_table import ConstVarsTable, VarsTableEntry
+
+# Modules whose code decides the compilation results of a source file. Changing any of them invalidates every compiled program
+COMPILER_MODULES = ('lexer.py', 'ali_parser.py', 'semantic_rules.py', 'semantic_cube.py', 'vars_table.py', 'func_dir.py', 'virtual_memory.py', 'quadruple.py')
+
+# Size in bytes of the length of the header that starts every .alc file
+HEADER_LENGTH_SIZE = 8
+
+'''
+get_compiler_version function
+Hash of the source of the compiler modules, of the Python version, since the layout of marshal files may change between Python versions, and of the
+byte order and item size of the quadruple columns, which are written as they are in memory.
+'''
+def get_compiler_version() -> str:
+    compiler_hash = hashlib.sha256(f'{sys.implementation.cache_tag} {sys.byteorder} {PACKED_ITEM_SIZE}'.encode())
+    compiler_dir = os.path.dirname(os.path.abspath(__file__))
+    for module in COMPILER_MODULES:
+        with open(os.path.join(compiler_dir, module), 'rb') as module_file:
+            compiler_hash.update(module_file.read())
+    return compiler_hash.hexdigest()
+
+# Key of the compiled program of a source, which only matches the cache of that same source compiled by this same compiler
+def get_source_key(source: str) -> str:
+    return hashlib.sha256((get_compiler_version() + source).encode()).hexdigest()
+
+# The compiled program of an .al file is kept next to it, as an .alc file
+def get_cache_path(filename: str) -> str:
+    return filename + 'c'
+
+'''
+save_compilation_results function
+Writes the quadruples, the constants and the function directory of a program to its .alc file, before any optimization, so every optimization level
+and backend can reuse it. Vars tables are not written, since nothing reads them once the program is compiled. The file starts with the length of a
+marshal header that holds everything but the quadruples, followed by the four columns of the packed quadruples, aligned to their item size. The
+file is written under a temporary name and then moved, so a run never reads a partially written cache. Programs are only cached when their
+directory can be written.
+'''
+def save_compilation_results(cache_path: str, source_key: str, compilation_results: CompilationResults) -> None:
+    packed_quadruples = pack_quadruples(compilation_results.quadruples)
+    consts_table = compilation_results.consts_table
+    constants = [(name, type, entry.type, entry.address) for ((name, type), entry) in consts_table.const_vars_table.items()]
+    scopes = [(scopeID, {field: value for (field, value) in vars(scope).items() if field != 'vars_table'})
+        for (scopeID, scope) in compilation_results.func_dir.get_func_dir().items()]
+    header = marshal.dumps((source_key, len(packed_quadruples), packed_quadruples.composite_operands, constants, dict(consts_table.types_counter), scopes))
+    padding = -(HEADER_LENGTH_SIZE + len(header)) % PACKED_ITEM_SIZE
+    temp_path = f'{cache_path}.{os.getpid()}.tmp'
+    try:
+        with open(temp_path, 'wb') as cache_file:
+            cache_file.write(len(header).to_bytes(HEADER_LENGTH_SIZE, 'little'))
+            cache_file.write(header)
+            cache_file.write(bytes(padding))
+            packed_quadruples.write(cache_file)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+'''
+load_compilation_results function
+Reads the compilation results of a program from its .alc file. The optimizer and the linker rewrite quadruples, so the columns are unpacked into
+Quadruple objects right away. Returns None when there is no cache, when it belongs to another source or compiler, or when it cannot be read, so the
+program is compiled again.
+'''
+def load_compilation_results(cache_path: str, source_key: str) -> Union[CompilationResults, None]:
+    try:
+        with open(cache_path, 'rb') as cache_file:
+            cache_data = cache_file.read()
+        header_length = int.from_bytes(cache_data[:HEADER_LENGTH_SIZE], 'little')
+        header_end = HEADER_LENGTH_SIZE + header_length
+        (cached_key, num_quadruples, composite_operands, constants, types_counter, scopes) = marshal.loads(cache_data[HEADER_LENGTH_SIZE:header_end])
+        columns_start = header_end + -header_end % PACKED_ITEM_SIZE
+        if cached_key != source_key or len(cache_data) != columns_start + 4 * num_quadruples * PACKED_ITEM_SIZE:
+            return None
+        quadruples = read_packed_quadruples(cache_data, columns_start, num_quadruples, composite_operands).unpack()
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    func_dir = FuncDir()
+    for (scopeID, fields) in scopes:
+        func_dir.create_scope(scopeID, fields['type'])
+        scope = func_dir.get_scope(scopeID)
+        scope.release_scope_vars_table()
+        vars(scope).update(fields)
+    # Constants keep the addresses they were given when the program was compiled, so the table is rebuilt without assigning new addresses
+    consts_table = ConstVarsTable.__new__(ConstVarsTable)
+    consts_table.const_vars_table = {(name, type): VarsTableEntry(entry_type, address) for (name, type, entry_type, address) in constants}
+    consts_table.const_values = {address: name for (name, _, _, address) in constants}
+    consts_table.types_counter = types_counter
+    return CompilationResults(func_dir, consts_table, quadruples)
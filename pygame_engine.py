@@ -0,0 +1,118 @@
+from os import environ
+from time import perf_counter
+from typing import Union
+environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+import pygame
+
+'''
+GameEngine class
+Implements the ALi special functions on top of pygame. The execution backend of every program that draws or reads game events owns one of these
+objects, which keeps the canvas being drawn on and its background color.
+'''
+class GameEngine():
+    def __init__(self) -> None:
+        self.screen = None
+        self.canvas_background : tuple = None
+
+    def start(self) -> None:
+        pygame.init()
+
+    '''
+    update method
+    Shows the frame drawn since the last update and clears the canvas for the next one. Returns whether the game loop goes on.
+    '''
+    def update(self) -> bool:
+        pygame.display.flip()
+        pygame.display.update()
+        self.screen.fill(self.canvas_background)
+        return True
+
+    def generate_canvas(self, width: int, height: int, background: tuple) -> None:
+        self.screen = pygame.display.set_mode((width, height))
+        self.canvas_background = background # background should be a tuple that represents the rgb value
+
+    def set_canvas_title(self, caption: str) -> None:
+        pygame.display.set_caption(caption)
+
+    def set_canvas_background(self, background: tuple) -> None:
+        self.canvas_background = background
+
+    def get_window_width(self) -> int:
+        return self.screen.get_width()
+
+    def get_window_height(self) -> int:
+        return self.screen.get_height()
+
+    '''
+    get_game_event method
+    Returns the key of the last event received in the frame, or None if no event was received at all.
+    '''
+    def get_game_event(self) -> Union[int, None]:
+        key = None
+        for event in pygame.event.get():
+            # This is to enable a user to quit a game with CTRL + C in case they are unable to reach quitGame() function in their code
+            if event.type == pygame.QUIT:
+                print('\nGame has been ended by the user pressing CTRL + C.')
+                break
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_TAB:
+                    key = 0
+                elif event.key == pygame.K_LEFT:
+                    key = 1
+                elif event.key == pygame.K_UP:
+                    key = 2
+                elif event.key == pygame.K_RIGHT:
+                    key = 3
+                elif event.key == pygame.K_DOWN:
+                    key = 4
+                elif event.key == pygame.K_ESCAPE:
+                    key = 5
+            else:
+                # This will happen when calling the getGameEvent function without receiving an event in the frame
+                key = -1
+        return key
+
+    def draw_game_object(self, xpos: int, ypos: int, xsize: int, ysize: int, color: tuple) -> None:
+        pygame.draw.rect(self.screen, color, (xpos, ypos, xsize, ysize))
+
+'''
+HeadlessGameEngine class
+Game engine of benchmarks and regression tests, which runs a game for a fixed number of frames without a display, on the dummy video and audio
+drivers of SDL. Every frame starts on an update, and getGameEvent returns the event of the frame from a script instead of reading the events of
+pygame, so every run of a game is the same. The engine keeps the time spent flipping, clearing and drawing on the canvas.
+'''
+class HeadlessGameEngine(GameEngine):
+    def __init__(self, max_frames: int, events: list[Union[int, None]]) -> None:
+        super().__init__()
+        # SDL reads its drivers when pygame is initialized by the start special function
+        environ['SDL_VIDEODRIVER'] = 'dummy'
+        environ['SDL_AUDIODRIVER'] = 'dummy'
+        self.max_frames = max_frames
+        self.events = events
+        self.frames = 0
+        # Last frame whose event was read. Like the event queue of pygame, events are only returned by the first read of their frame
+        self.event_frame = 0
+        self.render_time = 0.0
+        self.first_frame_time : float = None
+
+    def update(self) -> bool:
+        if self.frames == self.max_frames:
+            return False
+        render_start = perf_counter()
+        super().update()
+        self.render_time += perf_counter() - render_start
+        if self.frames == 0:
+            self.first_frame_time = render_start
+        self.frames += 1
+        return True
+
+    def get_game_event(self) -> Union[int, None]:
+        if self.event_frame == self.frames or self.frames > len(self.events):
+            return None
+        self.event_frame = self.frames
+        return self.events[self.frames - 1]
+
+    def draw_game_object(self, xpos: int, ypos: int, xsize: int, ysize: int, color: tuple) -> None:
+        render_start = perf_counter()
+        super().draw_game_object(xpos, ypos, xsize, ysize, color)
+        self.render_time += perf_counter() - render_start
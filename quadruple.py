@@ -1,4 +1,5 @@
-from typing import Union
+from array import array
+from typing import Any, Union
 from semantic_cube import operations
 
 quadruple_operations = operations | {
@@ -16,6 +17,7 @@ quadruple_operations = operations | {
     'add_base_address': 26,
     'multiply_displacement': 27,
     'endprogram': 28,
+    'array_init': 29,
     # Special function operations
     'start': 30,
     'update': 31,
@@ -28,9 +30,22 @@ quadruple_operations = operations | {
     'get_game_event': 38,
     'draw_game_object': 39,
     'quit_game': 40,
+    # Fused compare and branch operations. They jump to their result when the comparison of their operators holds
+    'jlt': 41,
+    'jle': 42,
+    'jgt': 43,
+    'jge': 44,
+    'jeq': 45,
+    'jne': 46,
+    # Fused array element operations. They read or write the element of the array that starts at the first address of their list of addresses,
+    # at the position given by the indexes that follow it
+    'load_idx': 47,
+    'store_idx': 48,
 }
 
 class Quadruple():
+    __slots__ = ('op_code', 'operator1', 'operator2', 'result')
+
     # Note that operators and result are memory addresses
     # None on result is for quadruples that may be generated with a pending result or quadruples that have no result
     def __init__(self, operation: str, operator1: int = -1, operator2: int = -1, result: Union[int, str, list[int]] = None) -> None:
@@ -50,4 +65,146 @@ class Quadruple():
     def fill_result(self, result: int) -> None:
         if self.result is None:
             self.result = result
-    
\ No newline at end of file
+    
+
+'''
+Fields of every operation that hold virtual addresses. Any other field holds an immediate value such as a jump target, an array bound, a canvas size
+or a function name. The operators of draw_game_object, the values array_init assigns and the array and indexes of load_idx and store_idx hold lists of
+virtual addresses.
+'''
+address_operands = {
+    '+': ('operator1', 'operator2', 'result'),
+    '-': ('operator1', 'operator2', 'result'),
+    '*': ('operator1', 'operator2', 'result'),
+    '/': ('operator1', 'operator2', 'result'),
+    '&&': ('operator1', 'operator2', 'result'),
+    '||': ('operator1', 'operator2', 'result'),
+    '==': ('operator1', 'operator2', 'result'),
+    '!=': ('operator1', 'operator2', 'result'),
+    '>': ('operator1', 'operator2', 'result'),
+    '<': ('operator1', 'operator2', 'result'),
+    '>=': ('operator1', 'operator2', 'result'),
+    '<=': ('operator1', 'operator2', 'result'),
+    '!': ('operator1', 'result'),
+    '=': ('operator1', 'result'),
+    'print': ('result',),
+    'endprint': (),
+    'goto': (),
+    'gotot': ('operator1',),
+    'gotof': ('operator1',),
+    'gosub': (),
+    'era': (),
+    'parameter': ('operator1', 'result'),
+    'endfunc': (),
+    'return': ('operator1', 'result'),
+    'verify': ('operator1',),
+    'add_base_address': ('operator2', 'result'),
+    'multiply_displacement': ('operator1', 'result'),
+    'endprogram': (),
+    'array_init': ('operator1', 'result'),
+    'start': (),
+    'update': (),
+    'gen_default_canvas': (),
+    'gen_canvas': ('operator1', 'operator2', 'result'),
+    'set_canvas_title': ('result',),
+    'set_canvas_background': ('result',),
+    'get_window_width': ('result',),
+    'get_window_height': ('result',),
+    'get_game_event': ('result',),
+    'draw_game_object': ('operator1', 'operator2', 'result'),
+    'quit_game': (),
+    'jlt': ('operator1', 'operator2'),
+    'jle': ('operator1', 'operator2'),
+    'jgt': ('operator1', 'operator2'),
+    'jge': ('operator1', 'operator2'),
+    'jeq': ('operator1', 'operator2'),
+    'jne': ('operator1', 'operator2'),
+    'load_idx': ('operator1', 'result'),
+    'store_idx': ('operator1', 'result'),
+}
+
+operation_names = {op_code: operation for operation, op_code in quadruple_operations.items()}
+
+# Operands from this value up are kept in the columns of packed quadruples. -1 is the operand of the fields a quadruple does not use
+PACKED_OPERAND_MIN = -1
+PACKED_OPERAND_MAX = 2 ** (array('i').itemsize * 8 - 1) - 1
+# Size in bytes of every item of a column
+PACKED_ITEM_SIZE = array('i').itemsize
+
+'''
+PackedQuadruples class
+Columnar form of a list of quadruples, with one array('i') column for each field. Operands that are not ints that fit in a column, such as the
+function names of era and gosub, the list of addresses array_init assigns or the RGB tuple of gen_default_canvas, are kept in a side table of
+composite operands, and the column holds -2 minus their position in it. Columns are plain buffers, so they are written to a file as they are and
+read back from it with a single copy each.
+'''
+class PackedQuadruples():
+    __slots__ = ('op_codes', 'operators1', 'operators2', 'results', 'composite_operands')
+
+    def __init__(self, op_codes: Any, operators1: Any, operators2: Any, results: Any, composite_operands: list) -> None:
+        self.op_codes = op_codes
+        self.operators1 = operators1
+        self.operators2 = operators2
+        self.results = results
+        self.composite_operands = composite_operands
+
+    def __len__(self) -> int:
+        return len(self.op_codes)
+
+    def __getitem__(self, index: int) -> Quadruple:
+        return Quadruple(operation_names[self.op_codes[index]], self.unpack_operand(self.operators1[index]), self.unpack_operand(self.operators2[index]),
+            self.unpack_operand(self.results[index]))
+
+    def unpack_operand(self, operand: int) -> Any:
+        return operand if operand >= PACKED_OPERAND_MIN else self.composite_operands[PACKED_OPERAND_MIN - 1 - operand]
+
+    # Quadruples of every row, for the passes that rewrite them
+    def unpack(self) -> list[Quadruple]:
+        unpack_operand = self.unpack_operand
+        return [Quadruple(operation_names[op_code], unpack_operand(operator1), unpack_operand(operator2), unpack_operand(result))
+            for (op_code, operator1, operator2, result) in zip(self.op_codes, self.operators1, self.operators2, self.results)]
+
+    # Writes the columns one after the other, in the byte order of the machine
+    def write(self, file: Any) -> None:
+        for column in (self.op_codes, self.operators1, self.operators2, self.results):
+            file.write(column)
+
+'''
+pack_quadruples function
+Builds the columns of a list of quadruples. Names and None, the most repeated composite operands, are kept only once in the side table.
+'''
+def pack_quadruples(quadruples: list[Quadruple]) -> PackedQuadruples:
+    composite_operands = []
+    shared_operands = {}
+
+    def pack_operand(operand: Any) -> int:
+        if type(operand) is int and operand >= PACKED_OPERAND_MIN and operand <= PACKED_OPERAND_MAX:
+            return operand
+        if operand is None or type(operand) is str:
+            if operand not in shared_operands:
+                shared_operands[operand] = len(composite_operands)
+                composite_operands.append(operand)
+            return PACKED_OPERAND_MIN - 1 - shared_operands[operand]
+        composite_operands.append(operand)
+        return PACKED_OPERAND_MIN - len(composite_operands)
+
+    return PackedQuadruples(
+        array('i', [quadruple.op_code for quadruple in quadruples]),
+        array('i', [pack_operand(quadruple.operator1) for quadruple in quadruples]),
+        array('i', [pack_operand(quadruple.operator2) for quadruple in quadruples]),
+        array('i', [pack_operand(quadruple.result) for quadruple in quadruples]),
+        composite_operands
+    )
+
+'''
+read_packed_quadruples function
+Packed quadruples whose columns are copied from the bytes of a file, starting at the given offset.
+'''
+def read_packed_quadruples(data: bytes, offset: int, num_quadruples: int, composite_operands: list) -> PackedQuadruples:
+    column_size = num_quadruples * PACKED_ITEM_SIZE
+    columns = []
+    for column in range(4):
+        values = array('i')
+        values.frombytes(data[offset + column * column_size:offset + (column + 1) * column_size])
+        columns.append(values)
+    return PackedQuadruples(*columns, composite_operands)
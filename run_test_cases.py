@@ -0,0 +1,72 @@
+# ------------------------------------------------------------
+# run_test_cases.py
+#
+# runs the test cases of the ALi language on every backend and optimization level and compares their output with the expected one
+# ------------------------------------------------------------
+import glob
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+TEST_CASES_DIR = os.path.join(ROOT_DIR, 'test_cases')
+
+# Options of every configuration a test case runs on. Every one of them has to print the expected output
+CONFIGURATIONS = (
+    [],
+    ['-O1'],
+    ['-O2'],
+    ['--checked', '-O2'],
+    ['--backend', 'closure'],
+    ['--backend', 'closure', '-O2'],
+    ['--backend', 'python'],
+    ['--backend', 'python', '-O2'],
+    ['--memory', 'stack', '-O2'],
+    ['--no-memo', '-O2'],
+)
+
+# Seconds a test case may run before it is stopped and counted as failed
+TIMEOUT = 60
+
+'''
+run_test_case function
+Runs an ALi file with the given options and returns its output, which is what it printed followed, when it ended with an error, by the last line of
+the error. Only that line is compared, since tracebacks differ between backends.
+'''
+def run_test_case(filename: str, options: list[str]) -> str:
+    try:
+        process = subprocess.run([sys.executable, os.path.join(ROOT_DIR, 'ali'), *options, filename], capture_output=True, text=True, timeout=TIMEOUT)
+    except subprocess.TimeoutExpired:
+        return f'Timed out after {TIMEOUT}s\n'
+    output = process.stdout
+    if process.returncode != 0:
+        error_lines = process.stderr.strip().splitlines()
+        output += (error_lines[-1] if error_lines else f'Exited with code {process.returncode}') + '\n'
+    return output
+
+'''
+run_test_cases function
+Runs every test case that has an expected output, kept next to it as an .out file, on every configuration. Test cases without one, such as games,
+are skipped. Returns the number of runs whose output was not the expected one.
+'''
+def run_test_cases() -> int:
+    failures = 0
+    for filename in sorted(glob.glob(os.path.join(TEST_CASES_DIR, '*.al'))):
+        expected_path = os.path.splitext(filename)[0] + '.out'
+        if not os.path.exists(expected_path):
+            continue
+        with open(expected_path) as expected_file:
+            expected_output = expected_file.read()
+        for options in CONFIGURATIONS:
+            output = run_test_case(filename, options)
+            if output != expected_output:
+                failures += 1
+                print(f'FAILED {os.path.basename(filename)} {" ".join(options)}')
+                print(f'  expected: {expected_output!r}')
+                print(f'  got:      {output!r}')
+    return failures
+
+if __name__ == '__main__':
+    failures = run_test_cases()
+    print(f'{failures} failed runs' if failures else 'Every test case printed its expected output')
+    sys.exit(1 if failures else 0)
@@ -1,9 +1,224 @@
+from array import array
+from bisect import bisect_right
 from collections import deque
+from copy import copy
 from typing import Any, Union
-from func_dir import FuncDir
-from quadruple import Quadruple, quadruple_operations
+from func_dir import FuncDir, FuncDirEntry
+from quadruple import Quadruple, address_operands, operation_names
 from vars_table import ConstVarsTable
-from virtual_memory import VirtualMemory
+from virtual_memory import VirtualMemory, DATATYPE_KIND_SIZE
+
+'''
+Store identifiers
+Linked operands are (store, index) handles, where the store identifies the segment kind and datatype of the virtual address. Global and constant stores
+never change during execution. Frame stores belong to the current memory segment and are swapped on every function call and return.
+'''
+GLOBAL_INT, GLOBAL_FLOAT, GLOBAL_CHAR, GLOBAL_BOOL = range(0, 4)
+CONSTANT_INT, CONSTANT_FLOAT, CONSTANT_CHAR, CONSTANT_BOOL, CONSTANT_STRING = range(4, 9)
+LOCAL_INT, LOCAL_FLOAT, LOCAL_CHAR, LOCAL_BOOL = range(9, 13)
+TEMP_INT, TEMP_FLOAT, TEMP_CHAR, TEMP_BOOL, TEMP_POINTER = range(13, 18)
+FRAME_STORES_START = LOCAL_INT
+# Elements of int and float arrays addressed directly, such as the ones array initializers assign, are relinked into handles of this store that keep
+# their original handle, and are accessed through the typed buffer of their array like the address a temp pointer holds
+ARRAY_ELEMENT = TEMP_POINTER + 1
+
+# Virtual address ranges and the store each of them is linked to
+ADDRESS_STORES = [
+    (VirtualMemory.global_int_range, GLOBAL_INT),
+    (VirtualMemory.global_float_range, GLOBAL_FLOAT),
+    (VirtualMemory.global_char_range, GLOBAL_CHAR),
+    (VirtualMemory.global_bool_range, GLOBAL_BOOL),
+    (VirtualMemory.constant_int_range, CONSTANT_INT),
+    (VirtualMemory.constant_float_range, CONSTANT_FLOAT),
+    (VirtualMemory.constant_char_range, CONSTANT_CHAR),
+    (VirtualMemory.constant_bool_range, CONSTANT_BOOL),
+    (VirtualMemory.constant_string_range, CONSTANT_STRING),
+    (VirtualMemory.local_int_range, LOCAL_INT),
+    (VirtualMemory.local_float_range, LOCAL_FLOAT),
+    (VirtualMemory.local_char_range, LOCAL_CHAR),
+    (VirtualMemory.local_bool_range, LOCAL_BOOL),
+    (VirtualMemory.temp_int_range, TEMP_INT),
+    (VirtualMemory.temp_float_range, TEMP_FLOAT),
+    (VirtualMemory.temp_char_range, TEMP_CHAR),
+    (VirtualMemory.temp_bool_range, TEMP_BOOL),
+    (VirtualMemory.temp_pointer_range, TEMP_POINTER),
+]
+
+'''
+Decoded address map
+Every datatype owns a block of DATATYPE_SIZES addresses split into one DATATYPE_KIND_SIZE wide range per segment kind, so every range starts at a
+multiple of DATATYPE_KIND_SIZE and no two ranges share one. ADDRESS_MAP is built once from the ranges and holds, for every address // DATATYPE_KIND_SIZE,
+the (segment, store, range start, range end) of the range in that position. Positions that no range uses hold an unmapped entry whose range is empty.
+'''
+GLOBAL_SEGMENT, CONSTANT_SEGMENT, FRAME_SEGMENT = range(0, 3)
+UNMAPPED_ADDRESS = (None, None, 0, -1)
+
+def build_address_map() -> list[tuple[Union[int, None], Union[int, None], int, int]]:
+    address_map = [UNMAPPED_ADDRESS] * (max(range_end for ((_, range_end), _) in ADDRESS_STORES) // DATATYPE_KIND_SIZE + 1)
+    for ((range_start, range_end), store) in ADDRESS_STORES:
+        if store < CONSTANT_INT:
+            segment = GLOBAL_SEGMENT
+        elif store < FRAME_STORES_START:
+            segment = CONSTANT_SEGMENT
+        else:
+            segment = FRAME_SEGMENT
+        address_map[range_start // DATATYPE_KIND_SIZE] = (segment, store, range_start, range_end)
+    return address_map
+
+ADDRESS_MAP = build_address_map()
+
+# Entry of the address map for the range of a virtual address, or the unmapped entry when the address is not part of any range
+def lookup_address(virtual_address: int) -> tuple[Union[int, None], Union[int, None], int, int]:
+    position = virtual_address // DATATYPE_KIND_SIZE
+    if position < 0 or position >= len(ADDRESS_MAP) or virtual_address > ADDRESS_MAP[position][3]:
+        return UNMAPPED_ADDRESS
+    return ADDRESS_MAP[position]
+
+'''
+decode_address function
+Translates a virtual address into its (store, index) handle.
+'''
+def decode_address(virtual_address: int) -> tuple[int, int]:
+    position = virtual_address // DATATYPE_KIND_SIZE
+    if position >= 0 and position < len(ADDRESS_MAP):
+        (_, store, range_start, range_end) = ADDRESS_MAP[position]
+        if virtual_address <= range_end:
+            return (store, virtual_address - range_start)
+    raise RuntimeError(f'Unable to access specified virtual address \'{virtual_address}\'')
+
+'''
+TypedArray class
+Contiguous typed buffer that holds the elements of an int or float array, instead of one Python object per element in the list of its store. A
+bitmap with one byte per element keeps track of the elements that were assigned, so reading the others still raises. Values the buffer cannot hold
+exactly, such as the float result of a division stored into an int array or an int that does not fit in 64 bits, turn the buffer into a list.
+'''
+class TypedArray():
+    __slots__ = ('item_type', 'values', 'initialized')
+    # Typecode of the buffer of every element type
+    typecodes = {int: 'q', float: 'd'}
+
+    def __init__(self, item_type: type, size: int) -> None:
+        self.item_type = item_type
+        self.values : Union[array, list] = array(self.typecodes[item_type], bytes(size * 8))
+        self.initialized = bytearray(size)
+
+    def load(self, offset: int) -> Any:
+        if not self.initialized[offset]:
+            raise RuntimeError('Cannot use uninitialized variable.')
+        return self.values[offset]
+
+    def store(self, offset: int, value: Any) -> None:
+        if type(value) is not self.item_type and isinstance(self.values, array):
+            self.values = self.values.tolist()
+        try:
+            self.values[offset] = value
+        except OverflowError:
+            self.values = self.values.tolist()
+            self.values[offset] = value
+        self.initialized[offset] = 1
+
+    # Stores consecutive values from the element at the given offset on, as a single slice assignment
+    def store_block(self, offset: int, values: tuple) -> None:
+        end = offset + len(values)
+        block = values
+        if isinstance(self.values, array) and all(type(value) is self.item_type for value in values):
+            try:
+                block = array(self.values.typecode, values)
+            except OverflowError:
+                pass
+        if isinstance(self.values, array) and not isinstance(block, array):
+            self.values = self.values.tolist()
+        self.values[offset:end] = block
+        self.initialized[offset:end] = b'\x01' * len(values)
+
+    # Every element becomes uninitialized again, so the array can be reused by another frame
+    def clear(self) -> None:
+        size = len(self.initialized)
+        self.initialized[:] = bytes(size)
+        if not isinstance(self.values, array):
+            self.values = array(self.typecodes[self.item_type], bytes(size * 8))
+
+'''
+ArrayRegions class
+Typed buffers of the int and float arrays of a store, sorted by the index of their first element. The region an index falls in is found by a binary
+search over those first indexes, so accesses through temp pointers do not scan every array of the store.
+'''
+class ArrayRegions():
+    __slots__ = ('starts', 'regions')
+
+    def __init__(self) -> None:
+        self.starts : list[int] = []
+        self.regions : list[tuple[int, int, TypedArray]] = []
+
+    def add(self, start: int, end: int, typed_array: TypedArray) -> None:
+        position = bisect_right(self.starts, start)
+        self.starts.insert(position, start)
+        self.regions.insert(position, (start, end, typed_array))
+
+    # The typed array that holds the element at the given index of the store and the offset of the element, or None when it is not one
+    def find(self, index: int) -> tuple[Union[TypedArray, None], int]:
+        position = bisect_right(self.starts, index) - 1
+        if position >= 0:
+            (start, end, typed_array) = self.regions[position]
+            if index < end:
+                return (typed_array, index - start)
+        return (None, index)
+
+# Element type of the stores whose arrays are held in typed buffers
+array_item_types = {GLOBAL_INT: int, GLOBAL_FLOAT: float, LOCAL_INT: int, LOCAL_FLOAT: float}
+
+# (store, first index, end index) of the int and float arrays declared in a scope, given as (base virtual address, total size) pairs
+def get_typed_array_bounds(arrays: list[tuple[int, int]]) -> list[tuple[int, int, int]]:
+    bounds = []
+    for (address, size) in arrays:
+        (store, index) = decode_address(address)
+        if store in array_item_types:
+            bounds.append((store, index, index + size))
+    return bounds
+
+'''
+build_array_regions function
+Creates the typed buffers of the int and float arrays declared in a scope. Returns the array regions of every store, starting with the store
+first_store.
+'''
+def build_array_regions(arrays: list[tuple[int, int]], first_store: int, num_stores: int) -> list[ArrayRegions]:
+    regions = [ArrayRegions() for _ in range(num_stores)]
+    for (store, start, end) in get_typed_array_bounds(arrays):
+        regions[store - first_store].add(start, end, TypedArray(array_item_types[store], end - start))
+    return regions
+
+'''
+relink_array_elements function
+Relinks the handles of quadruples that address an element of an int or float array directly into ARRAY_ELEMENT handles. The arrays of a scope are
+the global ones and the ones of the function the quadruple belongs to. Memory models pass the stores whose arrays they keep in typed buffers.
+'''
+def relink_array_elements(quadruples: list, func_dir: FuncDir, typed_stores: range) -> list:
+    global_bounds = [bounds for bounds in get_typed_array_bounds(func_dir.get_scope('global').arrays) if bounds[0] in typed_stores]
+    scope_bounds = {scope.starts_at: [bounds for bounds in get_typed_array_bounds(scope.arrays) if bounds[0] in typed_stores]
+        for (scopeID, scope) in func_dir.get_func_dir().items() if scopeID != 'global' and scope.starts_at >= 0}
+    def relink_operand(operand: Any, bounds: list[tuple[int, int, int]]) -> Any:
+        if isinstance(operand, list):
+            return [relink_operand(handle, bounds) for handle in operand]
+        (store, index) = operand
+        for (array_store, start, end) in bounds:
+            if store == array_store and index >= start and index < end:
+                return (ARRAY_ELEMENT, operand)
+        return operand
+    bounds = global_bounds
+    relinked = []
+    for (ip, quadruple) in enumerate(quadruples):
+        if ip in scope_bounds:
+            bounds = global_bounds + scope_bounds[ip]
+        operation = operation_names[quadruple.op_code]
+        # Parameters are written into the frame of the function being called, which never holds an array element
+        operands = ('operator1',) if operation == 'parameter' else address_operands[operation]
+        if bounds and operands:
+            # Linked quadruples are shared with other backends, so the relinked ones are copies
+            quadruple = copy(quadruple)
+            for field in operands:
+                setattr(quadruple, field, relink_operand(getattr(quadruple, field), bounds))
+        relinked.append(quadruple)
+    return relinked
 
 '''
 MemorySegment class
@@ -11,6 +226,10 @@ Instantiating a MemorySegment object, we should know how many spaces we need for
 These lists are created only on an as needed basis.
 '''
 class MemorySegment():
+    # Name of the list that holds the values of every store, in the order of their store identifiers
+    store_lists = ('ints_mem', 'floats_mem', 'chars_mem', 'bools_mem', 'ints_mem', 'floats_mem', 'chars_mem', 'bools_mem', 'strings_mem',
+        'ints_mem', 'floats_mem', 'chars_mem', 'bools_mem', 'ints_mem_temp', 'floats_mem_temp', 'chars_mem_temp', 'bools_mem_temp', 'temps_pointer_mem')
+
     def __init__(self, num_ints: int = 0, num_floats: int = 0, num_chars: int = 0, num_bools: int = 0, 
                 num_ints_temp: int = 0, num_floats_temp: int = 0, num_chars_temp: int = 0, num_bools_temp: int = 0,
                 num_temps_pointer: int = 0,
@@ -36,6 +255,11 @@ class MemorySegment():
             self.temps_pointer_mem : list[Union[int, None]] = self.generate_mem_segment(num_temps_pointer)
         if num_strings > 0:
             self.strings_mem : list[Union[str, None]] = self.generate_mem_segment(num_strings)
+        # Frame stores in the same order as their store identifiers, used when the segment becomes the current memory of linked code
+        self.stores : list[Union[list, None]] = [
+            getattr(self, name, None) for name in ('ints_mem', 'floats_mem', 'chars_mem', 'bools_mem',
+                'ints_mem_temp', 'floats_mem_temp', 'chars_mem_temp', 'bools_mem_temp', 'temps_pointer_mem')
+        ]
 
     def __repr__(self) -> str:
         result = ""
@@ -67,39 +291,15 @@ class MemorySegment():
         return [None] * list_size
 
     def retrieve_content(self, virtual_address: int) -> Any:
-        int_index = self.get_int_index(virtual_address)
-        int_temp_index = self.get_int_temp_index(virtual_address)
-        float_index = self.get_float_index(virtual_address)
-        float_temp_index = self.get_float_temp_index(virtual_address)
-        char_index = self.get_char_index(virtual_address)
-        char_temp_index = self.get_char_temp_index(virtual_address)
-        bool_index = self.get_bool_index(virtual_address)
-        bool_temp_index = self.get_bool_temp_index(virtual_address)
-        temp_pointer_index = self.get_temp_pointer_index(virtual_address)
-        string_index = self.get_string_index(virtual_address)
-        if int_index != None: 
-            value = self.ints_mem[int_index]
-        elif int_temp_index != None:
-            value = self.ints_mem_temp[int_temp_index]
-        elif float_index != None: 
-            value = self.floats_mem[float_index]
-        elif float_temp_index != None:
-            value = self.floats_mem_temp[float_temp_index]
-        elif char_index != None: 
-            value = self.chars_mem[char_index]
-        elif char_temp_index != None: 
-            value = self.chars_mem_temp[char_temp_index]
-        elif bool_index != None: 
-            value = self.bools_mem[bool_index]
-        elif bool_temp_index != None: 
-            value = self.bools_mem_temp[bool_temp_index]
-        elif string_index != None: 
-            value : str = self.strings_mem[string_index]
-            value = value.replace("\"", '')
-        elif temp_pointer_index != None:
+        (_, store, range_start, _) = lookup_address(virtual_address)
+        if store == TEMP_POINTER:
             # Recursively calls this same function to retrieve the content from the "real" address the temp pointer is pointing to
-            real_address = self.temps_pointer_mem[temp_pointer_index]
+            real_address = self.temps_pointer_mem[virtual_address - range_start]
             value = self.retrieve_content(real_address)
+        elif store is not None:
+            value = getattr(self, self.store_lists[store])[virtual_address - range_start]
+            if store == CONSTANT_STRING and value is not None:
+                value = value.replace("\"", '')
         else:
             value = None
 
@@ -114,149 +314,59 @@ class MemorySegment():
     temporal pointer address.
     '''
     def assign_content(self, virtual_address: int, value: Any, storing_vaddress: bool = False) -> None:
-        int_index = self.get_int_index(virtual_address)
-        int_temp_index = self.get_int_temp_index(virtual_address)
-        float_index = self.get_float_index(virtual_address)
-        float_temp_index = self.get_float_temp_index(virtual_address)
-        char_index = self.get_char_index(virtual_address)
-        char_temp_index = self.get_char_temp_index(virtual_address)
-        bool_index = self.get_bool_index(virtual_address)
-        bool_temp_index = self.get_bool_temp_index(virtual_address)
-        temp_pointer_index = self.get_temp_pointer_index(virtual_address)
-        string_index = self.get_string_index(virtual_address)
-        if int_index != None: 
-            self.ints_mem[int_index] = value
-        elif int_temp_index != None:
-            self.ints_mem_temp[int_temp_index] = value
-        elif float_index != None: 
-            self.floats_mem[float_index] = value
-        elif float_temp_index != None:
-            self.floats_mem_temp[float_temp_index] = value
-        elif char_index != None: 
-            self.chars_mem[char_index] = value
-        elif char_temp_index != None: 
-            self.chars_mem_temp[char_temp_index] = value
-        elif bool_index != None: 
-            self.bools_mem[bool_index] = value
-        elif bool_temp_index != None: 
-            self.bools_mem_temp[bool_temp_index] = value
-        elif temp_pointer_index != None:
-            # Test if we are storing a a virtual address using a temp pointer
-            if storing_vaddress:
-                self.temps_pointer_mem[temp_pointer_index] = value
-            else:
-                # If not, recursively calls this same function to retrieve the content from the "real" address the temp pointer is pointing to
-                real_address = self.temps_pointer_mem[temp_pointer_index]
-                self.assign_content(real_address, value)
-        elif string_index != None: 
-            self.strings_mem[string_index] = value
-        else:
+        (_, store, range_start, _) = lookup_address(virtual_address)
+        if store is None:
             raise RuntimeError(f'Unable to access specified virtual address \'{virtual_address}\'')
+        # Test if we are storing a a virtual address using a temp pointer
+        if store == TEMP_POINTER and not storing_vaddress:
+            # If not, recursively calls this same function to retrieve the content from the "real" address the temp pointer is pointing to
+            real_address = self.temps_pointer_mem[virtual_address - range_start]
+            self.assign_content(real_address, value)
+        else:
+            getattr(self, self.store_lists[store])[virtual_address - range_start] = value
 
-    '''
-    The following methods (get_datatype_index) test whether the virtual address given is part of the range for the datatype and kind of address. 
-    If it is, it returns the index by substracting the starting point of the virtual address for its specific datype and kind.
-    If not, it returns None so that we know that the given virtual address is not part of the range
-    '''
+'''
+FrameLayout class
+Sizes of the frame stores of a function, computed once when the program is loaded instead of on every call. Parameters are stored as locals of
+their type. The layout also keeps a pool of the frames of the function that already returned, so calls reuse them instead of building new ones.
+'''
+class FrameLayout():
+    # Local store of every parameter type indicator
+    param_stores = {'i': 0, 'f': 1, 'c': 2, 'b': 3}
 
-    def get_int_index(self, virtual_address: int) -> Union[int, None]:
-        # Check if the address belongs to global ints
-        if self.in_virtual_range(virtual_address, VirtualMemory.global_int_range[0], VirtualMemory.global_int_range[1]): 
-            return virtual_address - VirtualMemory.global_int_range[0]
-        # Check if the address belongs to constant ints
-        elif self.in_virtual_range(virtual_address, VirtualMemory.constant_int_range[0], VirtualMemory.constant_int_range[1]): 
-            return virtual_address - VirtualMemory.constant_int_range[0]
-        # Check if the address belongs to local ints
-        elif self.in_virtual_range(virtual_address, VirtualMemory.local_int_range[0], VirtualMemory.local_int_range[1]): 
-            return virtual_address - VirtualMemory.local_int_range[0]
-        else: 
-            return None
-    def get_int_temp_index(self, virtual_address: int) -> Union[int, None]:
-        if self.in_virtual_range(virtual_address, VirtualMemory.temp_int_range[0], VirtualMemory.temp_int_range[1]):
-            return virtual_address - VirtualMemory.temp_int_range[0]
-        else: 
-            return None
-
-    def get_float_index(self, virtual_address: int) -> Union[float, None]:
-        # Check if the address belongs to global floats
-        if self.in_virtual_range(virtual_address, VirtualMemory.global_float_range[0], VirtualMemory.global_float_range[1]): 
-            return virtual_address - VirtualMemory.global_float_range[0]
-        # Check if the address belongs to constant floats
-        elif self.in_virtual_range(virtual_address, VirtualMemory.constant_float_range[0], VirtualMemory.constant_float_range[1]): 
-            return virtual_address - VirtualMemory.constant_float_range[0]
-        # Check if the address belongs to local floats
-        elif self.in_virtual_range(virtual_address, VirtualMemory.local_float_range[0], VirtualMemory.local_float_range[1]): 
-            return virtual_address - VirtualMemory.local_float_range[0]
-        else: 
-            return None
-
-    def get_float_temp_index(self, virtual_address: int) -> Union[float, None]:
-        # Check if the address belongs to temporal floats
-        if self.in_virtual_range(virtual_address, VirtualMemory.temp_float_range[0], VirtualMemory.temp_float_range[1]):
-            return virtual_address - VirtualMemory.temp_float_range[0]
-        else: 
-            return None
-
-    def get_char_index(self, virtual_address: int) -> Union[str, None]:
-        # Check if the address belongs to global ints
-        if self.in_virtual_range(virtual_address, VirtualMemory.global_char_range[0], VirtualMemory.global_char_range[1]): 
-            return virtual_address - VirtualMemory.global_char_range[0]
-        # Check if the address belongs to constant chars
-        elif self.in_virtual_range(virtual_address, VirtualMemory.constant_char_range[0], VirtualMemory.constant_char_range[1]): 
-            return virtual_address - VirtualMemory.constant_char_range[0]
-        # Check if the address belongs to local chars
-        elif self.in_virtual_range(virtual_address, VirtualMemory.local_char_range[0], VirtualMemory.local_char_range[1]): 
-            return virtual_address - VirtualMemory.local_char_range[0]
-        else: 
-            return None
-    
-    def get_char_temp_index(self, virtual_address: int) -> Union[str, None]:
-        # Check if the address belongs to temporal chars
-        if self.in_virtual_range(virtual_address, VirtualMemory.temp_char_range[0], VirtualMemory.temp_char_range[1]):
-            return virtual_address - VirtualMemory.temp_char_range[0]
-        else: 
-            return None
-
-    def get_bool_index(self, virtual_address: int) -> Union[bool, None]:
-        # Check if the address belongs to global bools
-        if self.in_virtual_range(virtual_address, VirtualMemory.global_bool_range[0], VirtualMemory.global_bool_range[1]): 
-            return virtual_address - VirtualMemory.global_bool_range[0]
-        # Check if the address belongs to constant bools
-        elif self.in_virtual_range(virtual_address, VirtualMemory.constant_bool_range[0], VirtualMemory.constant_bool_range[1]): 
-            return virtual_address - VirtualMemory.constant_bool_range[0]
-        # Check if the address belongs to local bools
-        elif self.in_virtual_range(virtual_address, VirtualMemory.local_bool_range[0], VirtualMemory.local_bool_range[1]): 
-            return virtual_address - VirtualMemory.local_bool_range[0]
-        else: 
-            return None
-    
-    def get_bool_temp_index(self, virtual_address: int) -> Union[bool, None]:
-        # Check if the address belongs to temporal bools
-        if self.in_virtual_range(virtual_address, VirtualMemory.temp_bool_range[0], VirtualMemory.temp_bool_range[1]):
-            return virtual_address - VirtualMemory.temp_bool_range[0]
-        else: 
-            return None
-
-    def get_temp_pointer_index(self, virtual_address: int) -> Union[str, None]:
-        # Check if the address belongs to temp pointers
-        if self.in_virtual_range(virtual_address, VirtualMemory.temp_pointer_range[0], VirtualMemory.temp_pointer_range[1]): 
-            return virtual_address - VirtualMemory.temp_pointer_range[0]
-        else: 
-            return None
-
-    def get_string_index(self, virtual_address: int) -> Union[str, None]:
-        # Check if the address belongs to constant strings
-        if self.in_virtual_range(virtual_address, VirtualMemory.constant_string_range[0], VirtualMemory.constant_string_range[1]): 
-            return virtual_address - VirtualMemory.constant_string_range[0]
-        else: 
-            return None
-            
-    # Helper function to test for a range
-    def in_virtual_range(self, virtual_address: int, range_start: int, range_end: int):
-        return virtual_address >= range_start and virtual_address <= range_end
+    def __init__(self, scope: FuncDirEntry) -> None:
+        local_sizes = [scope.num_vars_int, scope.num_vars_float, scope.num_vars_char, scope.num_vars_bool]
+        for param in scope.params_list:
+            local_sizes[self.param_stores[param]] += 1
+        self.sizes : list[int] = local_sizes + [scope.num_temps_int, scope.num_temps_float, scope.num_temps_char, scope.num_temps_bool, scope.num_pointer_temps]
+        # (frame store, empty contents) of every store the frames of the function have
+        self.empty_stores : list[tuple[int, list]] = [(store, [None] * size) for (store, size) in enumerate(self.sizes) if size > 0]
+        self.arrays : list[tuple[int, int]] = scope.arrays
+        self.free_frames : list[MemorySegment] = []
 
-'''
+    def acquire_frame(self) -> MemorySegment:
+        if self.free_frames:
+            return self.free_frames.pop()
+        frame = MemorySegment(*self.sizes)
+        frame.layout = self
+        frame.array_regions = build_array_regions(self.arrays, FRAME_STORES_START, len(self.sizes))
+        return frame
+
+    def release_frame(self, frame: MemorySegment) -> None:
+        # Every slot is cleared, so variables of a reused frame are uninitialized again
+        stores = frame.stores
+        for (store, empty_store) in self.empty_stores:
+            stores[store][:] = empty_store
+        if self.arrays:
+            for store_regions in frame.array_regions:
+                for (_, _, typed_array) in store_regions.regions:
+                    typed_array.clear()
+        self.free_frames.append(frame)
 
+'''
+RuntimeMemory class
+Holds the constant, global and current memory segments of a running program, plus the stack of sleeping memory segments.
+Linked code accesses memory through the stores list, where every store identifier indexes the typed list it refers to.
 '''
 class RuntimeMemory():
     def __init__(self, consts_table: ConstVarsTable, func_dir: FuncDir) -> None:
@@ -271,10 +381,34 @@ class RuntimeMemory():
             global_scope.num_vars_bool,
             num_temps_pointer=global_scope.num_pointer_temps
         )
+        self.frame_layouts : dict[str, FrameLayout] = {scopeID: FrameLayout(scope) for (scopeID, scope) in func_dir.get_func_dir().items() if scopeID not in ('global', 'main')}
         self.mem_stack : deque[MemorySegment] = deque()
         # Take advantage of the function directory to build out the main memory segment and set it as the current memory segment from the start
         self.current_mem_segment : MemorySegment = self.generate_main_memory_segment(func_dir)
         self.activation_record : MemorySegment = None
+        self.stores : list[Union[list, None]] = [
+            getattr(self.global_memory_segment, 'ints_mem', None),
+            getattr(self.global_memory_segment, 'floats_mem', None),
+            getattr(self.global_memory_segment, 'chars_mem', None),
+            getattr(self.global_memory_segment, 'bools_mem', None),
+            getattr(self.constant_memory_segment, 'ints_mem', None),
+            getattr(self.constant_memory_segment, 'floats_mem', None),
+            getattr(self.constant_memory_segment, 'chars_mem', None),
+            getattr(self.constant_memory_segment, 'bools_mem', None),
+            # Strings are stored without their quotes so that linked code does not need to strip them on every access
+            [string.replace("\"", '') for string in getattr(self.constant_memory_segment, 'strings_mem', [])],
+        ] + self.current_mem_segment.stores
+        # Typed buffers of the int and float arrays of every store, which temp pointers are followed into. Swapped with the frame stores
+        self.array_regions : list[ArrayRegions] = build_array_regions(global_scope.arrays, GLOBAL_INT, FRAME_STORES_START) \
+            + self.current_mem_segment.array_regions
+
+    '''
+    relink_quadruples method
+    Handles given out by the linker already address the stores of this memory, so quadruples are executed as they are, except for the elements of
+    int and float arrays they address directly. Other memory models may translate them.
+    '''
+    def relink_quadruples(self, quadruples: list, func_dir: FuncDir) -> list:
+        return relink_array_elements(quadruples, func_dir, range(GLOBAL_INT, TEMP_POINTER))
 
     def generate_constant_memory_segment(self, consts_table: ConstVarsTable) -> MemorySegment:
         mem_segment = MemorySegment(
@@ -285,7 +419,7 @@ class RuntimeMemory():
             num_strings=consts_table.types_counter['string']
         )
         # We use the constants table to build out the memory segment, using the keys as the values to be stored in memory 
-        for value, const_entry in consts_table.const_vars_table.items():
+        for (value, _), const_entry in consts_table.const_vars_table.items():
             value_in_memory = value
             if value == 'true':
                 value_in_memory = True
@@ -296,69 +430,123 @@ class RuntimeMemory():
         return mem_segment
 
     def generate_main_memory_segment(self, func_dir: FuncDir) -> MemorySegment:
-        main_scope = func_dir.get_scope('main')
-        mem_segment = MemorySegment(
-            main_scope.num_vars_int,
-            main_scope.num_vars_float,
-            main_scope.num_vars_char,
-            main_scope.num_vars_bool,
-            main_scope.num_temps_int,
-            main_scope.num_temps_float,
-            main_scope.num_temps_char,
-            main_scope.num_temps_bool,
-            main_scope.num_pointer_temps
-        )
-        return mem_segment
+        # main has no parameters, so its layout gives the same stores as the sizes of its scope
+        return FrameLayout(func_dir.get_scope('main')).acquire_frame()
 
-    def create_mem_segment(self, resources: list[list[int]]) -> None:
-        local_resources = resources[0]
-        temp_resources = resources[1]
-        temp_pointer_resources = resources[2]
-        new_mem_segment = MemorySegment(local_resources[0], local_resources[1], local_resources[2], local_resources[3],temp_resources[0], temp_resources[1], temp_resources[2], temp_resources[3], temp_pointer_resources)
-        self.activation_record = new_mem_segment
+    def create_mem_segment(self, layout: FrameLayout) -> None:
+        self.activation_record = layout.acquire_frame()
 
     def sleep_current_memory(self):
         self.mem_stack.append(self.current_mem_segment)
         self.current_mem_segment = self.activation_record
+        self.stores[FRAME_STORES_START:] = self.current_mem_segment.stores
+        self.array_regions[FRAME_STORES_START:] = self.current_mem_segment.array_regions
     
     def destroy_current_mem_segment(self) -> None:
-        # When we are finished with a memory segment, we dispose of it and reset to what we had waiting in the stack
-        del self.current_mem_segment
+        # When we are finished with a memory segment, it goes back to the pool of its function and we reset to what we had waiting in the stack
+        self.current_mem_segment.layout.release_frame(self.current_mem_segment)
         self.current_mem_segment = self.mem_stack.pop()
+        self.stores[FRAME_STORES_START:] = self.current_mem_segment.stores
+        self.array_regions[FRAME_STORES_START:] = self.current_mem_segment.array_regions
 
-    def retrieve_content(self, virtual_address: int):
-        # see if we will retrieve it from the global memory segment
-        if self.check_for_global_segment(virtual_address):
-            return self.global_memory_segment.retrieve_content(virtual_address)
-        elif self.check_for_constant_segment(virtual_address):
-            return self.constant_memory_segment.retrieve_content(virtual_address)
+    '''
+    The following methods access memory through linked (store, index) handles. Only temp pointers need to decode a virtual address at runtime,
+    since the address they hold is computed during execution.
+    '''
+    # The typed array that holds the element a handle addresses and the offset of the element, or None when it is not an element of one
+    def find_array_element(self, handle: tuple[int, int]) -> tuple[Union[TypedArray, None], int]:
+        (store, index) = handle
+        return self.array_regions[store].find(index)
+
+    def retrieve_from_handle(self, handle: tuple[int, int]) -> Any:
+        (store, index) = handle
+        if store == ARRAY_ELEMENT:
+            (typed_array, offset) = self.find_array_element(index)
+            return typed_array.load(offset)
+        value = self.stores[store][index]
+        if store == TEMP_POINTER:
+            # Retrieve the content from the "real" address the temp pointer is pointing to
+            handle = decode_address(value)
+            (typed_array, offset) = self.find_array_element(handle)
+            if typed_array is not None:
+                return typed_array.load(offset)
+            return self.retrieve_from_handle(handle)
+        if value is None:
+            raise RuntimeError('Cannot use uninitialized variable.')
+        return value
+
+    def assign_to_handle(self, handle: tuple[int, int], value: Any) -> None:
+        (store, index) = handle
+        if store >= TEMP_POINTER:
+            handle = index if store == ARRAY_ELEMENT else decode_address(self.stores[TEMP_POINTER][index])
+            (typed_array, offset) = self.find_array_element(handle)
+            if typed_array is not None:
+                typed_array.store(offset, value)
+                return
+            (store, index) = handle
+        self.stores[store][index] = value
+
+    # Assigns consecutive values to the elements of an array, from the one the handle addresses on
+    def assign_block(self, handle: tuple[int, int], values: tuple) -> None:
+        (store, index) = handle
+        if store == ARRAY_ELEMENT:
+            (typed_array, offset) = self.find_array_element(index)
+            typed_array.store_block(offset, values)
+        else:
+            self.stores[store][index:index + len(values)] = values
+
+    # Value of the element at the given offset from the first element of an array, which the handle addresses
+    def retrieve_element(self, handle: tuple[int, int], offset: int) -> Any:
+        (store, index) = handle
+        if store == ARRAY_ELEMENT:
+            (typed_array, start) = self.find_array_element(index)
+            return typed_array.load(start + offset)
+        value = self.stores[store][index + offset]
+        if value is None:
+            raise RuntimeError('Cannot use uninitialized variable.')
+        return value
+
+    def assign_element(self, handle: tuple[int, int], offset: int, value: Any) -> None:
+        (store, index) = handle
+        if store == ARRAY_ELEMENT:
+            (typed_array, start) = self.find_array_element(index)
+            typed_array.store(start + offset, value)
         else:
-            return self.current_mem_segment.retrieve_content(virtual_address)
+            self.stores[store][index + offset] = value
+
+    def assign_address_to_handle(self, handle: tuple[int, int], virtual_address: int) -> None:
+        (store, index) = handle
+        self.stores[store][index] = virtual_address
+
+    def assign_parameter(self, handle: tuple[int, int], value: Any) -> None:
+        (store, index) = handle
+        self.activation_record.stores[store - FRAME_STORES_START][index] = value
+
+    # Values of the parameters of the activation record of the function being called
+    def retrieve_parameters(self, handles: list[tuple[int, int]]) -> tuple:
+        stores = self.activation_record.stores
+        return tuple(stores[store - FRAME_STORES_START][index] for (store, index) in handles)
+
+    # Gives the activation record of a call that is skipped back to the pool of its function
+    def discard_activation_record(self) -> None:
+        self.activation_record.layout.release_frame(self.activation_record)
+
+    def retrieve_content(self, virtual_address: int):
+        return self.get_memory_segment(virtual_address).retrieve_content(virtual_address)
     
     def assign_content(self, virtual_address: int, value: Any):
-        # see if we will assign it to the global memory segment
-        if self.check_for_global_segment(virtual_address):
-            return self.global_memory_segment.assign_content(virtual_address, value)
-        elif self.check_for_constant_segment(virtual_address):
-            return self.constant_memory_segment.assign_content(virtual_address, value)
-        else:
-                return self.current_mem_segment.assign_content(virtual_address, value)
+        return self.get_memory_segment(virtual_address).assign_content(virtual_address, value)
 
     '''
-    The following are helper methods do determine from which memory segment we should retreive content from or assign content to. 
-    We need to know if we should access the global, constant or current memory segment. 
+    get_memory_segment method
+    Helper method to determine from which memory segment we should retreive content from or assign content to. The segment of a virtual address
+    is part of its entry in the address map, so global, constant and current memory segments are told apart without testing every range.
     '''
-    def check_for_global_segment(self, virtual_address: int) -> bool:
-        if ((virtual_address >= VirtualMemory.global_int_range[0] and virtual_address <= VirtualMemory.global_int_range[1])
-            or (virtual_address >= VirtualMemory.global_float_range[0] and virtual_address <= VirtualMemory.global_float_range[1])
-            or (virtual_address >= VirtualMemory.global_char_range[0] and virtual_address <= VirtualMemory.global_char_range[1])
-            or (virtual_address >= VirtualMemory.global_bool_range[0] and virtual_address <= VirtualMemory.global_bool_range[1])):
-            return True
-    
-    def check_for_constant_segment(self, virtual_address: int) -> bool:
-        if ((virtual_address >= VirtualMemory.constant_int_range[0] and virtual_address <= VirtualMemory.constant_int_range[1])
-            or (virtual_address >= VirtualMemory.constant_float_range[0] and virtual_address <= VirtualMemory.constant_float_range[1])
-            or (virtual_address >= VirtualMemory.constant_char_range[0] and virtual_address <= VirtualMemory.constant_char_range[1])
-            or (virtual_address >= VirtualMemory.constant_bool_range[0] and virtual_address <= VirtualMemory.constant_bool_range[1])
-            or (virtual_address >= VirtualMemory.constant_string_range[0] and virtual_address <= VirtualMemory.constant_string_range[1])):
-            return True
+    def get_memory_segment(self, virtual_address: int) -> MemorySegment:
+        segment = lookup_address(virtual_address)[0]
+        if segment == GLOBAL_SEGMENT:
+            return self.global_memory_segment
+        elif segment == CONSTANT_SEGMENT:
+            return self.constant_memory_segment
+        else:
+            return self.current_mem_segment
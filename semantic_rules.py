@@ -1,4 +1,7 @@
+import math
+import operator
 from collections import deque
+from typing import Any, Union
 
 from quadruple import  Quadruple
 from semantic_cube import SemanticCube, types, operations
@@ -8,6 +11,26 @@ from func_dir import FuncDir
 
 sem_cube = SemanticCube()
 
+# Operations applied to constant operands at compile time. They match the operations the virtual machine applies at runtime
+constant_operations = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '&&': lambda left, right: left and right,
+    '||': lambda left, right: left or right,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+}
+
+# Boolean constants are kept on the constants table by their literal
+bool_literals = {True: 'true', False: 'false'}
+bool_values = {'true': True, 'false': False}
+
 class CompilationResults:
     def __init__(self, func_dir: FuncDir, consts_table: ConstVarsTable, quadruples: list[Quadruple]) -> None:
         self.func_dir : FuncDir = func_dir
@@ -83,6 +106,10 @@ class SemanticRules:
                 self.current_var_table.add_entry(name=name, type=self.current_type, is_array=is_array, dim1=dim1, dim2=dim2, total_size=total_size, is_global_entry=True)
             else:
                 self.current_var_table.add_entry(name=name, type=self.current_type, is_array=is_array, dim1=dim1, dim2=dim2, total_size=total_size, is_global_entry=False)
+            if is_array:
+                # Array regions are remembered on the function directory, since vars tables are released once the scope is compiled
+                (_, entry) = self.current_var_table.lookup_entry(name)
+                self.function_directory.add_array(self.current_scopeID, entry.address, total_size)
             self.current_scope_var_count += total_size
         self.store_number_of_local_variables()
 
@@ -108,7 +135,7 @@ class SemanticRules:
 
     def add_constant_operand(self, operand, type):
         # First, check if the constant has already been defined, since we can reuse it
-        (is_defined, constant) = self.const_vars_table.lookup_entry(operand)
+        (is_defined, constant) = self.const_vars_table.lookup_entry(operand, type)
         if is_defined:
             self.operands_stack.append(constant.address)
             self.types_stack.append(constant.type)
@@ -127,6 +154,11 @@ class SemanticRules:
         else:
             right_operand = self.operands_stack.pop()
             left_operand = self.operands_stack.pop()
+            folded_constant = self.fold_constant_operation(curr_operator, left_operand, right_operand, match_types)
+            if folded_constant is not None:
+                # Operations between constants are evaluated now, so they need neither a quadruple nor a temporal
+                self.add_constant_operand(folded_constant, match_types)
+                return
             temp_result = virtual_memory.assign_mem_address(match_types, is_temp=True)
             quadruple = Quadruple(curr_operator, left_operand, right_operand, temp_result)
             self.append_quad(quadruple)
@@ -134,6 +166,30 @@ class SemanticRules:
             self.operands_stack.append(temp_result)
             self.function_directory.increment_scope_num_temp_vars(self.current_scopeID, match_types)
 
+    '''
+    fold_constant_operation method
+    Evaluates an operation whose operands are both constants, and returns the constants table literal of its result. Returns None when the
+    operation has to be left for runtime: integer division, division by zero, and results whose value does not match the type given by the
+    semantic cube.
+    '''
+    def fold_constant_operation(self, curr_operator: str, left_operand: int, right_operand: int, result_type: str) -> Union[Any, None]:
+        (left_is_constant, left_literal) = self.const_vars_table.lookup_address(left_operand)
+        (right_is_constant, right_literal) = self.const_vars_table.lookup_address(right_operand)
+        if not left_is_constant or not right_is_constant or curr_operator not in constant_operations:
+            return None
+        left_value = bool_values.get(left_literal, left_literal) if isinstance(left_literal, str) else left_literal
+        right_value = bool_values.get(right_literal, right_literal) if isinstance(right_literal, str) else right_literal
+        if curr_operator == '/' and (result_type == types['int'] or right_value == 0):
+            return None
+        result = constant_operations[curr_operator](left_value, right_value)
+        if result_type == types['bool'] and isinstance(result, bool):
+            return bool_literals[result]
+        if result_type == types['int'] and isinstance(result, int) and not isinstance(result, bool):
+            return result
+        if result_type == types['float'] and isinstance(result, float) and math.isfinite(result):
+            return result
+        return None
+
     def gen_assignment_quad(self):
         assignment_operand_type = self.types_stack.pop()
         assign_result_type = self.types_stack.pop()
@@ -153,6 +209,11 @@ class SemanticRules:
         if operand_type != types['bool']:
             raise Exception('Type Mismatch. \'!\' operator expects boolean type')
         operand = self.operands_stack.pop()
+        (is_constant, literal) = self.const_vars_table.lookup_address(operand)
+        if is_constant:
+            # Negating a boolean literal gives the other boolean literal
+            self.add_constant_operand(bool_literals[not bool_values[literal]], operand_type)
+            return
         temp_result = virtual_memory.assign_mem_address(operand_type, is_temp=True)
         quadruple = Quadruple(not_operator, operand, result= temp_result)
         self.append_quad(quadruple)
@@ -267,6 +328,8 @@ class SemanticRules:
                 self.set_scope('global')
                 self.current_var_table.add_entry(name, self.current_type, is_global_entry=True)
                 self.function_directory.increment_scope_num_vars('global', 1, self.current_type)
+                (_, return_entry) = self.current_var_table.lookup_entry(name)
+                self.function_directory.set_return_address(name, return_entry.address)
             # Change the current scope, and therefore current var table
             self.set_scope(name)
             self.current_param_count = self.current_scope_var_count =  self.current_temp_count = 0
@@ -367,17 +430,8 @@ class SemanticRules:
         if self.call_param_ptr != types[argument_type]:
             raise Exception(f'Type mismatch. \n Parameter {self.current_call_param_counter} of function {self.current_call_scopeID} is of type {self.call_param_ptr} and is being passed an expression of type {argument_type}')
         else:
-            # Reverse engineer the virtual address that was given to the parameter on its local var table
-            # This will make generating an activation record with the params a whole lot easier
             current_call_scope = self.function_directory.get_scope(self.current_call_scopeID)
-            curent_param_type_indicator = current_call_scope.params_list[self.current_call_param_counter]
-            param_vaddr = self.current_call_param_counter
-            if curent_param_type_indicator == 'i':
-                param_vaddr += virtual_memory.local_int_range[0]
-            elif curent_param_type_indicator == 'f':
-                param_vaddr += virtual_memory.local_float_range[0]
-            elif curent_param_type_indicator == 'c':
-                param_vaddr += virtual_memory.local_char_range[0]
+            param_vaddr = current_call_scope.get_param_address(self.current_call_param_counter)
             param_quad = Quadruple('parameter', argument, 'param' + str(self.current_call_param_counter), result=param_vaddr)
             self.append_quad(param_quad)
             self.current_call_param_counter += 1
@@ -496,14 +550,16 @@ class SemanticRules:
         elif array.total_dim_size != len(expression_stack):
             raise Exception(f'Too many expressions being assigned to array {array_id}')
         else:
+            values_to_assign = []
             while len(expression_stack) > 0:
                 (expression_to_assign, expression_type) = expression_stack.pop()
                 match_types = sem_cube.match_types(array.type, expression_type, '=')
                 if match_types == 'ERROR':
                     raise Exception(f'Type mismatch. Attempting to assign \'{expression_to_assign}\' expression to array \'{array_id}\' of type \'{array.type}\'')
-                assign_quad = Quadruple('=', expression_to_assign, result=array_address)
-                self.append_quad(assign_quad)
-                array_address += 1
+                values_to_assign.append(expression_to_assign)
+            # The whole array is assigned by a single quadruple, from its first element on
+            array_init_quad = Quadruple('array_init', values_to_assign, result=array_address)
+            self.append_quad(array_init_quad)
         
     # Special function semantic rules
     def gen_start_quad(self):
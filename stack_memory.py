@@ -0,0 +1,210 @@
+from typing import Any, Union
+from func_dir import FuncDir, FuncDirEntry
+from linker import LinkedQuadruple, operation_names
+from quadruple import address_operands
+from runtime_memory import RuntimeMemory, ArrayRegions, FrameLayout, TypedArray, decode_address, relink_array_elements, ARRAY_ELEMENT, FRAME_STORES_START, GLOBAL_INT, TEMP_POINTER
+from vars_table import ConstVarsTable
+
+# Store of the handles that address a slot of the current frame by its offset from the frame pointer. Temp pointers keep their own store, since the
+# slot they address holds a virtual address that is followed during execution
+FRAME_SLOT = FRAME_STORES_START
+
+'''
+StackFrameLayout class
+Offset from the frame pointer where every frame store of a function starts. The frames of a function are laid out as its locals followed by its
+temporals and pointers, in the order of their store identifiers.
+'''
+class StackFrameLayout():
+    __slots__ = ('size', 'offsets', 'empty_frame')
+
+    def __init__(self, scope: FuncDirEntry) -> None:
+        sizes = FrameLayout(scope).sizes
+        self.offsets : list[int] = [sum(sizes[:store]) for store in range(len(sizes))]
+        self.size : int = sum(sizes)
+        self.empty_frame : list[None] = [None] * self.size
+
+    def get_offset(self, handle: tuple[int, int]) -> int:
+        (store, index) = handle
+        return self.offsets[store - FRAME_STORES_START] + index
+
+'''
+StackMemory class
+Alternative runtime memory that keeps the frames of every active function in a single growable list of values. The current frame starts at the
+frame pointer, and every frame handle is re-linked once into the offset of its slot, so calls only move the frame pointer and the top of the stack
+instead of building memory segments. Global and constant stores are the same ones a RuntimeMemory has.
+'''
+class StackMemory():
+    __slots__ = ('stores', 'global_array_regions', 'values', 'frame_layouts', 'main_layout', 'frame_pointer', 'layout', 'stack_top', 'pending_frames', 'saved_frame_pointers', 'saved_layouts')
+
+    def __init__(self, consts_table: ConstVarsTable, func_dir: FuncDir) -> None:
+        # Global and constant stores are built exactly as in the segmented runtime memory, including the typed buffers of global arrays. Local arrays
+        # are kept on the stack with the rest of their frame
+        segmented_memory = RuntimeMemory(consts_table, func_dir)
+        self.stores : list[Union[list, None]] = segmented_memory.stores[:FRAME_STORES_START]
+        self.global_array_regions : list[ArrayRegions] = segmented_memory.array_regions[:FRAME_STORES_START]
+        self.frame_layouts : dict[str, StackFrameLayout] = {scopeID: StackFrameLayout(scope) for (scopeID, scope) in func_dir.get_func_dir().items() if scopeID != 'global'}
+        self.main_layout = self.frame_layouts.pop('main')
+        # The frame of main is the first one on the stack
+        self.values : list[Any] = list(self.main_layout.empty_frame)
+        self.frame_pointer = 0
+        self.layout = self.main_layout
+        self.stack_top = self.main_layout.size
+        # (frame pointer, layout) of the frames reserved by era whose gosub did not run yet. Arguments may call other functions in between
+        self.pending_frames : list[tuple[int, StackFrameLayout]] = []
+        self.saved_frame_pointers : list[int] = []
+        self.saved_layouts : list[StackFrameLayout] = []
+
+    '''
+    relink_quadruples method
+    Translates the frame handles of every quadruple into slot offsets of the frame of the function it belongs to. Parameters are written into the
+    frame of the function being called, which is the one of the last era that has not been called yet. Elements of global int and float arrays
+    addressed directly are relinked as in the segmented runtime memory.
+    '''
+    def relink_quadruples(self, quadruples: list[LinkedQuadruple], func_dir: FuncDir) -> list[LinkedQuadruple]:
+        quadruples = relink_array_elements(quadruples, func_dir, range(GLOBAL_INT, FRAME_STORES_START))
+        starts = {scope.starts_at: scopeID for (scopeID, scope) in func_dir.get_func_dir().items() if scopeID != 'global' and scope.starts_at >= 0}
+        layout = self.main_layout
+        called_layouts = []
+        relinked = []
+        for (ip, quadruple) in enumerate(quadruples):
+            if ip in starts:
+                layout = self.main_layout if starts[ip] == 'main' else self.frame_layouts[starts[ip]]
+            operation = operation_names[quadruple.op_code]
+            if operation == 'era':
+                called_layouts.append(self.frame_layouts[quadruple.result])
+            elif operation == 'gosub' and called_layouts:
+                called_layouts.pop()
+            fields = {}
+            for field in ('operator1', 'operator2', 'result'):
+                operand = getattr(quadruple, field)
+                if field in address_operands[operation]:
+                    operand_layout = called_layouts[-1] if operation == 'parameter' and field == 'result' else layout
+                    operand = self.relink_operand(operand, operand_layout)
+                fields[field] = operand
+            relinked.append(LinkedQuadruple(quadruple.op_code, fields['operator1'], fields['operator2'], fields['result']))
+        return relinked
+
+    def relink_operand(self, operand: Any, layout: StackFrameLayout) -> Any:
+        if isinstance(operand, list):
+            return [self.relink_operand(handle, layout) for handle in operand]
+        (store, _) = operand
+        if store < FRAME_STORES_START or store == ARRAY_ELEMENT:
+            return operand
+        return (TEMP_POINTER if store == TEMP_POINTER else FRAME_SLOT, layout.get_offset(operand))
+
+    # The slot of the stack a temp pointer points to. Pointers hold virtual addresses, which are only decoded during execution
+    def follow_pointer(self, offset: int) -> tuple[int, int]:
+        (store, index) = decode_address(self.values[self.frame_pointer + offset])
+        if store < FRAME_STORES_START:
+            return (store, index)
+        return (FRAME_SLOT, self.layout.get_offset((store, index)))
+
+    # The typed array that holds the element of a global array a handle addresses and the offset of the element, or None when it is not one
+    def find_array_element(self, handle: tuple[int, int]) -> tuple[Union[TypedArray, None], int]:
+        (store, index) = handle
+        if store < FRAME_STORES_START:
+            return self.global_array_regions[store].find(index)
+        return (None, index)
+
+    def retrieve_from_handle(self, handle: tuple[int, int]) -> Any:
+        (store, index) = handle
+        if store == FRAME_SLOT:
+            value = self.values[self.frame_pointer + index]
+        elif store >= TEMP_POINTER:
+            handle = index if store == ARRAY_ELEMENT else self.follow_pointer(index)
+            (typed_array, offset) = self.find_array_element(handle)
+            if typed_array is not None:
+                return typed_array.load(offset)
+            return self.retrieve_from_handle(handle)
+        else:
+            value = self.stores[store][index]
+        if value is None:
+            raise RuntimeError('Cannot use uninitialized variable.')
+        return value
+
+    def assign_to_handle(self, handle: tuple[int, int], value: Any) -> None:
+        (store, index) = handle
+        if store >= TEMP_POINTER:
+            handle = index if store == ARRAY_ELEMENT else self.follow_pointer(index)
+            (typed_array, offset) = self.find_array_element(handle)
+            if typed_array is not None:
+                typed_array.store(offset, value)
+                return
+            (store, index) = handle
+        if store == FRAME_SLOT:
+            self.values[self.frame_pointer + index] = value
+        else:
+            self.stores[store][index] = value
+
+    def assign_block(self, handle: tuple[int, int], values: tuple) -> None:
+        (store, index) = handle
+        if store == ARRAY_ELEMENT:
+            (typed_array, offset) = self.find_array_element(index)
+            typed_array.store_block(offset, values)
+        elif store == FRAME_SLOT:
+            start = self.frame_pointer + index
+            self.values[start:start + len(values)] = values
+        else:
+            self.stores[store][index:index + len(values)] = values
+
+    def retrieve_element(self, handle: tuple[int, int], offset: int) -> Any:
+        (store, index) = handle
+        if store == ARRAY_ELEMENT:
+            (typed_array, start) = self.find_array_element(index)
+            return typed_array.load(start + offset)
+        if store == FRAME_SLOT:
+            value = self.values[self.frame_pointer + index + offset]
+        else:
+            value = self.stores[store][index + offset]
+        if value is None:
+            raise RuntimeError('Cannot use uninitialized variable.')
+        return value
+
+    def assign_element(self, handle: tuple[int, int], offset: int, value: Any) -> None:
+        (store, index) = handle
+        if store == ARRAY_ELEMENT:
+            (typed_array, start) = self.find_array_element(index)
+            typed_array.store(start + offset, value)
+        elif store == FRAME_SLOT:
+            self.values[self.frame_pointer + index + offset] = value
+        else:
+            self.stores[store][index + offset] = value
+
+    def assign_address_to_handle(self, handle: tuple[int, int], virtual_address: int) -> None:
+        self.values[self.frame_pointer + handle[1]] = virtual_address
+
+    def assign_parameter(self, handle: tuple[int, int], value: Any) -> None:
+        self.values[self.pending_frames[-1][0] + handle[1]] = value
+
+    # Values of the parameters of the frame of the function being called, given by their frame handles before relinking
+    def retrieve_parameters(self, handles: list[tuple[int, int]]) -> tuple:
+        (frame_pointer, layout) = self.pending_frames[-1]
+        return tuple(self.values[frame_pointer + layout.get_offset(handle)] for handle in handles)
+
+    # Releases the frame reserved for a call that is skipped
+    def discard_activation_record(self) -> None:
+        (frame_pointer, _) = self.pending_frames.pop()
+        self.stack_top = frame_pointer
+
+    '''
+    The following methods keep the names used by the segmented runtime memory, so both can be used by the same backends. A new frame is reserved on
+    top of the stack and cleared, becomes the current frame when the function is called, and is released by moving the top of the stack back.
+    '''
+    def create_mem_segment(self, layout: StackFrameLayout) -> None:
+        frame_pointer = self.stack_top
+        self.stack_top += layout.size
+        if self.stack_top > len(self.values):
+            self.values.extend(layout.empty_frame)
+        # Slots of a released frame keep their old values until they are cleared, so variables of a new frame are uninitialized
+        self.values[frame_pointer:self.stack_top] = layout.empty_frame
+        self.pending_frames.append((frame_pointer, layout))
+
+    def sleep_current_memory(self) -> None:
+        self.saved_frame_pointers.append(self.frame_pointer)
+        self.saved_layouts.append(self.layout)
+        (self.frame_pointer, self.layout) = self.pending_frames.pop()
+
+    def destroy_current_mem_segment(self) -> None:
+        self.stack_top = self.frame_pointer
+        self.frame_pointer = self.saved_frame_pointers.pop()
+        self.layout = self.saved_layouts.pop()
@@ -0,0 +1,23 @@
+// ALi
+// Program to check that an index decreasing past the start of its array keeps its bounds check
+
+func main(){
+
+    var arr[5] : array<int>;
+    var i : int;
+
+    void func start() {
+
+        arr = [1, 2, 3, 4, 5];
+        i = 4;
+        while( i >= -1 ){
+            print(arr[i], " ");
+            i = i - 1;
+        }
+        quitGame();
+    }
+
+    void func update() {
+        // The update is not used for this test
+    }
+}
@@ -0,0 +1,28 @@
+// ALi
+// Program to check that a global index changed by a called function inside a loop keeps its bounds check
+
+var i : int;
+
+void func skipAhead() {
+    i = i + 3;
+}
+
+func main(){
+
+    var arr[5] : array<int>;
+
+    void func start() {
+
+        arr = [1, 2, 3, 4, 5];
+        for( i = 0; i < 5; i = i+1 ){
+            print(arr[i], " ");
+            skipAhead();
+            print(arr[i], " ");
+        }
+        quitGame();
+    }
+
+    void func update() {
+        // The update is not used for this test
+    }
+}
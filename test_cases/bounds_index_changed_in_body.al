@@ -0,0 +1,23 @@
+// ALi
+// Program to check that an index changed inside the body of its loop keeps its bounds check
+
+func main(){
+
+    var arr[5] : array<int>;
+    var i : int;
+
+    void func start() {
+
+        arr = [1, 2, 3, 4, 5];
+        for( i = 0; i < 5; i = i+1 ){
+            print(arr[i], " ");
+            i = i + 1;
+            print(arr[i], " ");
+        }
+        quitGame();
+    }
+
+    void func update() {
+        // The update is not used for this test
+    }
+}
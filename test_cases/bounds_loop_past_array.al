@@ -0,0 +1,21 @@
+// ALi
+// Program to check that a loop whose bound is larger than its array keeps the bounds check of its last iteration
+
+func main(){
+
+    var arr[5] : array<int>;
+    var i : int;
+
+    void func start() {
+
+        for( i = 0; i <= 5; i = i+1 ){
+            arr[i] = i * 2;
+            print(arr[i], " ");
+        }
+        quitGame();
+    }
+
+    void func update() {
+        // The update is not used for this test
+    }
+}
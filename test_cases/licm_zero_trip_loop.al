@@ -0,0 +1,28 @@
+// ALi
+// Program to check that a loop that never runs does not evaluate its invariant division, even when it is hoisted out of the loop
+
+func main(){
+
+    var i, n, z, total : int;
+
+    void func start() {
+
+        n = 0;
+        z = 0;
+        total = 0;
+        for( i = 0; i < n; i = i+1 ){
+            total = total + 10 / z;
+        }
+        print("total = ", total) << endl;
+        for( i = 0; i < 3; i = i+1 ){
+            n = 12;
+            total = total + n / 4;
+        }
+        print("total = ", total);
+        quitGame();
+    }
+
+    void func update() {
+        // The update is not used for this test
+    }
+}
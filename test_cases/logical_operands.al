@@ -0,0 +1,24 @@
+// ALi
+// Program to check that both operands of a logical operation are evaluated, so the right one raises its errors even when the left one decides the result
+
+func main(){
+
+    var a : bool;
+    var z : int;
+
+    void func start() {
+
+        a = false;
+        z = 0;
+        if (a && 10 / z > 1) {
+            print("yes");
+        } else {
+            print("no");
+        }
+        quitGame();
+    }
+
+    void func update() {
+        // The update is not used for this test
+    }
+}
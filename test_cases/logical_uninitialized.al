@@ -0,0 +1,22 @@
+// ALi
+// Program to check that reading an uninitialized variable on the right of a logical operation is an error, even when the left one decides the result
+
+func main(){
+
+    var a, b : bool;
+
+    void func start() {
+
+        a = true;
+        if (a || b) {
+            print("yes");
+        } else {
+            print("no");
+        }
+        quitGame();
+    }
+
+    void func update() {
+        // The update is not used for this test
+    }
+}
@@ -0,0 +1,39 @@
+// ALi
+// Program to check that a function that reads a global is not memoized, and that repeated expressions are computed again after their operands change
+
+var scale : int;
+
+int func scaled(n : int){
+    return n * scale;
+}
+
+int func square(n : int){
+    return n * n;
+}
+
+func main(){
+
+    var a, b, c, d, e : int;
+
+    void func start() {
+
+        scale = 2;
+        d = scaled(5);
+        e = square(4);
+        print(d, " ", e) << endl;
+        scale = 3;
+        d = scaled(5);
+        e = square(4);
+        print(d, " ", e) << endl;
+        a = 7;
+        b = a * a + 1;
+        a = 8;
+        c = a * a + 1;
+        print(b, " ", c);
+        quitGame();
+    }
+
+    void func update() {
+        // The update is not used for this test
+    }
+}
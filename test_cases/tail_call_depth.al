@@ -0,0 +1,26 @@
+// ALi
+// Program to check that a tail recursive function far deeper than the default Python call stack returns the same value with and without tail-call
+// elimination
+
+int func countDown(n : int, total : int){
+    if (n == 0) {
+        return total;
+    }
+    return countDown(n - 1, total + 2);
+}
+
+func main(){
+
+    var total : int;
+
+    void func start() {
+
+        total = countDown(50000, 0);
+        print(total);
+        quitGame();
+    }
+
+    void func update() {
+        // The update is not used for this test
+    }
+}
@@ -0,0 +1,615 @@
+import re
+import sys
+from typing import Any, Union
+
+from func_dir import FuncDirEntry
+from game_engine import convert_string_to_rgb_tuple, create_game_engine
+from linker import LinkedProgram, LinkedQuadruple, operation_names
+from runtime_memory import (GLOBAL_INT, GLOBAL_FLOAT, GLOBAL_CHAR, GLOBAL_BOOL, CONSTANT_INT, CONSTANT_STRING, LOCAL_INT, LOCAL_FLOAT, LOCAL_CHAR,
+    LOCAL_BOOL, TEMP_INT, TEMP_FLOAT, TEMP_CHAR, TEMP_BOOL, TEMP_POINTER, RuntimeMemory, decode_address)
+
+# Transpiled functions can recurse as deep as the interpreters, whose call stack is only bounded by memory
+RECURSION_LIMIT = 100000
+
+# Prefix of the Python names given to the variables of every store
+store_prefixes = {
+    GLOBAL_INT: 'g_int',
+    GLOBAL_FLOAT: 'g_float',
+    GLOBAL_CHAR: 'g_char',
+    GLOBAL_BOOL: 'g_bool',
+    LOCAL_INT: 'l_int',
+    LOCAL_FLOAT: 'l_float',
+    LOCAL_CHAR: 'l_char',
+    LOCAL_BOOL: 'l_bool',
+    TEMP_INT: 't_int',
+    TEMP_FLOAT: 't_float',
+    TEMP_CHAR: 't_char',
+    TEMP_BOOL: 't_bool',
+    TEMP_POINTER: 'p',
+}
+
+# Prefixes of the names of scalar variables, the only names a transpiled program reads before assigning them
+variable_prefixes = tuple(f'{prefix}_' for (store, prefix) in store_prefixes.items() if store != TEMP_POINTER)
+
+# Python operator for every binary quadruple operation
+binary_operators = {
+    '+': '+',
+    '-': '-',
+    '*': '*',
+    '/': '/',
+    '&&': 'and',
+    '||': 'or',
+    '==': '==',
+    '!=': '!=',
+    '>': '>',
+    '<': '<',
+    '>=': '>=',
+    '<=': '<=',
+}
+
+# Helper of the logical operations. The interpreters read both operands before combining them, so the right operand of a Python and or or, which
+# is skipped when the left one decides the result, would skip the errors its inlined expression raises
+logical_functions = {
+    '&&': 'logical_and',
+    '||': 'logical_or',
+}
+
+# Comparison under which every fused compare and branch operation does not jump
+fused_fall_comparisons = {
+    'jlt': '>=',
+    'jle': '>',
+    'jgt': '<=',
+    'jge': '<',
+    'jeq': '!=',
+    'jne': '==',
+}
+
+# Operations that jump to their result depending on their operands
+conditional_jumps = {'gotot', 'gotof'} | set(fused_fall_comparisons)
+
+# Quadruple fields whose values are read by each operation
+operand_reads = {
+    '!': ('operator1',),
+    '=': ('operator1',),
+    'print': ('result',),
+    'gotot': ('operator1',),
+    'gotof': ('operator1',),
+    'parameter': ('operator1',),
+    'return': ('operator1',),
+    'verify': ('operator1',),
+    'add_base_address': ('operator2',),
+    'multiply_displacement': ('operator1',),
+    'array_init': ('operator1',),
+    'load_idx': ('operator1',),
+    'store_idx': ('operator1', 'result'),
+    'gen_canvas': ('operator1', 'operator2', 'result'),
+    'set_canvas_title': ('result',),
+    'set_canvas_background': ('result',),
+    'draw_game_object': ('operator1', 'operator2', 'result'),
+}
+operand_reads.update({operation: ('operator1', 'operator2') for operation in list(binary_operators) + list(fused_fall_comparisons)})
+
+# Operations that store a value computed from their operands alone into their result
+pure_operations = set(binary_operators) | {'!', '=', 'multiply_displacement'}
+
+# Operations that store into their result field
+result_writes = pure_operations | {'return', 'add_base_address', 'load_idx', 'get_window_width', 'get_window_height', 'get_game_event'}
+
+'''
+StructureError class
+Raised when the jumps of a function do not match the loops and conditionals the compiler generates, so they cannot be rebuilt as Python statements.
+'''
+class StructureError(Exception):
+    pass
+
+'''
+HaltProgram class
+Raised by quitGame, or when the game engine ends the game loop, to unwind every transpiled function call at once.
+'''
+class HaltProgram(Exception):
+    pass
+
+def uninitialized_variable() -> None:
+    raise RuntimeError('Cannot use uninitialized variable.')
+
+def index_out_of_bounds(index_to_verify: int, lower_bound: int, upper_bound: int) -> None:
+    raise Exception(f'Index \'{index_to_verify}\' out of bounds. Expected index to be in range \'{lower_bound} - {upper_bound}\'')
+
+def logical_and(left: bool, right: bool) -> bool:
+    return left and right
+
+def logical_or(left: bool, right: bool) -> bool:
+    return left or right
+
+def quit_game() -> None:
+    print('\nGame has been ended by the user.')
+    raise HaltProgram()
+
+def end_game_loop() -> None:
+    raise HaltProgram()
+
+def read_handles(quadruple: LinkedQuadruple) -> list[tuple[int, int]]:
+    handles = []
+    for field in operand_reads.get(operation_names[quadruple.op_code], ()):
+        operand = getattr(quadruple, field)
+        if isinstance(operand, list):
+            handles.extend(operand)
+        else:
+            handles.append(operand)
+    return handles
+
+'''
+FunctionTranspiler class
+Generates the Python function for the quadruples of a single ALi function, from its first quadruple up to its endfunc (or endprogram for main).
+Locals, temporals and pointers become Python locals, arrays become Python lists and constants are written as literals. Loops and conditionals are
+rebuilt from the goto and gotof quadruples the compiler generates. If the jumps of the function do not follow that shape, the function is generated
+as a loop that dispatches on the label of its next basic block instead.
+'''
+class FunctionTranspiler():
+    def __init__(self, program: 'PythonTranspiler', scopeID: str, scope: FuncDirEntry, start: int, end: int) -> None:
+        self.program = program
+        self.quadruples = program.quadruples
+        self.scopeID = scopeID
+        self.scope = scope
+        self.start = start
+        self.end = end
+        self.lines : list[str] = []
+        self.indent = 1
+        self.global_writes : set[str] = set()
+        self.arguments : list[list[str]] = []
+        self.argument_count = 0
+        # (header, exit) of every loop being generated, the innermost last
+        self.loops : list[tuple[int, int]] = []
+        self.local_arrays = program.array_regions(scope)
+        self.arrays : dict[int, list[tuple[int, int, str]]] = {**program.global_arrays, **self.local_arrays}
+        self.analyze()
+
+    '''
+    analyze method
+    Finds the jump targets and loops of the function, the array every pointer temporal points into and the temporals that can be generated as
+    part of the expression that reads them.
+    '''
+    def analyze(self) -> None:
+        self.jump_targets = set()
+        self.back_edges : dict[int, int] = {}
+        pointer_arrays : dict[int, set[str]] = {}
+        reads : dict[tuple[int, int], list[int]] = {}
+        writes : dict[tuple[int, int], list[int]] = {}
+        for ip in range(self.start, self.end):
+            quadruple = self.quadruples[ip]
+            operation = operation_names[quadruple.op_code]
+            if operation == 'goto' or operation in conditional_jumps:
+                self.jump_targets.add(quadruple.result)
+                # The last jump backwards to a quadruple closes the loop that starts on it
+                if operation == 'goto' and quadruple.result <= ip:
+                    self.back_edges[quadruple.result] = ip
+            elif operation == 'add_base_address':
+                (array_name, _) = self.array_element(decode_address(quadruple.operator1))
+                pointer_arrays.setdefault(quadruple.result[1], set()).add(array_name)
+            for handle in read_handles(quadruple):
+                reads.setdefault(handle, []).append(ip)
+            if operation in result_writes:
+                writes.setdefault(quadruple.result, []).append(ip)
+        # A pointer always loaded with addresses of the same array is generated as an index into it
+        self.pointer_arrays = {pointer: next(iter(names)) if len(names) == 1 else None for (pointer, names) in pointer_arrays.items()}
+        # A temporal written and then read only by the next quadruple is generated inline as part of the expression of that quadruple
+        self.inlined_temps : dict[tuple[int, int], int] = {}
+        for (handle, write_ips) in writes.items():
+            if handle[0] < TEMP_INT or handle[0] > TEMP_BOOL or len(write_ips) != 1 or len(reads.get(handle, ())) != 1:
+                continue
+            write_ip = write_ips[0]
+            if reads[handle][0] == write_ip + 1 and write_ip + 1 not in self.jump_targets \
+                    and operation_names[self.quadruples[write_ip].op_code] in pure_operations:
+                self.inlined_temps[handle] = write_ip
+        self.inlined_quadruples = set(self.inlined_temps.values())
+
+    def transpile(self) -> list[str]:
+        try:
+            self.emit_block(self.start, self.end)
+        except StructureError:
+            self.lines = []
+            self.loops = []
+            self.indent = 1
+            self.emit_dispatch_loop()
+        name = 'main' if self.scopeID == 'main' else f'f_{self.scopeID}'
+        params = [self.location(self.frame_handle(decode_address(self.scope.get_param_address(index))))[0] for index in range(len(self.scope.params_list))]
+        header = [f'def {name}({", ".join(params)}):']
+        if self.global_writes:
+            header.append(f'    global {", ".join(sorted(self.global_writes))}')
+        for regions in self.local_arrays.values():
+            for (_, size, array_name) in regions:
+                header.append(f'    {array_name} = [None] * {size}')
+        return header + self.lines + ['']
+
+    # Parameters are always copied into the frame of the called function, even when their address was computed outside of the local ranges
+    def frame_handle(self, handle: tuple[int, int]) -> tuple[int, int]:
+        (store, index) = handle
+        if store < CONSTANT_INT:
+            return (store + LOCAL_INT, index)
+        return handle
+
+    def emit(self, line: str) -> None:
+        self.lines.append('    ' * self.indent + line)
+
+    def array_element(self, handle: tuple[int, int]) -> tuple[str, int]:
+        (store, index) = handle
+        for (array_start, array_size, array_name) in self.arrays.get(store, ()):
+            if index >= array_start and index < array_start + array_size:
+                return (array_name, index - array_start)
+        raise RuntimeError(f'Array base address \'{handle}\' does not belong to a declared array')
+
+    '''
+    location method
+    Returns the Python expression that stores the operand with the given handle, and whether that expression is a list element.
+    '''
+    def location(self, handle: tuple[int, int]) -> tuple[str, bool]:
+        (store, index) = handle
+        if store == TEMP_POINTER:
+            array_name = self.pointer_arrays.get(index) or f'p_{index}_array'
+            return (f'{array_name}[p_{index}]', True)
+        for (array_start, array_size, array_name) in self.arrays.get(store, ()):
+            if index >= array_start and index < array_start + array_size:
+                return (f'{array_name}[{index - array_start}]', True)
+        return (f'{store_prefixes[store]}_{index}', False)
+
+    def read(self, handle: tuple[int, int]) -> str:
+        (store, _) = handle
+        if store >= CONSTANT_INT and store <= CONSTANT_STRING:
+            return repr(self.program.constant_value(handle))
+        if handle in self.inlined_temps:
+            return self.expression(self.quadruples[self.inlined_temps[handle]])
+        (location, is_element) = self.location(handle)
+        if is_element:
+            # Scalars that were never assigned raise when read, list elements have to be checked
+            return f'(_v if (_v := {location}) is not None else uninitialized_variable())'
+        return location
+
+    def write(self, handle: tuple[int, int], value: str) -> None:
+        (location, is_element) = self.location(handle)
+        if handle[0] < CONSTANT_INT and not is_element:
+            self.global_writes.add(location)
+        self.emit(f'{location} = {value}')
+
+    def expression(self, quadruple: LinkedQuadruple) -> str:
+        operation = operation_names[quadruple.op_code]
+        if operation in logical_functions:
+            return f'{logical_functions[operation]}({self.read(quadruple.operator1)}, {self.read(quadruple.operator2)})'
+        elif operation in binary_operators:
+            return f'({self.read(quadruple.operator1)} {binary_operators[operation]} {self.read(quadruple.operator2)})'
+        elif operation == '!':
+            return f'(not {self.read(quadruple.operator1)})'
+        elif operation == 'multiply_displacement':
+            return f'({self.read(quadruple.operator1)} * {quadruple.operator2})'
+        return self.read(quadruple.operator1)
+
+    '''
+    emit_bounds_check method
+    Generates the check of an index against its bounds. Indexes that are not a name or a literal are stored into the given name first, so they are
+    only evaluated once. Returns the expression of the checked index.
+    '''
+    def emit_bounds_check(self, index_to_verify: str, lower_bound: int, upper_bound: int, index_name: str) -> str:
+        if not index_to_verify.isidentifier() and not index_to_verify.lstrip('-').isdigit():
+            self.emit(f'{index_name} = {index_to_verify}')
+            index_to_verify = index_name
+        self.emit(f'if not {lower_bound} <= {index_to_verify} < {upper_bound}:')
+        self.indent += 1
+        self.emit(f'index_out_of_bounds({index_to_verify}, {lower_bound}, {upper_bound})')
+        self.indent -= 1
+        return index_to_verify
+
+    '''
+    indexed_element method
+    Generates the bounds checks of the indexes of a load_idx or store_idx and returns the list element they address. The element list holds the
+    first element of the array followed by the indexes.
+    '''
+    def indexed_element(self, element: list[tuple[int, int]], indexing: tuple[tuple, Union[int, None]]) -> str:
+        (array_name, offset) = self.array_element(element[0])
+        (bounds, stride) = indexing
+        indexes = []
+        for (position, (handle, index_bounds)) in enumerate(zip(element[1:], bounds)):
+            index = self.read(handle)
+            if index_bounds is not None:
+                index = self.emit_bounds_check(index, *index_bounds, f'_index{position}')
+            indexes.append(index)
+        position = indexes[0] if stride is None else f'{indexes[0]} * {stride} + {indexes[1]}'
+        return f'{array_name}[{position}]' if offset == 0 else f'{array_name}[{offset} + {position}]'
+
+    '''
+    jump_conditions method
+    Returns the Python conditions under which a conditional jump is taken and under which it falls through to the next quadruple.
+    '''
+    def jump_conditions(self, quadruple: LinkedQuadruple) -> tuple[str, str]:
+        operation = operation_names[quadruple.op_code]
+        if operation in fused_fall_comparisons:
+            # Fused jumps come from a comparison followed by a gotof, so they are generated as that comparison being false
+            fall_condition = f'({self.read(quadruple.operator1)} {fused_fall_comparisons[operation]} {self.read(quadruple.operator2)})'
+            return (f'not {fall_condition}', fall_condition)
+        condition = self.read(quadruple.operator1)
+        # gotof jumps when its operand is false and gotot when it is true
+        if operation == 'gotof':
+            return (f'not {condition}', condition)
+        return (condition, f'not {condition}')
+
+    '''
+    emit_block method
+    Generates the quadruples in the [start, end) range as the body of a Python statement.
+    '''
+    def emit_block(self, start: int, end: int) -> None:
+        first_line = len(self.lines)
+        self.emit_range(start, end)
+        if len(self.lines) == first_line:
+            self.emit('pass')
+
+    def emit_range(self, start: int, end: int) -> None:
+        ip = start
+        while ip < end:
+            back_edge = self.back_edges.get(ip)
+            if back_edge is not None and all(header != ip for (header, _) in self.loops):
+                if back_edge >= end:
+                    raise StructureError()
+                self.emit('while True:')
+                loop_line = len(self.lines) - 1
+                self.loops.append((ip, back_edge + 1))
+                self.indent += 1
+                self.emit_block(ip, back_edge)
+                # A loop that starts by leaving when its condition is false is a while loop over that condition
+                body_indent = '    ' * self.indent
+                if len(self.lines) > loop_line + 3 and self.lines[loop_line + 1].startswith(body_indent + 'if not ') \
+                        and self.lines[loop_line + 2] == body_indent + '    break':
+                    self.lines[loop_line] = '    ' * (self.indent - 1) + f'while {self.lines[loop_line + 1][len(body_indent) + 7:-1]}:'
+                    del self.lines[loop_line + 1:loop_line + 3]
+                self.indent -= 1
+                self.loops.pop()
+                ip = back_edge + 1
+            else:
+                ip = self.emit_statement(ip, end)
+
+    def emit_statement(self, ip: int, end: int) -> int:
+        quadruple = self.quadruples[ip]
+        operation = operation_names[quadruple.op_code]
+        if operation == 'goto':
+            if quadruple.result == ip + 1:
+                return ip + 1
+            if self.loops and quadruple.result == self.loops[-1][1]:
+                self.emit('break')
+            elif self.loops and quadruple.result == self.loops[-1][0]:
+                self.emit('continue')
+            else:
+                raise StructureError()
+            return ip + 1
+        if operation in conditional_jumps:
+            (jump_condition, fall_condition) = self.jump_conditions(quadruple)
+            target = quadruple.result
+            if self.loops and target in self.loops[-1]:
+                self.emit(f'if {jump_condition}:')
+                self.indent += 1
+                self.emit('break' if target == self.loops[-1][1] else 'continue')
+                self.indent -= 1
+                return ip + 1
+            if target <= ip or target > end:
+                raise StructureError()
+            # A goto over the quadruples that follow the jump target closes the then part of an if with an else part
+            last_then = self.quadruples[target - 1]
+            has_else = target - 1 > ip and operation_names[last_then.op_code] == 'goto' and last_then.result > target and last_then.result <= end
+            self.emit(f'if {fall_condition}:')
+            self.indent += 1
+            self.emit_block(ip + 1, target - 1 if has_else else target)
+            self.indent -= 1
+            if not has_else:
+                return target
+            self.emit('else:')
+            self.indent += 1
+            self.emit_block(target, last_then.result)
+            self.indent -= 1
+            return last_then.result
+        self.emit_quadruple(ip)
+        return ip + 1
+
+    '''
+    emit_dispatch_loop method
+    Fallback for functions whose jumps cannot be rebuilt as loops and conditionals. Every basic block becomes a branch of a loop that dispatches
+    on the label of the block to execute next.
+    '''
+    def emit_dispatch_loop(self) -> None:
+        leaders = {self.start} | {target for target in self.jump_targets if target >= self.start and target < self.end}
+        for ip in range(self.start, self.end):
+            operation = operation_names[self.quadruples[ip].op_code]
+            if (operation in conditional_jumps or operation in ('goto', 'endfunc', 'endprogram', 'quit_game')) and ip + 1 < self.end:
+                leaders.add(ip + 1)
+        leaders = sorted(leaders)
+        self.emit(f'_label = {self.start}')
+        self.emit('while True:')
+        self.indent += 1
+        for (position, leader) in enumerate(leaders):
+            block_end = leaders[position + 1] if position + 1 < len(leaders) else self.end
+            self.emit(f'{"if" if position == 0 else "elif"} _label == {leader}:')
+            self.indent += 1
+            for ip in range(leader, block_end):
+                self.emit_block_quadruple(ip, block_end)
+            self.indent -= 1
+        self.indent -= 1
+
+    def emit_block_quadruple(self, ip: int, block_end: int) -> None:
+        quadruple = self.quadruples[ip]
+        operation = operation_names[quadruple.op_code]
+        if operation == 'goto':
+            self.emit(f'_label = {quadruple.result}')
+        elif operation in conditional_jumps:
+            (jump_condition, _) = self.jump_conditions(quadruple)
+            self.emit(f'_label = {quadruple.result} if {jump_condition} else {ip + 1}')
+        else:
+            self.emit_quadruple(ip)
+            if ip + 1 == block_end and operation not in ('endfunc', 'endprogram'):
+                self.emit(f'_label = {ip + 1}')
+
+    '''
+    emit_quadruple method
+    Generates the statement of a quadruple that does not jump.
+    '''
+    def emit_quadruple(self, ip: int) -> None:
+        if ip in self.inlined_quadruples:
+            return
+        quadruple = self.quadruples[ip]
+        operation = operation_names[quadruple.op_code]
+        if operation in pure_operations:
+            expression = self.expression(quadruple)
+            self.write(quadruple.result, expression[1:-1] if expression.startswith('(') and operation != '=' else expression)
+        elif operation == 'return':
+            self.write(quadruple.result, self.read(quadruple.operator1))
+        elif operation == 'print':
+            self.emit(f'print({self.read(quadruple.result)}, end=\'\')')
+        elif operation == 'endprint':
+            self.emit('print()')
+        elif operation == 'era':
+            self.arguments.append([])
+        elif operation == 'parameter':
+            argument = self.read(quadruple.operator1)
+            if quadruple.operator1[0] < CONSTANT_INT or quadruple.operator1[0] > CONSTANT_STRING:
+                # Arguments are copied when they are evaluated, as the ones that follow may call functions that change them
+                argument_name = f'_arg{self.argument_count}'
+                self.argument_count += 1
+                self.emit(f'{argument_name} = {argument}')
+                argument = argument_name
+            self.arguments[-1].append(argument)
+        elif operation == 'gosub':
+            self.emit(f'f_{quadruple.operator1}({", ".join(self.arguments.pop())})')
+        elif operation in ('endfunc', 'endprogram'):
+            self.emit('return')
+        elif operation == 'verify':
+            self.emit_bounds_check(self.read(quadruple.operator1), quadruple.operator2, quadruple.result, '_index')
+        elif operation == 'load_idx':
+            element = self.indexed_element(quadruple.operator1, quadruple.operator2)
+            self.write(quadruple.result, f'(_v if (_v := {element}) is not None else uninitialized_variable())')
+        elif operation == 'store_idx':
+            element = self.indexed_element(quadruple.result, quadruple.operator2)
+            self.emit(f'{element} = {self.read(quadruple.operator1)}')
+        elif operation == 'add_base_address':
+            (array_name, offset) = self.array_element(decode_address(quadruple.operator1))
+            pointer = quadruple.result[1]
+            displacement = self.read(quadruple.operator2)
+            self.emit(f'p_{pointer} = {displacement}' if offset == 0 else f'p_{pointer} = {offset} + {displacement}')
+            if self.pointer_arrays[pointer] is None:
+                self.emit(f'p_{pointer}_array = {array_name}')
+        elif operation == 'array_init':
+            (array_name, offset) = self.array_element(quadruple.result)
+            values = [self.read(handle) for handle in quadruple.operator1]
+            # A tuple of constants is built once, when the generated module is compiled
+            self.emit(f'{array_name}[{offset}:{offset + len(values)}] = ({", ".join(values)},)')
+        elif operation == 'start':
+            self.emit('_engine.start()')
+        elif operation == 'update':
+            self.emit('if not _engine.update():')
+            self.indent += 1
+            self.emit('end_game_loop()')
+            self.indent -= 1
+        elif operation == 'gen_default_canvas':
+            self.emit(f'_engine.generate_canvas({quadruple.operator1!r}, {quadruple.operator2!r}, {quadruple.result!r})')
+        elif operation == 'gen_canvas':
+            self.emit(f'_engine.generate_canvas({self.read(quadruple.operator1)}, {self.read(quadruple.operator2)}, _rgb({self.read(quadruple.result)}))')
+        elif operation == 'set_canvas_title':
+            self.emit(f'_engine.set_canvas_title({self.read(quadruple.result)})')
+        elif operation == 'set_canvas_background':
+            self.emit(f'_engine.set_canvas_background(_rgb({self.read(quadruple.result)}))')
+        elif operation == 'get_window_width':
+            self.write(quadruple.result, '_engine.get_window_width()')
+        elif operation == 'get_window_height':
+            self.write(quadruple.result, '_engine.get_window_height()')
+        elif operation == 'get_game_event':
+            self.emit('_key = _engine.get_game_event()')
+            self.emit('if _key is not None:')
+            self.indent += 1
+            self.write(quadruple.result, '_key')
+            self.indent -= 1
+        elif operation == 'draw_game_object':
+            color = f'_rgb({self.read(quadruple.result)})'
+            positions = [self.read(handle) for handle in quadruple.operator1 + quadruple.operator2]
+            self.emit(f'_engine.draw_game_object({", ".join(positions)}, {color})')
+        elif operation == 'quit_game':
+            self.emit('quit_game()')
+        else:
+            raise RuntimeError(f'Unknown action for transpiler \'{operation}\'')
+
+'''
+PythonTranspiler class
+Translates a linked ALi program into the source of a Python module with one Python function per ALi function. Calls to ALi functions become Python
+calls, so the Python interpreter keeps the activation records instead of the memory segments of the virtual machine.
+'''
+class PythonTranspiler():
+    def __init__(self, linked_program: LinkedProgram) -> None:
+        self.quadruples : list[LinkedQuadruple] = linked_program.quadruples
+        self.func_dir = linked_program.func_dir
+        # Constants are taken from the same stores the interpreters load them from, so literals hold exactly the same values
+        self.constant_stores = RuntimeMemory(linked_program.consts_table, linked_program.func_dir).stores
+        self.global_arrays = self.array_regions(self.func_dir.get_scope('global'))
+
+    def constant_value(self, handle: tuple[int, int]) -> Any:
+        (store, index) = handle
+        return self.constant_stores[store][index]
+
+    '''
+    array_regions method
+    Groups the arrays of a scope by store, as (first index, size, Python name) regions.
+    '''
+    def array_regions(self, scope: FuncDirEntry) -> dict[int, list[tuple[int, int, str]]]:
+        regions = {}
+        for (address, size) in scope.arrays:
+            (store, index) = decode_address(address)
+            regions.setdefault(store, []).append((index, size, f'{store_prefixes[store]}_array_{index}'))
+        return regions
+
+    def transpile(self) -> str:
+        lines = ['# Python module generated by the ALi transpiler', '']
+        for regions in self.global_arrays.values():
+            for (_, size, array_name) in regions:
+                lines.append(f'{array_name} = [None] * {size}')
+        # Functions are compiled one after the other, and each of them ends where the next one starts
+        scopes = sorted(((scope.starts_at, scopeID, scope) for (scopeID, scope) in self.func_dir.get_func_dir().items() if scopeID != 'global' and scope.starts_at >= 0), key=lambda entry: entry[0])
+        for (position, (starts_at, scopeID, scope)) in enumerate(scopes):
+            ends_at = scopes[position + 1][0] if position + 1 < len(scopes) else len(self.quadruples)
+            lines.append('')
+            lines.extend(FunctionTranspiler(self, scopeID, scope, starts_at, ends_at).transpile())
+        return '\n'.join(lines)
+
+'''
+TranspiledBackend class
+Execution backend that transpiles the linked program into Python, compiles it into Python bytecode once and runs it. The generated source is kept
+on the source attribute so that it can be dumped for inspection.
+'''
+class TranspiledBackend():
+    def __init__(self, linked_program: LinkedProgram, game_engine: Any = None) -> None:
+        self.source = PythonTranspiler(linked_program).transpile()
+        self.code = compile(self.source, '<ali transpiled program>', 'exec')
+        # The engine of headless runs is given by the caller. Otherwise it depends on the special functions the program uses
+        self.game_engine = game_engine if game_engine is not None else create_game_engine(linked_program.quadruples)
+        # Transpiled programs do not execute quadruples one by one, so there is no count to report
+        self.quads_executed = None
+        # Transpiled functions are called as Python functions, which are not memoized
+        self.memo_caches = {}
+
+    def run(self) -> None:
+        namespace = {
+            '_engine': self.game_engine,
+            '_rgb': convert_string_to_rgb_tuple,
+            'uninitialized_variable': uninitialized_variable,
+            'index_out_of_bounds': index_out_of_bounds,
+            'logical_and': logical_and,
+            'logical_or': logical_or,
+            'quit_game': quit_game,
+            'end_game_loop': end_game_loop,
+        }
+        exec(self.code, namespace)
+        sys.setrecursionlimit(max(sys.getrecursionlimit(), RECURSION_LIMIT))
+        print('--ALi CONSOLE OUTPUT--')
+        try:
+            namespace['main']()
+        except HaltProgram:
+            pass
+        except NameError as error:
+            # Scalars are Python variables, which are unbound until the program assigns them. Any other name is an error of the transpiler itself
+            name = re.search(r"'(\w+)'", str(error))
+            if name is None or not name.group(1).startswith(variable_prefixes):
+                raise
+            raise RuntimeError('Cannot use uninitialized variable.') from None
+        except RecursionError:
+            raise RuntimeError(f'Recursion deeper than {RECURSION_LIMIT} calls is not supported by the python backend.') from None
+        print('\n--END OF ALi CONSOLE OUTPUT--')
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Any, Union
 from semantic_cube import types
 from virtual_memory import virtual_memory
 
@@ -53,32 +53,44 @@ class ConstVarsTable():
         # Our first constants will be boolean literals true and false
         address1 = virtual_memory.assign_mem_address(types['bool'], is_const=True)
         address2 = virtual_memory.assign_mem_address(types['bool'], is_const=True)
+        # Constants are keyed by value and type, since equal values of different types (such as 1 and 1.0) are different constants
         self.const_vars_table = {
-            'true': VarsTableEntry(types['bool'], address1),
-            'false': VarsTableEntry(types['bool'], address2)
+            ('true', types['bool']): VarsTableEntry(types['bool'], address1),
+            ('false', types['bool']): VarsTableEntry(types['bool'], address2)
+        }
+        # Value of the constant stored on every address
+        self.const_values = {
+            address1: 'true',
+            address2: 'false',
         }
     def __str__(self) -> str:
         return str(self.const_vars_table)
 
-    def add_entry(self, name: str, type: str) -> int:
+    def add_entry(self, name: Any, type: str) -> int:
         if type == 'string':
             address = virtual_memory.assign_constant_address_string()
-            self.const_vars_table[name] = VarsTableEntry('string', address)
+            self.const_vars_table[(name, type)] = VarsTableEntry('string', address)
         else:
             if type not in types:
                 raise Exception(f'Unknown type used {type}')
-            if name in self.const_vars_table:
+            if (name, type) in self.const_vars_table:
                 raise Exception(f'Redeclaration of identifier {name} is not allowed')
             address = virtual_memory.assign_mem_address(types[type], is_const=True)
-            self.const_vars_table[name] = VarsTableEntry(types[type], address)
+            self.const_vars_table[(name, type)] = VarsTableEntry(types[type], address)
+        self.const_values[address] = name
         # Increase the types counter
         self.types_counter[type] += 1
         return address
 
-    def lookup_entry(self, name: str) -> tuple[bool, Union[VarsTableEntry, None]]:
-        if name not in self.const_vars_table:
+    def lookup_entry(self, name: Any, type: str) -> tuple[bool, Union[VarsTableEntry, None]]:
+        if (name, type) not in self.const_vars_table:
+            return (False, None)
+        return (True, self.const_vars_table[(name, type)])
+
+    def lookup_address(self, address: int) -> tuple[bool, Any]:
+        if address not in self.const_values:
             return (False, None)
-        return (True, self.const_vars_table[name])
+        return (True, self.const_values[address])
     
     def __repr__(self) -> str:
         return str(self.const_vars_table | self.types_counter)
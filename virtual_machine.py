@@ -0,0 +1,410 @@
+import operator
+from collections import OrderedDict, deque
+from typing import Any, Callable, Union
+
+from game_engine import convert_string_to_rgb_tuple, create_game_engine
+from func_dir import FuncDir
+from linker import LinkedProgram, LinkedQuadruple, link
+from quadruple import quadruple_operations
+from runtime_memory import RuntimeMemory, decode_address, CONSTANT_INT, CONSTANT_STRING
+from semantic_rules import CompilationResults
+
+# Instruction pointer value returned by a handler to stop the execution loop
+HALT = -1
+
+# Number of results of every pure function that are kept before the least recently used one is dropped
+MEMO_CACHE_SIZE = 4096
+
+'''
+MemoCache class
+Bounded LRU cache of the values returned by a pure function, keyed by the values of its arguments. It also keeps the handles of the parameters of
+the function and of the global variable its returned value is stored in, and counts its hits and misses.
+'''
+class MemoCache():
+    def __init__(self, param_handles: list[tuple[int, int]], return_handle: tuple[int, int], size: int = MEMO_CACHE_SIZE) -> None:
+        self.param_handles = param_handles
+        self.return_handle = return_handle
+        self.size = size
+        self.results : OrderedDict[tuple, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    # Returns whether the arguments are cached, along with the cached value
+    def lookup(self, arguments: tuple) -> tuple[bool, Any]:
+        if arguments in self.results:
+            self.hits += 1
+            self.results.move_to_end(arguments)
+            return (True, self.results[arguments])
+        self.misses += 1
+        return (False, None)
+
+    def store(self, arguments: tuple, value: Any) -> None:
+        self.results[arguments] = value
+        if len(self.results) > self.size:
+            self.results.popitem(last=False)
+
+'''
+build_memo_caches function
+Creates a memo cache for every function marked as pure on the function directory.
+'''
+def build_memo_caches(func_dir: FuncDir) -> dict[str, MemoCache]:
+    memo_caches = {}
+    for (scopeID, scope) in func_dir.get_func_dir().items():
+        if not scope.is_pure or scope.starts_at < 0:
+            continue
+        param_handles = [decode_address(scope.get_param_address(param_index)) for param_index in range(len(scope.params_list))]
+        memo_caches[scopeID] = MemoCache(param_handles, decode_address(scope.return_address))
+    return memo_caches
+
+'''
+build_constant_blocks function
+Array initializers that only assign constants store the same values every time they run, so their values are read once into a tuple when the
+program is loaded. Returns that block of values for the index of every such array_init quadruple.
+'''
+def build_constant_blocks(quadruples: list[LinkedQuadruple], runtime_memory: Any) -> dict[int, tuple]:
+    array_init = quadruple_operations['array_init']
+    constant_blocks = {}
+    for (ip, quadruple) in enumerate(quadruples):
+        if quadruple.op_code == array_init and all(store >= CONSTANT_INT and store <= CONSTANT_STRING for (store, _) in quadruple.operator1):
+            constant_blocks[ip] = tuple(runtime_memory.retrieve_from_handle(handle) for handle in quadruple.operator1)
+    return constant_blocks
+
+'''
+check_index function
+Returns an index of a load_idx or store_idx, once it is checked to be inside its (lower, upper) bounds. Indexes proven to be inside them have no bounds.
+'''
+def check_index(index_to_verify: int, bounds: Union[tuple[int, int], None]) -> int:
+    if bounds is None or (index_to_verify >= bounds[0] and index_to_verify < bounds[1]):
+        return index_to_verify
+    raise Exception(f'Index \'{index_to_verify}\' out of bounds. Expected index to be in range \'{bounds[0]} - {bounds[1]}\'')
+
+'''
+VirtualMachine class
+Executes linked ALi code. Instead of testing the op code of every quadruple against each known operation, the virtual machine keeps a dispatch table
+that is indexed directly by op code. Every handler receives the current quadruple and instruction pointer and returns the next instruction pointer,
+so every operation costs a single list index no matter where it was declared in quadruple.py.
+'''
+class VirtualMachine():
+    def __init__(self, linked_program: LinkedProgram, memory_model: type = RuntimeMemory, game_engine: Any = None) -> None:
+        self.func_dir = linked_program.func_dir
+        # Runtime memory is initialized here, using the constants table and the function directory to build out the constant and global memory segments
+        self.runtime_memory = memory_model(linked_program.consts_table, linked_program.func_dir)
+        self.quadruples : list[LinkedQuadruple] = self.runtime_memory.relink_quadruples(linked_program.quadruples, linked_program.func_dir)
+        self.constant_blocks : dict[int, tuple] = build_constant_blocks(self.quadruples, self.runtime_memory)
+        self.call_stack = deque()
+        self.memo_caches : dict[str, MemoCache] = build_memo_caches(linked_program.func_dir)
+        # (memo cache, arguments, call stack depth) of every call to a pure function that missed its cache and has not ended yet
+        self.pending_results : list[tuple[MemoCache, tuple, int]] = []
+        # The engine of headless runs is given by the caller. Otherwise it depends on the special functions the program uses
+        self.game_engine = game_engine if game_engine is not None else create_game_engine(self.quadruples)
+        self.quads_executed = 0
+        self.dispatch_table : list[Callable[[LinkedQuadruple, int], int]] = self.build_dispatch_table()
+
+    '''
+    build_dispatch_table method
+    Builds a dense list with one handler per op code. Op codes without a handler raise an error when executed.
+    '''
+    def build_dispatch_table(self) -> list[Callable[[LinkedQuadruple, int], int]]:
+        handlers = {
+            'endprogram': self.end_program,
+            '+': self.binary_operation(operator.add),
+            '-': self.binary_operation(operator.sub),
+            '*': self.binary_operation(operator.mul),
+            '/': self.binary_operation(operator.truediv),
+            '&&': self.binary_operation(lambda left, right: left and right),
+            '||': self.binary_operation(lambda left, right: left or right),
+            '==': self.binary_operation(operator.eq),
+            '!=': self.binary_operation(operator.ne),
+            '>': self.binary_operation(operator.gt),
+            '<': self.binary_operation(operator.lt),
+            '>=': self.binary_operation(operator.ge),
+            '<=': self.binary_operation(operator.le),
+            '=': self.assign,
+            '!': self.negate,
+            'print': self.print_value,
+            'endprint': self.end_print,
+            'goto': self.goto,
+            'gotot': self.goto_true,
+            'gotof': self.goto_false,
+            'gosub': self.memoized_gosub if self.memo_caches else self.gosub,
+            'era': self.era,
+            'parameter': self.parameter,
+            'endfunc': self.memoized_end_function if self.memo_caches else self.end_function,
+            'return': self.return_value,
+            'verify': self.verify,
+            'add_base_address': self.add_base_address,
+            'multiply_displacement': self.multiply_displacement,
+            'array_init': self.array_init,
+            'load_idx': self.load_indexed,
+            'store_idx': self.store_indexed,
+            'jlt': self.conditional_jump(operator.lt),
+            'jle': self.conditional_jump(operator.le),
+            'jgt': self.conditional_jump(operator.gt),
+            'jge': self.conditional_jump(operator.ge),
+            'jeq': self.conditional_jump(operator.eq),
+            'jne': self.conditional_jump(operator.ne),
+            # Special functions
+            'start': self.start,
+            'update': self.update,
+            'gen_default_canvas': self.gen_default_canvas,
+            'gen_canvas': self.gen_canvas,
+            'set_canvas_title': self.set_canvas_title,
+            'set_canvas_background': self.set_canvas_background,
+            'get_window_width': self.get_window_width,
+            'get_window_height': self.get_window_height,
+            'get_game_event': self.get_game_event,
+            'draw_game_object': self.draw_game_object,
+            'quit_game': self.quit_game,
+        }
+        dispatch_table = [self.unknown_operation] * (max(quadruple_operations.values()) + 1)
+        for operation, handler in handlers.items():
+            dispatch_table[quadruple_operations[operation]] = handler
+        return dispatch_table
+
+    def run(self) -> None:
+        # The loop variables are kept local to avoid attribute lookups for every executed quadruple
+        quadruples = self.quadruples
+        dispatch_table = self.dispatch_table
+        ip = 0
+        executed = 0
+        print('--ALi CONSOLE OUTPUT--')
+        while ip != HALT:
+            current_quad = quadruples[ip]
+            ip = dispatch_table[current_quad.op_code](current_quad, ip)
+            executed += 1
+        self.quads_executed = executed
+        print('\n--END OF ALi CONSOLE OUTPUT--')
+
+    def unknown_operation(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        raise RuntimeError('Unknown action for virtual machine')
+
+    def end_program(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        return HALT
+
+    '''
+    binary_operation method
+    Arithmetic, logical and relational quadruples only differ on the operation applied to their operands, so their handlers are generated from a function
+    that receives the left and right operands.
+    '''
+    def binary_operation(self, operation: Callable) -> Callable[[LinkedQuadruple, int], int]:
+        retrieve = self.runtime_memory.retrieve_from_handle
+        assign = self.runtime_memory.assign_to_handle
+        def handler(current_quad: LinkedQuadruple, ip: int) -> int:
+            left_operand = retrieve(current_quad.operator1)
+            right_operand = retrieve(current_quad.operator2)
+            assign(current_quad.result, operation(left_operand, right_operand))
+            return ip + 1
+        return handler
+
+    def assign(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        result = self.runtime_memory.retrieve_from_handle(current_quad.operator1)
+        self.runtime_memory.assign_to_handle(current_quad.result, result)
+        return ip + 1
+
+    def negate(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        result = self.runtime_memory.retrieve_from_handle(current_quad.operator1)
+        self.runtime_memory.assign_to_handle(current_quad.result, not result)
+        return ip + 1
+
+    def print_value(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        print_content = self.runtime_memory.retrieve_from_handle(current_quad.result)
+        print(print_content, end='')
+        return ip + 1
+
+    def end_print(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        print()
+        return ip + 1
+
+    def goto(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        return current_quad.result
+
+    def goto_true(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        true_test = self.runtime_memory.retrieve_from_handle(current_quad.operator1)
+        if true_test:
+            return current_quad.result
+        return ip + 1
+
+    def goto_false(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        false_test = self.runtime_memory.retrieve_from_handle(current_quad.operator1)
+        if false_test == False:
+            return current_quad.result
+        return ip + 1
+
+    '''
+    conditional_jump method
+    Generates the handler of a fused compare and branch quadruple, which jumps to its result when the comparison of its operators holds.
+    '''
+    def conditional_jump(self, comparison: Callable) -> Callable[[LinkedQuadruple, int], int]:
+        retrieve = self.runtime_memory.retrieve_from_handle
+        def handler(current_quad: LinkedQuadruple, ip: int) -> int:
+            if comparison(retrieve(current_quad.operator1), retrieve(current_quad.operator2)):
+                return current_quad.result
+            return ip + 1
+        return handler
+
+    def gosub(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        self.call_stack.append(ip+1)
+        self.runtime_memory.sleep_current_memory()
+        return current_quad.result
+
+    def era(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        self.runtime_memory.create_mem_segment(self.runtime_memory.frame_layouts[current_quad.result])
+        return ip + 1
+
+    def parameter(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        # We need to specifically access the current memory to retrieve the values and copy them to our activation record before it is set as the current memory
+        copy_value = self.runtime_memory.retrieve_from_handle(current_quad.operator1)
+        self.runtime_memory.assign_parameter(current_quad.result, copy_value)
+        return ip + 1
+
+    def end_function(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        self.runtime_memory.destroy_current_mem_segment()
+        return self.call_stack.pop()
+
+    '''
+    memoized_gosub method
+    Calls to pure functions look up the values of their arguments, which are already on the activation record, in the cache of the function. On a hit
+    the activation record is discarded and the cached value is stored as the value returned by the call, which is skipped. On a miss the function is
+    called as usual, and its returned value is cached when it ends.
+    '''
+    def memoized_gosub(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        memo_cache = self.memo_caches.get(current_quad.operator1)
+        if memo_cache is None:
+            return self.gosub(current_quad, ip)
+        arguments = self.runtime_memory.retrieve_parameters(memo_cache.param_handles)
+        (is_cached, value) = memo_cache.lookup(arguments)
+        if is_cached:
+            self.runtime_memory.discard_activation_record()
+            self.runtime_memory.assign_to_handle(memo_cache.return_handle, value)
+            return ip + 1
+        self.call_stack.append(ip + 1)
+        self.pending_results.append((memo_cache, arguments, len(self.call_stack)))
+        self.runtime_memory.sleep_current_memory()
+        return current_quad.result
+
+    def memoized_end_function(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        pending_results = self.pending_results
+        if pending_results and pending_results[-1][2] == len(self.call_stack):
+            (memo_cache, arguments, _) = pending_results.pop()
+            memo_cache.store(arguments, self.runtime_memory.retrieve_from_handle(memo_cache.return_handle))
+        return self.end_function(current_quad, ip)
+
+    def return_value(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        result = self.runtime_memory.retrieve_from_handle(current_quad.operator1)
+        self.runtime_memory.assign_to_handle(current_quad.result, result)
+        return ip + 1
+
+    def verify(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        index_to_verify = self.runtime_memory.retrieve_from_handle(current_quad.operator1)
+        lower_bound = current_quad.operator2
+        upper_bound = current_quad.result
+        if index_to_verify >= lower_bound and index_to_verify < upper_bound:
+            return ip + 1
+        raise Exception(f'Index \'{index_to_verify}\' out of bounds. Expected index to be in range \'{lower_bound} - {upper_bound}\'')
+
+    def add_base_address(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        base_address = current_quad.operator1
+        add_value = self.runtime_memory.retrieve_from_handle(current_quad.operator2)
+        self.runtime_memory.assign_address_to_handle(current_quad.result, base_address + add_value)
+        return ip + 1
+
+    def array_init(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        values = self.constant_blocks.get(ip)
+        if values is None:
+            values = tuple([self.runtime_memory.retrieve_from_handle(handle) for handle in current_quad.operator1])
+        self.runtime_memory.assign_block(current_quad.result, values)
+        return ip + 1
+
+    # Offset from the first element of the array of a load_idx or store_idx to the element its indexes address. The element list holds the array
+    # followed by its indexes, and the indexing holds the bounds of every index and the size of the rows of two-dimensional arrays
+    def element_offset(self, element: list[tuple[int, int]], indexing: tuple[tuple, Union[int, None]]) -> int:
+        (bounds, stride) = indexing
+        offset = check_index(self.runtime_memory.retrieve_from_handle(element[1]), bounds[0])
+        if stride is None:
+            return offset
+        return offset * stride + check_index(self.runtime_memory.retrieve_from_handle(element[2]), bounds[1])
+
+    def load_indexed(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        offset = self.element_offset(current_quad.operator1, current_quad.operator2)
+        self.runtime_memory.assign_to_handle(current_quad.result, self.runtime_memory.retrieve_element(current_quad.operator1[0], offset))
+        return ip + 1
+
+    def store_indexed(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        offset = self.element_offset(current_quad.result, current_quad.operator2)
+        self.runtime_memory.assign_element(current_quad.result[0], offset, self.runtime_memory.retrieve_from_handle(current_quad.operator1))
+        return ip + 1
+
+    def multiply_displacement(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        index_expression = self.runtime_memory.retrieve_from_handle(current_quad.operator1)
+        mutiplier = current_quad.operator2
+        self.runtime_memory.assign_to_handle(current_quad.result, index_expression * mutiplier)
+        return ip + 1
+
+    # Special functions
+    def start(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        self.game_engine.start()
+        return ip + 1
+
+    def update(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        return ip + 1 if self.game_engine.update() else HALT
+
+    def gen_default_canvas(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        # current quad result should be a tuple that represents the rgb value
+        self.game_engine.generate_canvas(current_quad.operator1, current_quad.operator2, current_quad.result)
+        return ip + 1
+
+    def gen_canvas(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        width = self.runtime_memory.retrieve_from_handle(current_quad.operator1)
+        height = self.runtime_memory.retrieve_from_handle(current_quad.operator2)
+        color = self.runtime_memory.retrieve_from_handle(current_quad.result)
+        self.game_engine.generate_canvas(width, height, convert_string_to_rgb_tuple(color))
+        return ip + 1
+
+    def set_canvas_title(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        caption = self.runtime_memory.retrieve_from_handle(current_quad.result)
+        self.game_engine.set_canvas_title(caption)
+        return ip + 1
+
+    def set_canvas_background(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        color = self.runtime_memory.retrieve_from_handle(current_quad.result)
+        self.game_engine.set_canvas_background(convert_string_to_rgb_tuple(color))
+        return ip + 1
+
+    def get_window_width(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        self.runtime_memory.assign_to_handle(current_quad.result, self.game_engine.get_window_width())
+        return ip + 1
+
+    def get_window_height(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        self.runtime_memory.assign_to_handle(current_quad.result, self.game_engine.get_window_height())
+        return ip + 1
+
+    def get_game_event(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        key = self.game_engine.get_game_event()
+        if key is not None:
+            self.runtime_memory.assign_to_handle(current_quad.result, key)
+        return ip + 1
+
+    def draw_game_object(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        (xpos_handle, ypos_handle) = current_quad.operator1
+        (xsize_handle, ysize_handle) = current_quad.operator2
+        color = self.runtime_memory.retrieve_from_handle(current_quad.result)
+        rgb_color = convert_string_to_rgb_tuple(color)
+        xpos = self.runtime_memory.retrieve_from_handle(xpos_handle)
+        ypos = self.runtime_memory.retrieve_from_handle(ypos_handle)
+        xsize = self.runtime_memory.retrieve_from_handle(xsize_handle)
+        ysize = self.runtime_memory.retrieve_from_handle(ysize_handle)
+        self.game_engine.draw_game_object(xpos, ypos, xsize, ysize, rgb_color)
+        return ip + 1
+
+    def quit_game(self, current_quad: LinkedQuadruple, ip: int) -> int:
+        print('\nGame has been ended by the user.')
+        return HALT
+
+'''
+virtual_machine function
+Main function to execute ALi compiled code. Takes in compilation results given out by the semantic_rules.py module, links them and processes the list of quadruples.
+'''
+def virtual_machine(compilation_results: CompilationResults) -> VirtualMachine:
+    vm = VirtualMachine(link(compilation_results))
+    vm.run()
+    return vm